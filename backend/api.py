@@ -1,8 +1,11 @@
 from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import datetime
+import json
+import re
 import threading
 import logging
 
@@ -16,6 +19,13 @@ logger = logging.getLogger(__name__)
 from backend.pipeline import run_pipeline, PipelineResult
 from backend.config import load_config
 from backend.init_supabase import initialize_schema
+from backend.gis.district_history import lookup_districts_as_of
+from backend.gis.district_index import DistrictMatch, district_index_cache, notify_districts_changed
+from backend.gis.topology import (
+    MANIFEST_FILENAME as TOPOLOGY_MANIFEST,
+    MANIFEST_MAX_AGE as TOPOLOGY_MANIFEST_MAX_AGE,
+    artifacts_dir,
+)
 
 app = FastAPI(title="TheLobby Backend API")
 
@@ -27,6 +37,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Topology files are content-addressed, so they never change under a given name.
+TOPOLOGY_FILE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+TOPOLOGY_MANIFEST_CACHE_CONTROL = f"public, max-age={TOPOLOGY_MANIFEST_MAX_AGE}"
+TOPOLOGY_FILE_PATTERN = re.compile(r"^districts\.[a-z0-9]+\.[0-9a-f]{16}\.topo\.json$")
+
 # In-memory status tracking
 pipeline_status = {
     "status": "idle",
@@ -38,6 +53,14 @@ pipeline_status = {
 class SyncRequest(BaseModel):
     date: Optional[str] = None
 
+class DistrictPoint(BaseModel):
+    lat: float
+    lon: float
+
+class DistrictLookupRequest(BaseModel):
+    points: List[DistrictPoint]
+    as_of: Optional[datetime.date] = None
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "timestamp": datetime.datetime.now().isoformat()}
@@ -98,6 +121,82 @@ async def init_db():
             detail="An internal error occurred during database initialization."
         )
 
+def _district_payload(
+    point: DistrictPoint, match: DistrictMatch, as_of: Optional[datetime.date] = None
+) -> Dict[str, Any]:
+    payload = {
+        "lat": point.lat,
+        "lon": point.lon,
+        "senate_district": match.senate_district,
+        "assembly_district": match.assembly_district,
+    }
+    # Only the current roster is stored, so historical lookups carry no legislators.
+    if as_of is None:
+        payload["legislators"] = match.legislators
+    return payload
+
+def _district_index():
+    try:
+        return district_index_cache.get()
+    except Exception as e:
+        logger.error(f"District index load failed: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="District boundaries are not available.")
+
+def _lookup_points(points: List[DistrictPoint], as_of: Optional[datetime.date]) -> List[DistrictMatch]:
+    coords = [(point.lat, point.lon) for point in points]
+    if as_of is None:
+        return _district_index().lookup_many(coords)
+    try:
+        return lookup_districts_as_of(coords, as_of)
+    except Exception as e:
+        logger.error(f"District history load failed: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="District boundaries are not available.")
+
+@app.get("/districts/lookup")
+def lookup_district(lat: float, lon: float, as_of: Optional[datetime.date] = None):
+    point = DistrictPoint(lat=lat, lon=lon)
+    return _district_payload(point, _lookup_points([point], as_of)[0], as_of)
+
+@app.post("/districts/lookup")
+def lookup_districts(request: DistrictLookupRequest):
+    matches = _lookup_points(request.points, request.as_of)
+    return {
+        "results": [
+            _district_payload(point, match, request.as_of)
+            for point, match in zip(request.points, matches)
+        ]
+    }
+
+@app.post("/districts/reload")
+def reload_districts():
+    try:
+        # Drops the as-of history index too; it is rebuilt on its next lookup.
+        notify_districts_changed()
+        index = district_index_cache.get()
+    except Exception as e:
+        logger.error(f"District index reload failed: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="District boundaries are not available.")
+    return {"message": "District index reloaded", "districts": len(index)}
+
+@app.get("/districts/topology")
+def district_topology_manifest():
+    manifest_path = artifacts_dir(load_config().data_dir) / TOPOLOGY_MANIFEST
+    if not manifest_path.exists():
+        raise HTTPException(status_code=404, detail="District topology has not been generated yet.")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return JSONResponse(manifest, headers={"Cache-Control": TOPOLOGY_MANIFEST_CACHE_CONTROL})
+
+@app.get("/districts/topology/{filename}")
+def district_topology_file(filename: str):
+    path = artifacts_dir(load_config().data_dir) / filename
+    if not TOPOLOGY_FILE_PATTERN.match(filename) or not path.exists():
+        raise HTTPException(status_code=404, detail="Unknown district topology file.")
+    return FileResponse(
+        path,
+        media_type="application/json",
+        headers={"Cache-Control": TOPOLOGY_FILE_CACHE_CONTROL},
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
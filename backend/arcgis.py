@@ -1,42 +1,535 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import queue
+import time
 import urllib.parse
-import urllib.request
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 
+from backend.downloader import DEFAULT_MAX_WORKERS, fetch_url_bytes, stream_url_chunks
+from backend.fs import atomic_writer
+from backend.http_cache import HttpCache
+from backend.json_stream import JsonArrayStream
 
-def fetch_service_metadata(service_url: str) -> dict[str, Any]:
+
+LAYER_STATE_FILENAME = "layer_state.json"
+FEATURES_FILENAME = "features.ndjson"
+METADATA_FILENAME = "metadata.json"
+
+
+class ArcGISQueryError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class GeometryOptions:
+    """
+    Server-side generalization applied to feature queries.
+
+    max_allowable_offset is in output coordinate units (degrees for GeoJSON),
+    geometry_precision is the number of decimal places kept, and
+    quantization_tolerance snaps vertices to a grid of that cell size.
+    """
+
+    max_allowable_offset: float | None = None
+    geometry_precision: int | None = None
+    quantization_tolerance: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            value is not None
+            for value in (
+                self.max_allowable_offset,
+                self.geometry_precision,
+                self.quantization_tolerance,
+            )
+        )
+
+    def query_params(self) -> dict[str, str]:
+        params: dict[str, str] = {}
+        if self.max_allowable_offset is not None:
+            params["maxAllowableOffset"] = str(self.max_allowable_offset)
+        if self.geometry_precision is not None:
+            params["geometryPrecision"] = str(self.geometry_precision)
+        if self.quantization_tolerance is not None:
+            params["quantizationParameters"] = json.dumps(
+                {
+                    "mode": "view",
+                    "originPosition": "upperLeft",
+                    "tolerance": self.quantization_tolerance,
+                },
+                separators=(",", ":"),
+            )
+        return params
+
+
+def fetch_service_metadata(service_url: str, cache: HttpCache | None = None) -> dict[str, Any]:
     url = f"{service_url}?f=pjson"
-    with urllib.request.urlopen(url) as response:
-        return json.loads(response.read().decode("utf-8"))
-
-
-def fetch_all_features(service_url: str) -> dict[str, Any]:
-    metadata = fetch_service_metadata(service_url)
-    max_records = int(metadata.get("maxRecordCount", 2000))
-    features: list[dict[str, Any]] = []
-    offset = 0
-
-    while True:
-        query_params = {
-            "where": "1=1",
-            "outFields": "*",
-            "f": "geojson",
-            "resultOffset": offset,
-            "resultRecordCount": max_records,
-        }
-        query_url = f"{service_url}/query?{urllib.parse.urlencode(query_params)}"
-        with urllib.request.urlopen(query_url) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-        batch_features = payload.get("features", [])
-        features.extend(batch_features)
-
-        if len(batch_features) < max_records:
-            break
+    return json.loads(fetch_url_bytes(url, cache).decode("utf-8"))
+
+
+def _fetch_json(url: str, cache: HttpCache | None) -> dict[str, Any]:
+    return json.loads(fetch_url_bytes(url, cache).decode("utf-8"))
+
+
+def fetch_feature_count(service_url: str, cache: HttpCache | None = None) -> int:
+    query_params = {"where": "1=1", "returnCountOnly": "true", "f": "json"}
+    query_url = f"{service_url}/query?{urllib.parse.urlencode(query_params)}"
+    payload = _fetch_json(query_url, cache)
+    _raise_for_error(payload, "feature count")
+    if "count" not in payload:
+        raise ArcGISQueryError("ArcGIS feature count response has no count")
+    return int(payload["count"])
+
+
+def _raise_for_error(payload: dict[str, Any], what: str) -> None:
+    # ArcGIS reports query failures in the body of an HTTP 200 response.
+    error = payload.get("error")
+    if error is not None:
+        message = error.get("message") if isinstance(error, dict) else error
+        raise ArcGISQueryError(f"ArcGIS {what} query failed: {message}")
+
+
+def _iter_page(
+    service_url: str,
+    offset: int,
+    page_size: int,
+    order_by: str | None,
+    geometry_options: GeometryOptions | None,
+    cache: HttpCache | None,
+) -> Iterator[dict[str, Any]]:
+    query_params: dict[str, Any] = {
+        "where": "1=1",
+        "outFields": "*",
+        "f": "geojson",
+        "resultOffset": offset,
+        "resultRecordCount": page_size,
+    }
+    if order_by:
+        # Pages fetched concurrently must agree on one ordering or rows can repeat or vanish.
+        query_params["orderByFields"] = order_by
+    if geometry_options is not None:
+        query_params.update(geometry_options.query_params())
+    query_url = f"{service_url}/query?{urllib.parse.urlencode(query_params)}"
+    stream = JsonArrayStream(stream_url_chunks(query_url, cache), "features")
+    quantized = geometry_options is not None and geometry_options.quantization_tolerance is not None
+    # The transform normally precedes the features; quantized features that arrive
+    # before it are held back until it is known.
+    pending: list[dict[str, Any]] = []
+    for feature in stream:
+        transform = stream.members.get("transform")
+        if transform is None and quantized:
+            pending.append(feature)
+            continue
+        yield _dequantize_feature(feature, transform)
+    _raise_for_error(stream.members, f"page at offset {offset}")
+    transform = stream.members.get("transform")
+    for feature in pending:
+        yield _dequantize_feature(feature, transform)
+
+
+def _dequantize_feature(feature: dict[str, Any], transform: dict[str, Any] | None) -> dict[str, Any]:
+    if transform and feature.get("geometry"):
+        feature["geometry"] = dequantize_geometry(feature["geometry"], transform)
+    return feature
+
+
+_PAGE_END = object()
+
+
+def _stream_page(
+    service_url: str,
+    offset: int,
+    page_size: int,
+    order_by: str | None,
+    geometry_options: GeometryOptions | None,
+    cache: HttpCache | None,
+    sink: queue.SimpleQueue,
+) -> None:
+    # Features are handed over one by one, so the page being consumed streams
+    # through while later pages are still downloading.
+    try:
+        for feature in _iter_page(service_url, offset, page_size, order_by, geometry_options, cache):
+            sink.put(feature)
+    finally:
+        sink.put(_PAGE_END)
+
+
+def dequantize_geometry(geometry: dict[str, Any], transform: dict[str, Any]) -> dict[str, Any]:
+    """
+    Decodes a quantized GeoJSON polygon geometry back to real coordinates.
+
+    Quantized rings hold integer grid positions where the first vertex is absolute and
+    each following vertex is a delta from the previous one.
+    """
+    scale_x, scale_y = transform["scale"][:2]
+    translate_x, translate_y = transform["translate"][:2]
+    y_sign = -1 if transform.get("originPosition", "upperLeft") == "upperLeft" else 1
+
+    def decode_ring(ring: list[list[float]]) -> list[list[float]]:
+        decoded: list[list[float]] = []
+        grid_x = grid_y = 0
+        for position in ring:
+            grid_x += position[0]
+            grid_y += position[1]
+            decoded.append(
+                [translate_x + grid_x * scale_x, translate_y + y_sign * grid_y * scale_y]
+            )
+        return decoded
+
+    coordinates = geometry["coordinates"]
+    if geometry["type"] == "Polygon":
+        coordinates = [decode_ring(ring) for ring in coordinates]
+    elif geometry["type"] == "MultiPolygon":
+        coordinates = [[decode_ring(ring) for ring in polygon] for polygon in coordinates]
+    else:
+        raise ValueError(f"Unsupported quantized geometry type: {geometry['type']}")
+    return {**geometry, "coordinates": coordinates}
+
+
+def iter_features(
+    service_url: str,
+    cache: HttpCache | None = None,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    geometry_options: GeometryOptions | None = None,
+    metadata: dict[str, Any] | None = None,
+    page_size: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yields every feature of the layer as a GeoJSON feature, in offset order.
+
+    The feature count is requested first so all `resultOffset` pages can be fetched
+    concurrently on at most max_workers threads. Each page is decoded incrementally
+    as it streams in, and its features are yielded as they are decoded once every
+    earlier page has been, so consumers start before the first page completes.
+    geometry_options asks the server to generalize geometries before sending them.
+    page_size overrides the layer's maxRecordCount as the page length.
+
+    Raises ArcGISQueryError when a response carries an error body, when a page
+    other than the last comes back short, or when fewer features arrive than the
+    count announced, so an incomplete feature set is never mistaken for the layer.
+    """
+    if metadata is None:
+        metadata = fetch_service_metadata(service_url, cache)
+    max_records = page_size or int(metadata.get("maxRecordCount", 2000))
+    order_by = metadata.get("objectIdField")
+    total = fetch_feature_count(service_url, cache)
+    offsets = list(range(0, total, max_records))
+
+    sinks: list[queue.SimpleQueue] = [queue.SimpleQueue() for _ in offsets]
+    last_page_size = max_records
+    yielded = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(offsets) or 1))) as pool:
+        futures = [
+            pool.submit(
+                _stream_page,
+                service_url,
+                offset,
+                max_records,
+                order_by,
+                geometry_options,
+                cache,
+                sink,
+            )
+            for offset, sink in zip(offsets, sinks)
+        ]
+        try:
+            for offset, sink, future in zip(offsets, sinks, futures):
+                if last_page_size < max_records:
+                    raise ArcGISQueryError(
+                        f"ArcGIS page before offset {offset} returned {last_page_size} "
+                        f"of {max_records} features"
+                    )
+                last_page_size = 0
+                while (feature := sink.get()) is not _PAGE_END:
+                    last_page_size += 1
+                    yield feature
+                # Re-raises whatever cut the page short.
+                future.result()
+                yielded += last_page_size
+        finally:
+            for future in futures:
+                future.cancel()
+    # Features added after the count was taken land past the last page.
+    offset = len(offsets) * max_records
+    while last_page_size == max_records:
+        last_page_size = 0
+        for feature in _iter_page(
+            service_url, offset, max_records, order_by, geometry_options, cache
+        ):
+            last_page_size += 1
+            yield feature
+        yielded += last_page_size
         offset += max_records
+    if yielded < total:
+        raise ArcGISQueryError(f"ArcGIS layer returned {yielded} of {total} features")
 
+
+def fetch_all_features(
+    service_url: str,
+    cache: HttpCache | None = None,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    geometry_options: GeometryOptions | None = None,
+    metadata: dict[str, Any] | None = None,
+    page_size: int | None = None,
+) -> dict[str, Any]:
+    """
+    Fetches every feature of the layer (see iter_features) as a FeatureCollection
+    held in memory; fetch_features_if_edited streams them to disk instead.
+    """
     return {
         "type": "FeatureCollection",
-        "features": features,
+        "features": list(
+            iter_features(
+                service_url,
+                cache,
+                max_workers=max_workers,
+                geometry_options=geometry_options,
+                metadata=metadata,
+                page_size=page_size,
+            )
+        ),
     }
+
+
+@dataclass(frozen=True)
+class LayerState:
+    service_url: str
+    query: str
+    last_edit_date: int | None
+    features_sha256: str
+    fetched_at: float | None = None
+    # Feature hash last handed to each consumer, so unchanged is judged per consumer.
+    consumers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> LayerState | None:
+        try:
+            return cls(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def write(self, path: Path) -> None:
+        path.write_text(json.dumps(asdict(self), sort_keys=True), encoding="utf-8")
+
+
+@dataclass(frozen=True)
+class StoredFeatures:
+    """
+    A layer's features on disk, one JSON document per line in the form
+    feature_set_hash digests. Each iteration streams them back from the file.
+    """
+
+    path: Path
+    count: int
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+@dataclass(frozen=True)
+class LayerFeatures:
+    # Iterable of GeoJSON features; fetch_features_if_edited hands out StoredFeatures.
+    features: Iterable[dict[str, Any]]
+    unchanged: bool
+    metadata: dict[str, Any]
+    # Where the layer state lives and the hash to record once a consumer is done.
+    state_dir: Path | None = None
+    features_sha256: str | None = None
+
+
+def last_edit_date(metadata: dict[str, Any]) -> int | None:
+    value = (metadata.get("editingInfo") or {}).get("lastEditDate")
+    return int(value) if value is not None else None
+
+
+def _feature_line(feature: dict[str, Any]) -> bytes:
+    return json.dumps(feature, sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def feature_set_hash(features: Iterable[dict[str, Any]]) -> str:
+    digest = hashlib.sha256()
+    for feature in features:
+        digest.update(_feature_line(feature))
+    return digest.hexdigest()
+
+
+def _query_key(geometry_options: GeometryOptions | None) -> str:
+    return json.dumps(
+        geometry_options.query_params() if geometry_options else {}, sort_keys=True
+    )
+
+
+def layer_cache_dir(
+    root: Path, service_url: str, geometry_options: GeometryOptions | None = None
+) -> Path:
+    """
+    Directory under root holding fetch_features_if_edited state for one layer query.
+    Every consumer asking for the same layer with the same generalization resolves to
+    the same directory, so they share one download.
+    """
+    key = json.dumps([service_url.rstrip("/"), _query_key(geometry_options)])
+    return root / hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _store_features(features: Iterable[dict[str, Any]], path: Path) -> tuple[StoredFeatures, str]:
+    """
+    Writes features to path as they arrive, hashing the lines as they are written.
+    path is only replaced once every feature is in, so a failed fetch leaves the
+    previous set in place.
+    """
+    digest = hashlib.sha256()
+    count = 0
+    with atomic_writer(path) as f:
+        for feature in features:
+            line = _feature_line(feature)
+            digest.update(line)
+            f.write(line)
+            count += 1
+    return StoredFeatures(path, count), digest.hexdigest()
+
+
+def _load_stored(state_dir: Path, state: LayerState) -> tuple[StoredFeatures, dict[str, Any]] | None:
+    path = state_dir / FEATURES_FILENAME
+    # The stored lines are the bytes feature_set_hash digests, so they are checked
+    # against the recorded hash without decoding a single feature.
+    digest = hashlib.sha256()
+    count = 0
+    try:
+        metadata = json.loads((state_dir / METADATA_FILENAME).read_text(encoding="utf-8"))
+        with path.open("rb") as f:
+            for line in f:
+                digest.update(line)
+                count += 1
+    except (OSError, ValueError):
+        return None
+    if digest.hexdigest() != state.features_sha256:
+        return None
+    return StoredFeatures(path, count), metadata
+
+
+def fetch_features_if_edited(
+    service_url: str,
+    state_dir: Path,
+    cache: HttpCache | None = None,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    geometry_options: GeometryOptions | None = None,
+    page_size: int | None = None,
+    reuse_within: float | None = None,
+    consumer: str = "default",
+) -> LayerFeatures:
+    """
+    Fetches the layer's features unless its `editingInfo.lastEditDate` is unchanged.
+
+    state_dir keeps the last edit date, a hash of the feature set, the layer metadata
+    and the features themselves, written and hashed as they stream in. When the layer has not been edited since the stored
+    state the stored features are returned without querying the layer. unchanged is
+    set when the feature set matches the one consumer last passed to
+    mark_layer_consumed, which it should call once the features have been stored
+    downstream; a consumer that fails before then sees the features as changed again.
+
+    With reuse_within (seconds), state checked that recently is returned without any
+    request at all, so every consumer in one run window reads the same feature set.
+    """
+    state_dir.mkdir(parents=True, exist_ok=True)
+    state_path = state_dir / LAYER_STATE_FILENAME
+    query = _query_key(geometry_options)
+    previous = LayerState.load(state_path)
+    if previous is not None and (previous.service_url, previous.query) != (service_url, query):
+        previous = None
+
+    now = time.time()
+    if (
+        previous is not None
+        and reuse_within is not None
+        and previous.fetched_at is not None
+        and now - previous.fetched_at <= reuse_within
+    ):
+        stored = _load_stored(state_dir, previous)
+        if stored is not None:
+            return LayerFeatures(
+                features=stored[0],
+                unchanged=previous.consumers.get(consumer) == previous.features_sha256,
+                metadata=stored[1],
+                state_dir=state_dir,
+                features_sha256=previous.features_sha256,
+            )
+
+    metadata = fetch_service_metadata(service_url, cache)
+    edited_at = last_edit_date(metadata)
+    stored = None
+    if previous is not None and edited_at is not None and previous.last_edit_date == edited_at:
+        stored = _load_stored(state_dir, previous)
+    if stored is not None:
+        features, features_sha256 = stored[0], previous.features_sha256
+    else:
+        features, features_sha256 = _store_features(
+            iter_features(
+                service_url,
+                cache,
+                max_workers=max_workers,
+                geometry_options=geometry_options,
+                metadata=metadata,
+                page_size=page_size,
+            ),
+            state_dir / FEATURES_FILENAME,
+        )
+    (state_dir / METADATA_FILENAME).write_text(json.dumps(metadata), encoding="utf-8")
+    consumers = dict(previous.consumers) if previous is not None else {}
+    LayerState(
+        service_url=service_url,
+        query=query,
+        last_edit_date=edited_at,
+        features_sha256=features_sha256,
+        fetched_at=now,
+        consumers=consumers,
+    ).write(state_path)
+    return LayerFeatures(
+        features=features,
+        unchanged=consumers.get(consumer) == features_sha256,
+        metadata=metadata,
+        state_dir=state_dir,
+        features_sha256=features_sha256,
+    )
+
+
+def mark_layer_consumed(layer: LayerFeatures, consumer: str) -> None:
+    """
+    Records that consumer has finished with layer's feature set, so the next
+    fetch_features_if_edited of the same features reports them unchanged to it.
+    """
+    if layer.state_dir is None or layer.features_sha256 is None:
+        return
+    state_path = layer.state_dir / LAYER_STATE_FILENAME
+    state = LayerState.load(state_path)
+    if state is None:
+        return
+    replace(state, consumers={**state.consumers, consumer: layer.features_sha256}).write(
+        state_path
+    )
+
+
+def layer_for_consumer(layer: LayerFeatures, consumer: str) -> LayerFeatures:
+    """
+    layer with unchanged judged for consumer rather than the consumer that fetched
+    it, for handing one download to several consumers.
+    """
+    seen = None
+    if layer.state_dir is not None and layer.features_sha256 is not None:
+        state = LayerState.load(layer.state_dir / LAYER_STATE_FILENAME)
+        if state is not None:
+            seen = state.consumers.get(consumer)
+    return replace(layer, unchanged=seen is not None and seen == layer.features_sha256)
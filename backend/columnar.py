@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+from array import array
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+import numpy as np
+
+
+# Rows are decoded back into dicts this many at a time while iterating.
+_BLOCK_ROWS = 4096
+
+
+class ColumnarTable:
+    """
+    Parsed rows held as dictionary-encoded NumPy columns.
+
+    Every column stores each distinct value once in an object array, its dictionary,
+    plus one int32 code per row, so the repeated keys and values of list[dict] output
+    collapse to four bytes a cell. Subsets made by take() share the dictionaries.
+    Iterating the table yields plain dicts, decoded a block at a time, so code written
+    against list[dict] keeps working; to_rows() materializes the whole list. Values
+    must be hashable scalars, and a key a row did not have reads back as None.
+    """
+
+    def __init__(
+        self,
+        codes: dict[str, np.ndarray],
+        dictionaries: dict[str, np.ndarray],
+        length: int,
+    ) -> None:
+        self._codes = codes
+        self._dictionaries = dictionaries
+        self._length = length
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> ColumnarTable:
+        builder = ColumnarBuilder()
+        for row in rows:
+            builder.append(row)
+        return builder.build()
+
+    @classmethod
+    def concat(cls, tables: Sequence[ColumnarTable]) -> ColumnarTable:
+        """Stacks tables in order, re-encoding their codes against merged dictionaries."""
+        builder = ColumnarBuilder()
+        for table in tables:
+            builder.extend_table(table)
+        return builder.build()
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        return tuple(self._codes)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the code arrays and dictionary slots, excluding the values."""
+        return sum(codes.nbytes for codes in self._codes.values()) + sum(
+            dictionary.nbytes for dictionary in self._dictionaries.values()
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[dict]:
+        names = self.column_names
+        if not names:
+            for _ in range(self._length):
+                yield {}
+            return
+        for start in range(0, self._length, _BLOCK_ROWS):
+            columns = [
+                self._dictionaries[name][self._codes[name][start : start + _BLOCK_ROWS]].tolist()
+                for name in names
+            ]
+            for values in zip(*columns):
+                yield dict(zip(names, values))
+
+    def __getitem__(self, position: int) -> dict:
+        if not -self._length <= position < self._length:
+            raise IndexError("ColumnarTable index out of range")
+        return {
+            name: self._dictionaries[name][codes[position]]
+            for name, codes in self._codes.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"ColumnarTable(rows={self._length}, columns={list(self._codes)})"
+
+    def to_rows(self) -> list[dict]:
+        return list(self)
+
+    def column(self, name: str) -> np.ndarray:
+        """The decoded values of one column, as an object array."""
+        return self._dictionaries[name][self._codes[name]]
+
+    def distinct(self, name: str) -> set:
+        """The set of values that occur in one column, without decoding every row."""
+        if name not in self._codes:
+            return {None} if self._length else set()
+        return set(self._dictionaries[name][np.unique(self._codes[name])].tolist())
+
+    def take(self, positions: Sequence[int] | np.ndarray) -> ColumnarTable:
+        """The rows at positions, in that order, sharing this table's dictionaries."""
+        indices = np.asarray(positions, dtype=np.intp)
+        return ColumnarTable(
+            {name: codes[indices] for name, codes in self._codes.items()},
+            self._dictionaries,
+            len(indices),
+        )
+
+    def json_lines(self) -> Iterator[str]:
+        """
+        Yields each row as json.dumps(row, sort_keys=True) would encode it.
+
+        Every dictionary value is encoded once, with its key, so writing a row is a
+        string join rather than a full json.dumps call.
+        """
+        names = sorted(self._codes)
+        encoded = {}
+        for name in names:
+            prefix = json.dumps(name) + ": "
+            pairs = np.empty(len(self._dictionaries[name]), dtype=object)
+            pairs[:] = [prefix + json.dumps(value) for value in self._dictionaries[name].tolist()]
+            encoded[name] = pairs
+        if not names:
+            for _ in range(self._length):
+                yield "{}"
+            return
+        for start in range(0, self._length, _BLOCK_ROWS):
+            columns = [
+                encoded[name][self._codes[name][start : start + _BLOCK_ROWS]].tolist()
+                for name in names
+            ]
+            for pairs in zip(*columns):
+                yield "{" + ", ".join(pairs) + "}"
+
+
+class ColumnarBuilder:
+    """
+    Appends dict rows straight into dictionary-encoded columns.
+
+    Parsers append to a builder where they would append to a list, so the dict for
+    a row is dropped as soon as it has been encoded. Columns are added as rows
+    introduce new keys and earlier rows read as None for them.
+    """
+
+    def __init__(self) -> None:
+        # name -> (value lookup, dictionary values, codes), unpacked once per cell.
+        self._columns: dict[str, tuple[dict[Any, int], list, array]] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _add_column(self, name: str) -> tuple[dict[Any, int], list, array]:
+        codes = array("i", bytes(self._length * array("i").itemsize))
+        column = self._columns[name] = ({_lookup_key(None): 0}, [None], codes)
+        return column
+
+    def _code(self, name: str, value: Any) -> int:
+        lookup, values, _ = self._columns[name]
+        key = _lookup_key(value)
+        code = lookup.get(key)
+        if code is None:
+            code = lookup[key] = len(values)
+            values.append(value)
+        return code
+
+    def append(self, row: dict) -> None:
+        columns = self._columns
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                column = self._add_column(name)
+            lookup, values, codes = column
+            # Inlined _code(); this loop runs once for every parsed cell.
+            key = value if value.__class__ is str else (value.__class__, value)
+            code = lookup.get(key)
+            if code is None:
+                code = lookup[key] = len(values)
+                values.append(value)
+            codes.append(code)
+        self._length += 1
+        if len(row) < len(columns):
+            for name, (_, _, codes) in columns.items():
+                if len(codes) < self._length:
+                    codes.append(self._code(name, None))
+
+    def extend_table(self, table: ColumnarTable) -> None:
+        """Appends every row of table, remapping whole code arrays at once."""
+        for name in table.column_names:
+            if name not in self._columns:
+                self._add_column(name)
+        for name, (_, _, codes) in self._columns.items():
+            if name in table._codes:
+                remap = np.array(
+                    [self._code(name, value) for value in table._dictionaries[name].tolist()],
+                    dtype=np.int32,
+                )
+                codes.frombytes(remap[table._codes[name]].tobytes())
+            else:
+                codes.extend([self._code(name, None)] * len(table))
+        self._length += len(table)
+
+    def build(self) -> ColumnarTable:
+        codes: dict[str, np.ndarray] = {}
+        dictionaries: dict[str, np.ndarray] = {}
+        for name, (_, values, column_codes) in self._columns.items():
+            codes[name] = np.frombuffer(column_codes, dtype=np.int32).copy()
+            dictionary = np.empty(len(values), dtype=object)
+            dictionary[:] = values
+            dictionaries[name] = dictionary
+        return ColumnarTable(codes, dictionaries, self._length)
+
+
+def _lookup_key(value: Any) -> Any:
+    # 1, 1.0 and True hash alike; keying non-strings by type keeps them distinct.
+    return value if type(value) is str else (type(value), value)
+
+
+Records = Union[list[dict], ColumnarTable]
+
+
+def new_records(columnar: bool = False) -> list[dict] | ColumnarBuilder:
+    """The record sink a parser appends to: a list, or a builder when columnar."""
+    return ColumnarBuilder() if columnar else []
+
+
+def finish_records(records: list[dict] | ColumnarBuilder) -> Records:
+    return records.build() if isinstance(records, ColumnarBuilder) else records
+
+
+def select_rows(rows: Records, positions: Sequence[int]) -> Records:
+    """The rows at positions, kept columnar when rows is a ColumnarTable."""
+    if isinstance(rows, ColumnarTable):
+        return rows.take(positions)
+    return [rows[position] for position in positions]
+
+
+def field_values(rows: Iterable[dict], field: str) -> set:
+    """The set of values rows hold for field."""
+    if isinstance(rows, ColumnarTable):
+        return rows.distinct(field)
+    return {row.get(field) for row in rows}
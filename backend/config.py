@@ -4,6 +4,10 @@ import os
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, TypeVar
+
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -27,6 +31,23 @@ class PipelineConfig:
     session_length_years: int
     legdb_base_url: str
     legdb_years: tuple[int, ...]
+    download_chunk_size: int
+    download_max_workers: int
+    download_per_host_limit: int
+    http_connect_timeout: float
+    http_read_timeout: float
+    http_pool_maxsize: int
+    extract_bill_tracking: bool
+    gis_max_allowable_offset: float | None
+    gis_geometry_precision: int | None
+    gis_quantization_tolerance: float | None
+    gis_store_full_geometry: bool
+    district_topology_zooms: tuple[int, ...]
+    gis_fetch_window_seconds: float
+    gis_ingest_legislative_districts: bool
+    columnar_parse: bool
+    csv_parse_workers: int
+    parse_max_workers: int
 
 
 def load_config() -> PipelineConfig:
@@ -103,6 +124,23 @@ def load_config() -> PipelineConfig:
     )
 
     legdb_years = _parse_years(os.getenv("NJLEG_LEGDB_YEARS", "2024"))
+    download_chunk_size = int(os.getenv("NJLEG_DOWNLOAD_CHUNK_SIZE", str(64 * 1024)))
+    download_max_workers = int(os.getenv("NJLEG_DOWNLOAD_MAX_WORKERS", "8"))
+    download_per_host_limit = int(os.getenv("NJLEG_DOWNLOAD_PER_HOST_LIMIT", "4"))
+    http_connect_timeout = float(os.getenv("NJLEG_HTTP_CONNECT_TIMEOUT", "10"))
+    http_read_timeout = float(os.getenv("NJLEG_HTTP_READ_TIMEOUT", "60"))
+    http_pool_maxsize = int(os.getenv("NJLEG_HTTP_POOL_MAXSIZE", "10"))
+    extract_bill_tracking = os.getenv("NJLEG_EXTRACT_BILL_TRACKING", "").lower() in ("true", "1", "yes")
+    gis_max_allowable_offset = _parse_optional(os.getenv("NJLEG_GIS_MAX_ALLOWABLE_OFFSET"), float)
+    gis_geometry_precision = _parse_optional(os.getenv("NJLEG_GIS_GEOMETRY_PRECISION"), int)
+    gis_quantization_tolerance = _parse_optional(os.getenv("NJLEG_GIS_QUANTIZATION_TOLERANCE"), float)
+    gis_store_full_geometry = os.getenv("NJLEG_GIS_STORE_FULL_GEOMETRY", "").lower() in ("true", "1", "yes")
+    district_topology_zooms = _parse_ints(os.getenv("NJLEG_DISTRICT_TOPOLOGY_ZOOMS", "6,9,12"))
+    gis_fetch_window_seconds = float(os.getenv("NJLEG_GIS_FETCH_WINDOW_SECONDS", "3600"))
+    gis_ingest_legislative_districts = os.getenv("NJLEG_GIS_INGEST_LEGISLATIVE_DISTRICTS", "").lower() in ("true", "1", "yes")
+    columnar_parse = os.getenv("NJLEG_COLUMNAR_PARSE", "").lower() in ("true", "1", "yes")
+    csv_parse_workers = int(os.getenv("NJLEG_CSV_PARSE_WORKERS", "1"))
+    parse_max_workers = int(os.getenv("NJLEG_PARSE_MAX_WORKERS", "1"))
 
     return PipelineConfig(
         base_url=base_url,
@@ -124,17 +162,44 @@ def load_config() -> PipelineConfig:
         session_length_years=session_length_years,
         legdb_base_url=legdb_base_url,
         legdb_years=legdb_years,
+        download_chunk_size=download_chunk_size,
+        download_max_workers=download_max_workers,
+        download_per_host_limit=download_per_host_limit,
+        http_connect_timeout=http_connect_timeout,
+        http_read_timeout=http_read_timeout,
+        http_pool_maxsize=http_pool_maxsize,
+        extract_bill_tracking=extract_bill_tracking,
+        gis_max_allowable_offset=gis_max_allowable_offset,
+        gis_geometry_precision=gis_geometry_precision,
+        gis_quantization_tolerance=gis_quantization_tolerance,
+        gis_store_full_geometry=gis_store_full_geometry,
+        district_topology_zooms=district_topology_zooms,
+        gis_fetch_window_seconds=gis_fetch_window_seconds,
+        gis_ingest_legislative_districts=gis_ingest_legislative_districts,
+        columnar_parse=columnar_parse,
+        csv_parse_workers=csv_parse_workers,
+        parse_max_workers=parse_max_workers,
     )
 
 
 def _parse_years(value: str) -> tuple[int, ...]:
-    years: list[int] = []
+    return _parse_ints(value)
+
+
+def _parse_ints(value: str) -> tuple[int, ...]:
+    values: list[int] = []
     for chunk in value.split(","):
         cleaned = chunk.strip()
         if not cleaned:
             continue
-        years.append(int(cleaned))
-    return tuple(years)
+        values.append(int(cleaned))
+    return tuple(values)
+
+
+def _parse_optional(value: str | None, cast: Callable[[str], T]) -> T | None:
+    if value is None or not value.strip():
+        return None
+    return cast(value.strip())
 
 
 def _resolve_supabase_key() -> str:
@@ -1,29 +1,36 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Iterable, Sequence
+from typing import Sequence
+
+from backend.columnar import Records, select_rows
 
 
 def merge_rows_by_key(
-    rows: Iterable[dict],
+    rows: Records,
     key: str,
     date_fields: Sequence[str],
-) -> list[dict]:
-    merged: dict[str, dict] = {}
-    for row in rows:
+) -> Records:
+    """
+    Keeps one row per key, preferring the one with the latest date in date_fields.
+
+    Rows keep the position of the first row seen for their key. A ColumnarTable is
+    merged by position and stays columnar.
+    """
+    merged: dict[str, tuple[int, date | None]] = {}
+    for position, row in enumerate(rows):
         row_key = row.get(key)
         if row_key is None:
             continue
         row_key_str = str(row_key)
+        row_date = _latest_date(row, date_fields)
         existing = merged.get(row_key_str)
-        if existing is None or _is_newer(row, existing, date_fields):
-            merged[row_key_str] = row
-    return list(merged.values())
+        if existing is None or _is_newer(row_date, existing[1]):
+            merged[row_key_str] = (position, row_date)
+    return select_rows(rows, [position for position, _ in merged.values()])
 
 
-def _is_newer(candidate: dict, existing: dict, date_fields: Sequence[str]) -> bool:
-    candidate_date = _latest_date(candidate, date_fields)
-    existing_date = _latest_date(existing, date_fields)
+def _is_newer(candidate_date: date | None, existing_date: date | None) -> bool:
     if candidate_date and existing_date:
         return candidate_date > existing_date
     if candidate_date and not existing_date:
@@ -1,16 +1,56 @@
 from __future__ import annotations
 
+import os
 import re
-import urllib.request
+import tempfile
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence
 
-import urllib.parse
+import requests
+
+from backend import http_client
+from backend.http_cache import HttpCache
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+
+
+@dataclass(frozen=True)
+class DownloadJob:
+    url: str
+    target_path: Path
+    optional: bool = False
+
+
+class _HostLimiter:
+    def __init__(self, per_host_limit: int) -> None:
+        self._per_host_limit = max(1, per_host_limit)
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = urllib.parse.urlparse(url).netloc
+        with self._lock:
+            semaphore = self._slots.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._per_host_limit)
+                self._slots[host] = semaphore
+        with semaphore:
+            yield
 
 
 def fetch_index_html(base_url: str) -> str:
-    with urllib.request.urlopen(base_url) as response:
-        return response.read().decode("utf-8", errors="ignore")
+    response = http_client.get(base_url)
+    response.raise_for_status()
+    return response.content.decode("utf-8", errors="ignore")
 
 
 def resolve_download_url(base_url: str, index_html: str, filename: str) -> str:
@@ -25,28 +65,175 @@ def resolve_download_url(base_url: str, index_html: str, filename: str) -> str:
     return f"{base_url.rstrip('/')}/{filename}"
 
 
-def _save_url_to_path(url: str, target_path: Path) -> None:
-    with urllib.request.urlopen(url) as response, target_path.open("wb") as f:
-        f.write(response.read())
+def stream_to_path(chunks: Iterable[bytes], target_path: Path) -> None:
+    """
+    Writes an iterable of byte chunks to target_path without buffering the whole body.
 
+    Data is written to a temporary file next to the target, fsynced and renamed into
+    place, so readers only ever see a complete file (or the previous one).
+    """
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{target_path.name}.", suffix=".part", dir=target_path.parent
+    )
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, target_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-def download_files(base_url: str, filenames: Iterable[str], destination: Path) -> list[Path]:
-    destination.mkdir(parents=True, exist_ok=True)
-    index_html = fetch_index_html(base_url)
-    downloaded_paths: list[Path] = []
 
-    for filename in filenames:
-        url = resolve_download_url(base_url, index_html, filename)
-        target_path = destination / filename
-        _save_url_to_path(url, target_path)
-        downloaded_paths.append(target_path)
+def _save_url_to_path(
+    url: str,
+    target_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+) -> None:
+    headers = cache.conditional_headers(url) if cache is not None else {}
+    with http_client.get(url, headers=headers, stream=True) as response:
+        if response.status_code == 304 and cache is not None:
+            if cache.restore(url, target_path):
+                return
+            # The cached body vanished between the lookup and the 304; fetch it fresh.
+            _save_url_to_path(url, target_path, chunk_size)
+            return
+        response.raise_for_status()
+        stream_to_path(response.iter_content(chunk_size), target_path)
+        if cache is not None:
+            cache.store(url, target_path, response.headers)
+
 
-    return downloaded_paths
+def fetch_url_bytes(url: str, cache: HttpCache | None = None) -> bytes:
+    """Returns the body for url, revalidating against cache when one is given."""
+    headers = cache.conditional_headers(url) if cache is not None else {}
+    response = http_client.get(url, headers=headers)
+    if response.status_code == 304 and cache is not None:
+        cached = cache.read_bytes(url)
+        if cached is not None:
+            return cached
+        return fetch_url_bytes(url)
+    response.raise_for_status()
+    if cache is not None:
+        cache.store_bytes(url, response.content, response.headers)
+    return response.content
+
+
+def stream_url_chunks(
+    url: str,
+    cache: HttpCache | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Yields the body for url in chunks as it arrives, revalidating against cache.
+
+    A 304 replays the cached body from disk. A fresh body is copied to a temporary
+    file beside the cache while it streams and recorded once it is complete, so the
+    whole body is never held in memory.
+    """
+    headers = cache.conditional_headers(url) if cache is not None else {}
+    with http_client.get(url, headers=headers, stream=True) as response:
+        if response.status_code == 304 and cache is not None:
+            entry = cache.lookup(url)
+            if entry is None:
+                yield from stream_url_chunks(url, None, chunk_size)
+                return
+            with entry.body_path.open("rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+            return
+        response.raise_for_status()
+        if cache is None:
+            yield from response.iter_content(chunk_size)
+            return
+        cache.root.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(suffix=".part", dir=cache.root)
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+                    yield chunk
+            cache.store(url, temp_path, response.headers)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+def download_many(
+    jobs: Sequence[DownloadJob],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+) -> list[Path | None]:
+    """
+    Downloads jobs on a bounded thread pool, at most per_host_limit at a time per host.
+
+    Results are returned in job order. Optional jobs that fail with an HTTP error
+    yield None; any other failure is re-raised once the pool has drained.
+    """
+    limiter = _HostLimiter(per_host_limit)
+
+    def run(job: DownloadJob) -> Path | None:
+        job.target_path.parent.mkdir(parents=True, exist_ok=True)
+        with limiter.slot(job.url):
+            try:
+                _save_url_to_path(job.url, job.target_path, chunk_size, cache)
+            except requests.HTTPError:
+                if job.optional:
+                    return None
+                raise
+        return job.target_path
+
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+        futures = [executor.submit(run, job) for job in jobs]
+    return [future.result() for future in futures]
+
+
+def download_files(
+    base_url: str,
+    filenames: Iterable[str],
+    destination: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+) -> list[Path]:
+    destination.mkdir(parents=True, exist_ok=True)
+    index_html = fetch_index_html(base_url)
+    jobs = [
+        DownloadJob(
+            url=resolve_download_url(base_url, index_html, filename),
+            target_path=destination / filename,
+        )
+        for filename in filenames
+    ]
+    downloaded = download_many(
+        jobs,
+        chunk_size,
+        cache,
+        max_workers=max_workers,
+        per_host_limit=per_host_limit,
+    )
+    return [path for path in downloaded if path is not None]
 
 
-def download_file(url: str, destination: Path) -> Path:
+def download_file(
+    url: str,
+    destination: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+) -> Path:
     destination.mkdir(parents=True, exist_ok=True)
     filename = Path(urllib.parse.urlparse(url).path).name
     target_path = destination / filename
-    _save_url_to_path(url, target_path)
+    _save_url_to_path(url, target_path, chunk_size, cache)
     return target_path
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+@contextmanager
+def atomic_writer(target: Path) -> Iterator[BinaryIO]:
+    """
+    Opens a temporary file next to target for writing and renames it over target
+    once the block completes, so readers only ever see a complete file (or the
+    previous one). If the block raises, the temporary file is removed and target
+    is left as it was.
+    """
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{target.name}.", suffix=".part", dir=target.parent
+    )
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_atomic(target: Path, data: bytes) -> None:
+    """Replaces target with data in one rename (see atomic_writer)."""
+    with atomic_writer(target) as f:
+        f.write(data)
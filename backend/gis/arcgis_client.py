@@ -1,8 +1,18 @@
 import os
+from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin
 
-import requests
+from backend.arcgis import (
+    GeometryOptions,
+    LayerFeatures,
+    fetch_features_if_edited,
+    layer_cache_dir,
+)
+
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_FETCH_WINDOW_SECONDS = 3600
 
 
 class ArcGISClientError(RuntimeError):
@@ -15,20 +25,7 @@ def _layer_url() -> str:
     return urljoin(root, layer)
 
 
-def fetch_layer_metadata() -> dict[str, Any]:
-    """
-    GET {layer_url}?f=pjson
-    Validate:
-      - geometryType is polygon/multipolygon
-      - spatialReference.wkid exists
-    """
-    layer_url = _layer_url()
-    response = requests.get(f"{layer_url}?f=pjson", timeout=30)
-    if response.status_code != 200:
-        raise ArcGISClientError(
-            f"Layer metadata request failed with status {response.status_code}"
-        )
-    payload = response.json()
+def validate_layer_metadata(payload: dict[str, Any]) -> dict[str, Any]:
     geometry_type = payload.get("geometryType")
     if geometry_type not in {"esriGeometryPolygon", "esriGeometryMultiPolygon"}:
         raise ArcGISClientError(
@@ -41,46 +38,45 @@ def fetch_layer_metadata() -> dict[str, Any]:
     return payload
 
 
-def _query_params(result_offset: int, result_record_count: int) -> dict[str, Any]:
-    return {
-        "where": "1=1",
-        "outFields": "*",
-        "returnGeometry": "true",
-        "f": "geojson",
-        "resultOffset": result_offset,
-        "resultRecordCount": result_record_count,
-    }
+def generalization_options() -> GeometryOptions:
+    """
+    Optional server-side generalization:
+      - ARCGIS_MAX_ALLOWABLE_OFFSET (output units, degrees for GeoJSON)
+      - ARCGIS_GEOMETRY_PRECISION (decimal places)
+      - ARCGIS_QUANTIZATION_TOLERANCE (grid cell size, view mode)
+    """
+    max_allowable_offset = os.getenv("ARCGIS_MAX_ALLOWABLE_OFFSET")
+    geometry_precision = os.getenv("ARCGIS_GEOMETRY_PRECISION")
+    quantization_tolerance = os.getenv("ARCGIS_QUANTIZATION_TOLERANCE")
+    return GeometryOptions(
+        max_allowable_offset=float(max_allowable_offset) if max_allowable_offset else None,
+        geometry_precision=int(geometry_precision) if geometry_precision else None,
+        quantization_tolerance=float(quantization_tolerance) if quantization_tolerance else None,
+    )
 
 
-def fetch_all_features() -> list[dict[str, Any]]:
+def fetch_layer() -> LayerFeatures:
     """
-    Query FeatureServer with pagination.
-    Must:
-      - use returnGeometry=true
-      - request f=geojson
-      - respect ARCGIS_QUERY_PAGE_SIZE
-    Returns list of GeoJSON features.
+    Fetches the layer through the cache shared with run_pipeline.
+    State lives under NJLEG_DATA_DIR/gis (backend/data/gis by default), keyed by layer
+    URL and generalization, so a sync that already pulled the same query within
+    NJLEG_GIS_FETCH_WINDOW_SECONDS is reused without any request.
     """
     layer_url = _layer_url()
-    page_size = int(os.environ["ARCGIS_QUERY_PAGE_SIZE"])
-    all_features: list[dict[str, Any]] = []
-    offset = 0
-    while True:
-        response = requests.get(
-            f"{layer_url}/query",
-            params=_query_params(offset, page_size),
-            timeout=60,
-        )
-        if response.status_code != 200:
-            raise ArcGISClientError(
-                f"Feature query failed with status {response.status_code}"
-            )
-        payload = response.json()
-        features = payload.get("features") or []
-        all_features.extend(features)
-        if len(features) < page_size:
-            break
-        offset += page_size
-    if not all_features:
+    options = generalization_options()
+    cache_root = Path(os.getenv("NJLEG_DATA_DIR", "backend/data")).resolve() / "gis"
+    layer = fetch_features_if_edited(
+        layer_url,
+        layer_cache_dir(cache_root, layer_url, options),
+        max_workers=int(os.getenv("ARCGIS_QUERY_MAX_WORKERS", DEFAULT_MAX_WORKERS)),
+        geometry_options=options,
+        page_size=int(os.environ["ARCGIS_QUERY_PAGE_SIZE"]),
+        reuse_within=float(
+            os.getenv("NJLEG_GIS_FETCH_WINDOW_SECONDS", DEFAULT_FETCH_WINDOW_SECONDS)
+        ),
+        consumer="legislative_districts",
+    )
+    validate_layer_metadata(layer.metadata)
+    if not len(layer.features):
         raise ArcGISClientError("No features returned from ArcGIS layer query")
-    return all_features
+    return layer
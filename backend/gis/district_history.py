@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import Sequence
+
+from backend.gis.district_index import DistrictIndex, DistrictIndexCache, DistrictMatch
+from backend.gis.repository import DistrictGeometry, DistrictVersion, load_district_history
+
+
+class TemporalDistrictIndex:
+    """
+    As-of-date point-in-district lookup over the full SCD2 district history.
+
+    Version start and end dates split the timeline into elementary intervals during
+    which the set of valid versions is constant. A date is resolved to its interval
+    by binary search, and each interval gets its own spatial DistrictIndex, built on
+    first use. valid_to is inclusive, matching how ingestion closes a version the
+    day before its replacement starts; a version replaced on the day it started is
+    valid on no date, as in legislative_districts_as_of.
+    """
+
+    def __init__(self, versions: Sequence[DistrictVersion]) -> None:
+        boundaries = {version.valid_from for version in versions}
+        boundaries.update(
+            version.valid_to + timedelta(days=1)
+            for version in versions
+            if version.valid_to is not None
+        )
+        self._starts = sorted(boundaries)
+        self._members: list[list[DistrictVersion]] = [[] for _ in self._starts]
+        for version in versions:
+            first = bisect_right(self._starts, version.valid_from) - 1
+            end = (
+                len(self._starts)
+                if version.valid_to is None
+                else bisect_right(self._starts, version.valid_to)
+            )
+            for position in range(first, end):
+                self._members[position].append(version)
+        self._indexes: dict[int, DistrictIndex] = {}
+        self._lock = threading.Lock()
+
+    def versions_at(self, as_of: date) -> list[DistrictVersion]:
+        position = bisect_right(self._starts, as_of) - 1
+        return list(self._members[position]) if position >= 0 else []
+
+    def _index_at(self, as_of: date) -> DistrictIndex:
+        position = bisect_right(self._starts, as_of) - 1
+        with self._lock:
+            index = self._indexes.get(position)
+            if index is None:
+                members = self._members[position] if position >= 0 else []
+                index = DistrictIndex(
+                    [DistrictGeometry(v.chamber, v.district_number, v.geom) for v in members]
+                )
+                self._indexes[position] = index
+        return index
+
+    def lookup(self, lat: float, lon: float, as_of: date) -> DistrictMatch:
+        return self._index_at(as_of).lookup(lat, lon)
+
+    def lookup_many(
+        self, points: Sequence[tuple[float, float]], as_of: date
+    ) -> list[DistrictMatch]:
+        return self._index_at(as_of).lookup_many(points)
+
+
+def load_temporal_district_index() -> TemporalDistrictIndex:
+    return TemporalDistrictIndex(load_district_history())
+
+
+temporal_district_index_cache: DistrictIndexCache[TemporalDistrictIndex] = DistrictIndexCache(
+    load_temporal_district_index
+)
+
+
+def lookup_districts_as_of(
+    points: Sequence[tuple[float, float]], as_of: date
+) -> list[DistrictMatch]:
+    """Senate and assembly districts containing each (lat, lon) point on as_of."""
+    return temporal_district_index_cache.get().lookup_many(points, as_of)
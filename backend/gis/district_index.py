@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Iterable, Sequence, TypeVar
+
+import numpy as np
+import shapely
+
+from backend.gis.repository import DistrictGeometry, load_current_districts, load_legislators
+
+
+HOUSES = {"S": "Senate", "A": "Assembly"}
+
+IndexT = TypeVar("IndexT")
+
+
+@dataclass(frozen=True)
+class DistrictMatch:
+    senate_district: int | None
+    assembly_district: int | None
+    legislators: list[dict] = field(default_factory=list)
+
+
+class DistrictIndex:
+    """
+    Point-in-district lookup over the active district polygons.
+
+    Candidates come from an STRtree of polygon bounding boxes, and are confirmed
+    with intersects_xy against prepared polygons, so a batch of points is answered
+    with a handful of vectorized calls.
+    """
+
+    def __init__(
+        self,
+        districts: Sequence[DistrictGeometry],
+        legislators: Iterable[dict] = (),
+    ) -> None:
+        self._chambers = [district.chamber for district in districts]
+        self._numbers = [district.district_number for district in districts]
+        self._geoms = np.empty(len(districts), dtype=object)
+        self._geoms[:] = [district.geom for district in districts]
+        shapely.prepare(self._geoms)
+        self._tree = shapely.STRtree(self._geoms)
+        self._loaded_chambers = set(self._chambers)
+        self._legislators: dict[tuple[str, int], list[dict]] = {}
+        for legislator in legislators:
+            key = (legislator.get("house"), legislator.get("district"))
+            self._legislators.setdefault(key, []).append(legislator)
+
+    def __len__(self) -> int:
+        return len(self._geoms)
+
+    def lookup(self, lat: float, lon: float) -> DistrictMatch:
+        return self.lookup_many([(lat, lon)])[0]
+
+    def lookup_many(self, points: Sequence[tuple[float, float]]) -> list[DistrictMatch]:
+        """Looks up (lat, lon) points; results are in input order."""
+        if not points:
+            return []
+        coords = np.asarray(points, dtype=float).reshape(-1, 2)
+        lats, lons = coords[:, 0], coords[:, 1]
+        point_indices, tree_indices = self._tree.query(shapely.points(lons, lats))
+        hits = shapely.intersects_xy(
+            self._geoms[tree_indices], lons[point_indices], lats[point_indices]
+        )
+        found: list[dict[str, int]] = [{} for _ in range(len(coords))]
+        for point_index, tree_index in zip(point_indices[hits], tree_indices[hits]):
+            # Points on a shared border keep the first district the tree reports.
+            found[point_index].setdefault(self._chambers[tree_index], self._numbers[tree_index])
+        return [self._match(districts) for districts in found]
+
+    def _match(self, districts: dict[str, int]) -> DistrictMatch:
+        senate = districts.get("S")
+        assembly = districts.get("A")
+        # Each NJ legislative district elects one senator and two assembly members,
+        # so a layer carrying a single chamber's polygons answers for both.
+        if "A" not in self._loaded_chambers:
+            assembly = senate
+        if "S" not in self._loaded_chambers:
+            senate = assembly
+        legislators = [
+            *self._legislators.get((HOUSES["S"], senate), []),
+            *self._legislators.get((HOUSES["A"], assembly), []),
+        ]
+        return DistrictMatch(
+            senate_district=senate,
+            assembly_district=assembly,
+            legislators=legislators,
+        )
+
+
+def load_district_index() -> DistrictIndex:
+    return DistrictIndex(load_current_districts(), load_legislators())
+
+
+class DistrictIndexCache(Generic[IndexT]):
+    """
+    Lazily built, process-wide index that is rebuilt after invalidate().
+    Every cache is registered so notify_districts_changed() reaches all of them.
+    """
+
+    def __init__(self, loader: Callable[[], IndexT]) -> None:
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._index: IndexT | None = None
+        _caches.append(self)
+
+    def get(self) -> IndexT:
+        with self._lock:
+            if self._index is None:
+                self._index = self._loader()
+            return self._index
+
+    def reload(self) -> IndexT:
+        index = self._loader()
+        with self._lock:
+            self._index = index
+        return index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._index = None
+
+
+_caches: list[DistrictIndexCache] = []
+district_index_cache: DistrictIndexCache[DistrictIndex] = DistrictIndexCache(load_district_index)
+
+
+def notify_districts_changed() -> None:
+    """Called when district ingestion changed rows so the next lookup reloads."""
+    for cache in _caches:
+        cache.invalidate()
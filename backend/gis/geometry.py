@@ -1,9 +1,17 @@
+import hashlib
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+import shapely
 from shapely.geometry import MultiPolygon, Polygon, shape
-from shapely.ops import transform
 from shapely.validation import explain_validity
 from pyproj import Transformer
 
 
+TARGET_SRID = 4326
+
+
 class GeometryError(ValueError):
     pass
 
@@ -12,6 +20,23 @@ def geometries_equal(left: MultiPolygon, right: MultiPolygon, tolerance: float =
     return left.equals_exact(right, tolerance)
 
 
+FINGERPRINT_GRID_SIZE = 1e-7
+
+
+def geometry_fingerprint(
+    geom: Polygon | MultiPolygon, grid_size: float = FINGERPRINT_GRID_SIZE
+) -> str:
+    """
+    - Snaps coordinates to grid_size (1e-7 degrees is about 1 cm)
+    - Normalizes ring orientation, start vertex and part order
+    - Returns sha256 hex of the 2D little-endian WKB
+    Equal fingerprints mean the geometries match at that precision.
+    """
+    canonical = shapely.normalize(shapely.set_precision(geom, grid_size))
+    wkb = shapely.to_wkb(canonical, output_dimension=2, byte_order=1)
+    return hashlib.sha256(wkb).hexdigest()
+
+
 def _ensure_multipolygon(geom: Polygon | MultiPolygon) -> MultiPolygon:
     if isinstance(geom, MultiPolygon):
         return geom
@@ -20,6 +45,59 @@ def _ensure_multipolygon(geom: Polygon | MultiPolygon) -> MultiPolygon:
     raise GeometryError(f"Unsupported geometry type: {geom.geom_type}")
 
 
+@lru_cache(maxsize=32)
+def get_transformer(source_srid: int, target_srid: int = TARGET_SRID) -> Transformer:
+    """Transformers are expensive to build, so one is kept per SRID pair."""
+    return Transformer.from_crs(source_srid, target_srid, always_xy=True)
+
+
+def _reproject(geoms: np.ndarray, source_srid: int) -> np.ndarray:
+    if source_srid == TARGET_SRID:
+        return geoms
+    transformer = get_transformer(source_srid)
+
+    def project(coords: np.ndarray) -> np.ndarray:
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack((x, y))
+
+    # shapely.transform hands every coordinate of every geometry to project at once.
+    return shapely.transform(geoms, project)
+
+
+def _repair_invalid(geoms: np.ndarray) -> np.ndarray:
+    invalid = ~shapely.is_valid(geoms)
+    if not invalid.any():
+        return geoms
+    repaired = geoms.copy()
+    repaired[invalid] = shapely.buffer(geoms[invalid], 0)
+    still_invalid = ~shapely.is_valid(repaired)
+    if still_invalid.any():
+        index = int(np.flatnonzero(still_invalid)[0])
+        raise GeometryError(
+            f"Invalid geometry after fix: {explain_validity(repaired[index])}"
+        )
+    return repaired
+
+
+def normalize_geometries(features: Iterable[dict], source_srid: int) -> list[MultiPolygon]:
+    """
+    Batch form of normalize_geometry:
+    - Consumes features one at a time, so a generator need not be materialized
+    - Reprojects every feature's coordinates in one NumPy pass with a cached transformer
+    - Repairs (buffer(0)) only the geometries that come out invalid
+    - Returns MultiPolygons in feature order
+    """
+    geoms: list[MultiPolygon] = []
+    for feature in features:
+        if "geometry" not in feature or feature["geometry"] is None:
+            raise GeometryError("Feature has no geometry")
+        geoms.append(_ensure_multipolygon(shape(feature["geometry"])))
+    array = np.empty(len(geoms), dtype=object)
+    array[:] = geoms
+    projected = _repair_invalid(_reproject(array, source_srid))
+    return [_ensure_multipolygon(geom) for geom in projected]
+
+
 def normalize_geometry(feature: dict, source_srid: int) -> MultiPolygon:
     """
     - Accepts GeoJSON feature
@@ -27,17 +105,4 @@ def normalize_geometry(feature: dict, source_srid: int) -> MultiPolygon:
     - Reprojects from source_srid to 4326
     - Returns shapely.geometry.MultiPolygon
     """
-    if "geometry" not in feature or feature["geometry"] is None:
-        raise GeometryError("Feature has no geometry")
-    raw_geom = shape(feature["geometry"])
-    multipolygon = _ensure_multipolygon(raw_geom)
-    transformer = Transformer.from_crs(source_srid, 4326, always_xy=True)
-    projected = transform(transformer.transform, multipolygon)
-    if not projected.is_valid:
-        fixed = projected.buffer(0)
-        if not fixed.is_valid:
-            raise GeometryError(
-                f"Invalid geometry after fix: {explain_validity(fixed)}"
-            )
-        projected = fixed
-    return _ensure_multipolygon(projected)
+    return normalize_geometries([feature], source_srid)[0]
@@ -4,11 +4,27 @@ import json
 import os
 import sys
 from dataclasses import dataclass
-from typing import Any
-
-from backend.gis.arcgis_client import fetch_all_features, fetch_layer_metadata
-from backend.gis.geometry import normalize_geometry
-from backend.gis.repository import upsert_district
+from typing import Any, Iterable, Iterator
+
+from urllib.parse import urlencode
+
+from backend.arcgis import (
+    GeometryOptions,
+    LayerFeatures,
+    feature_set_hash,
+    last_edit_date,
+    mark_layer_consumed,
+)
+from backend.gis.arcgis_client import fetch_layer, generalization_options
+from backend.gis.district_index import notify_districts_changed
+from backend.gis.geometry import normalize_geometries
+from backend.gis.repository import (
+    DistrictRecord,
+    LayerState,
+    get_layer_state,
+    save_layer_state,
+    upsert_districts,
+)
 
 
 @dataclass(frozen=True)
@@ -102,52 +118,118 @@ def _extract_int(attributes: dict[str, Any], field_name: str) -> int:
         raise IngestError(f"Invalid value for {field_name}: {attributes[field_name]}") from exc
 
 
+def layer_key(layer_url: str, options: GeometryOptions | None = None) -> str:
+    # Generalization settings are part of the key so changing them forces a re-ingest.
+    key = layer_url.rstrip("/")
+    params = options.query_params() if options else {}
+    if params:
+        key = f"{key}?{urlencode(sorted(params.items()))}"
+    return key
+
+
+def _layer_key(config: IngestConfig) -> str:
+    layer_url = f"{config.arcgis_rest_root.rstrip('/')}/{config.arcgis_layer.lstrip('/')}"
+    return layer_key(layer_url, generalization_options())
+
+
 def _log(payload: dict[str, Any]) -> None:
     print(json.dumps(payload, sort_keys=True))
 
 
+def ingest_layer(layer: LayerFeatures, key: str) -> dict[str, Any]:
+    """
+    Upserts a fetched layer into legislative_districts and returns the summary.
+    run_pipeline passes the same LayerFeatures it parses for the districts table,
+    so one download feeds both tables. A layer whose unchanged flag is set for the
+    "legislative_districts" consumer is skipped before touching the database.
+    """
+    metadata = layer.metadata
+    if layer.unchanged:
+        summary = {
+            "action": "skipped",
+            "reason": "features_unchanged",
+            "last_edit_date": last_edit_date(metadata),
+        }
+        _log(summary)
+        return summary
+    source_srid = metadata["spatialReference"]["wkid"]
+    fields = metadata.get("fields") or []
+    district_field = _find_field(fields, {"DISTRICT", "DISTRICT_NUMBER", "DIST_NO"})
+    objectid_field = _find_field(fields, {"OBJECTID", "OBJECT_ID"})
+    layer_name = metadata.get("name")
+    edited_at = last_edit_date(metadata)
+    previous = get_layer_state(key)
+    if (
+        previous is not None
+        and edited_at is not None
+        and previous.last_edit_date == edited_at
+    ):
+        summary = {"action": "skipped", "reason": "layer_not_edited", "last_edit_date": edited_at}
+        _log(summary)
+        return summary
+    features_sha256 = layer.features_sha256 or feature_set_hash(layer.features)
+    state = LayerState(
+        layer_url=key,
+        last_edit_date=edited_at,
+        features_sha256=features_sha256,
+    )
+    if previous is not None and previous.features_sha256 == features_sha256:
+        save_layer_state(state)
+        summary = {"action": "skipped", "reason": "features_unchanged", "last_edit_date": edited_at}
+        _log(summary)
+        return summary
+    # Features stream from the layer cache into normalize_geometries; only their
+    # attributes are kept alongside.
+    feature_attributes: list[dict[str, Any]] = []
+
+    def keep_attributes(features: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for feature in features:
+            feature_attributes.append(feature.get("properties") or {})
+            yield feature
+
+    geometries = normalize_geometries(keep_attributes(layer.features), source_srid)
+    records: list[DistrictRecord] = []
+    for attributes, geom in zip(feature_attributes, geometries):
+        records.append(
+            DistrictRecord(
+                chamber=_infer_chamber(attributes, layer_name),
+                district_number=_extract_int(attributes, district_field),
+                geom=geom,
+                source_srid=source_srid,
+                source_objectid=_extract_int(attributes, objectid_field),
+            )
+        )
+    result = upsert_districts(records)
+    for (chamber, district_number), action in sorted(result.actions.items()):
+        _log(
+            {
+                "district_number": district_number,
+                "chamber": chamber,
+                "action": action,
+            }
+        )
+    summary = {
+        "total_features": len(records),
+        "inserted": result.count("inserted"),
+        "updated": result.count("updated"),
+        "unchanged": result.count("unchanged"),
+    }
+    save_layer_state(state)
+    if summary["inserted"] or summary["updated"]:
+        notify_districts_changed()
+    _log(summary)
+    return summary
+
+
 def main() -> int:
     try:
         config = _validate_env()
         if not config.gis_ingestion_enabled:
             _log({"action": "skipped", "reason": "GIS_INGESTION_ENABLED=false"})
             return 0
-        metadata = fetch_layer_metadata()
-        source_srid = metadata["spatialReference"]["wkid"]
-        fields = metadata.get("fields") or []
-        district_field = _find_field(fields, {"DISTRICT", "DISTRICT_NUMBER", "DIST_NO"})
-        objectid_field = _find_field(fields, {"OBJECTID", "OBJECT_ID"})
-        layer_name = metadata.get("name")
-        features = fetch_all_features()
-        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
-        for feature in features:
-            attributes = feature.get("properties") or {}
-            district_number = _extract_int(attributes, district_field)
-            chamber = _infer_chamber(attributes, layer_name)
-            objectid = _extract_int(attributes, objectid_field)
-            geom = normalize_geometry(feature, source_srid)
-            result = upsert_district(
-                chamber=chamber,
-                district_number=district_number,
-                geom=geom,
-                source_srid=source_srid,
-                source_objectid=objectid,
-            )
-            counts[result.action] += 1
-            _log(
-                {
-                    "district_number": district_number,
-                    "chamber": chamber,
-                    "action": result.action,
-                }
-            )
-        summary = {
-            "total_features": len(features),
-            "inserted": counts["inserted"],
-            "updated": counts["updated"],
-            "unchanged": counts["unchanged"],
-        }
-        _log(summary)
+        layer = fetch_layer()
+        ingest_layer(layer, _layer_key(config))
+        mark_layer_consumed(layer, "legislative_districts")
         return 0
     except Exception as exc:  # noqa: BLE001
         _log({"action": "error", "error": str(exc)})
@@ -1,19 +1,64 @@
 from __future__ import annotations
 
+import io
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
+from typing import Sequence
+
 import psycopg2
+import shapely
 from shapely.geometry import MultiPolygon, shape, mapping
 from supabase import Client, create_client
 
-from backend.gis.geometry import geometries_equal
+from backend.gis.geometry import geometries_equal, geometry_fingerprint
+from backend.roster_split import split_legislators
 
 @dataclass
 class UpsertResult:
     action: str
 
 
+@dataclass(frozen=True)
+class DistrictRecord:
+    chamber: str
+    district_number: int
+    geom: MultiPolygon
+    source_srid: int
+    source_objectid: int
+
+
+@dataclass
+class BatchUpsertResult:
+    actions: dict[tuple[str, int], str] = field(default_factory=dict)
+
+    def count(self, action: str) -> int:
+        return sum(1 for value in self.actions.values() if value == action)
+
+
+@dataclass(frozen=True)
+class DistrictGeometry:
+    chamber: str
+    district_number: int
+    geom: MultiPolygon
+
+
+@dataclass(frozen=True)
+class DistrictVersion:
+    chamber: str
+    district_number: int
+    geom: MultiPolygon
+    valid_from: date
+    valid_to: date | None
+
+
+@dataclass
+class LayerState:
+    layer_url: str
+    last_edit_date: int | None
+    features_sha256: str | None
+
+
 class RepositoryError(RuntimeError):
     pass
 
@@ -33,139 +78,466 @@ def _get_supabase_client() -> Client:
     return create_client(supabase_url, supabase_key)
 
 
-def _psycopg2_upsert(
+def upsert_district(
     chamber: str,
     district_number: int,
     geom: MultiPolygon,
     source_srid: int,
     source_objectid: int,
 ) -> UpsertResult:
-    connection = _get_psycopg2_connection()
-    if connection is None:
+    """
+    Logic:
+    1. Find active row where:
+         chamber = ?
+         district_number = ?
+         valid_to IS NULL
+    2. If none exists → INSERT
+    3. If exists AND geometry fingerprint is identical → NOOP
+    4. If exists AND geometry differs:
+         a. UPDATE existing row set valid_to = current_date - 1
+         b. INSERT new row with valid_from = current_date
+    """
+    result = upsert_districts(
+        [
+            DistrictRecord(
+                chamber=chamber,
+                district_number=district_number,
+                geom=geom,
+                source_srid=source_srid,
+                source_objectid=source_objectid,
+            )
+        ]
+    )
+    return UpsertResult(action=result.actions[(chamber, district_number)])
+
+
+def _dedupe_records(records: Sequence[DistrictRecord]) -> list[DistrictRecord]:
+    # A district listed twice ends up as its last geometry, as repeated single upserts would.
+    latest: dict[tuple[str, int], DistrictRecord] = {}
+    for record in records:
+        latest[(record.chamber, record.district_number)] = record
+    return list(latest.values())
+
+
+def _copy_rows(rows: list[tuple]) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join("\\N" if value is None else str(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _classify(
+    fingerprint: str, existing_id: str | None, existing_fingerprint: str | None
+) -> str:
+    if existing_id is None:
+        return "inserted"
+    if existing_fingerprint is None:
+        # Rows written before fingerprints existed are compared by geometry once.
+        return "unknown"
+    return "unchanged" if existing_fingerprint == fingerprint else "updated"
+
+
+def _psycopg2_upsert_batch(records: list[DistrictRecord]) -> BatchUpsertResult:
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
         raise RepositoryError("DATABASE_URL is required for direct PostGIS access")
-    wkt = geom.wkt
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT id,
-                   ST_Equals(geom, ST_GeomFromText(%s, 4326)) AS equals_geom
-              FROM legislative_districts
-             WHERE chamber = %s
-               AND district_number = %s
-               AND valid_to IS NULL
-             LIMIT 1
-            """,
-            (wkt, chamber, district_number),
-        )
-        row = cursor.fetchone()
-        if row is None:
+    fingerprints = {
+        (record.chamber, record.district_number): geometry_fingerprint(record.geom)
+        for record in records
+    }
+    connection = psycopg2.connect(database_url)
+    try:
+        with connection, connection.cursor() as cursor:
+            # Pass 1 ships only fingerprints; geometry goes over the wire for changed rows.
             cursor.execute(
                 """
-                INSERT INTO legislative_districts
-                    (chamber, district_number, geom, source_sr, source_objectid)
-                VALUES (%s, %s, ST_GeomFromText(%s, 4326), %s, %s)
-                """,
-                (chamber, district_number, wkt, source_srid, source_objectid),
+                CREATE TEMP TABLE incoming_fingerprints (
+                    chamber text NOT NULL,
+                    district_number int NOT NULL,
+                    geom_fingerprint text NOT NULL
+                ) ON COMMIT DROP
+                """
             )
-            return UpsertResult(action="inserted")
-        existing_id, equals_geom = row
-        if equals_geom:
-            return UpsertResult(action="unchanged")
-        cursor.execute(
-            """
-            UPDATE legislative_districts
-               SET valid_to = current_date - 1
-             WHERE id = %s
-            """,
-            (existing_id,),
-        )
-        cursor.execute(
-            """
-            INSERT INTO legislative_districts
-                (chamber, district_number, geom, source_sr, source_objectid, valid_from)
-            VALUES (%s, %s, ST_GeomFromText(%s, 4326), %s, %s, current_date)
-            """,
-            (chamber, district_number, wkt, source_srid, source_objectid),
-        )
-    return UpsertResult(action="updated")
+            cursor.copy_expert(
+                "COPY incoming_fingerprints FROM STDIN",
+                _copy_rows(
+                    [(chamber, number, fp) for (chamber, number), fp in fingerprints.items()]
+                ),
+            )
+            cursor.execute(
+                """
+                SELECT i.chamber, i.district_number, d.id, d.geom_fingerprint
+                  FROM incoming_fingerprints i
+                  LEFT JOIN legislative_districts d
+                    ON d.chamber = i.chamber
+                   AND d.district_number = i.district_number
+                   AND d.valid_to IS NULL
+                """
+            )
+            existing = {
+                (chamber, number): (existing_id, existing_fingerprint)
+                for chamber, number, existing_id, existing_fingerprint in cursor.fetchall()
+            }
+            actions = {
+                key: _classify(fingerprints[key], *existing.get(key, (None, None)))
+                for key in fingerprints
+            }
+            pending = [
+                record
+                for record in records
+                if actions[(record.chamber, record.district_number)] != "unchanged"
+            ]
+            if pending:
+                cursor.execute(
+                    """
+                    CREATE TEMP TABLE district_changes (
+                        chamber text NOT NULL,
+                        district_number int NOT NULL,
+                        geom_wkb bytea NOT NULL,
+                        geom_fingerprint text NOT NULL,
+                        source_sr int NOT NULL,
+                        source_objectid int NOT NULL,
+                        existing_id uuid,
+                        action text NOT NULL
+                    ) ON COMMIT DROP
+                    """
+                )
+                # COPY text format: bytea travels as \x-prefixed hex with the backslash doubled.
+                cursor.copy_expert(
+                    "COPY district_changes FROM STDIN",
+                    _copy_rows(
+                        [
+                            (
+                                record.chamber,
+                                record.district_number,
+                                "\\\\x" + record.geom.wkb_hex,
+                                fingerprints[(record.chamber, record.district_number)],
+                                record.source_srid,
+                                record.source_objectid,
+                                existing.get((record.chamber, record.district_number), (None,))[0],
+                                actions[(record.chamber, record.district_number)],
+                            )
+                            for record in pending
+                        ]
+                    ),
+                )
+                cursor.execute(
+                    """
+                    UPDATE district_changes c
+                       SET action = CASE
+                               WHEN ST_Equals(d.geom, ST_GeomFromWKB(c.geom_wkb, 4326)) THEN 'unchanged'
+                               ELSE 'updated'
+                           END
+                      FROM legislative_districts d
+                     WHERE c.action = 'unknown'
+                       AND d.id = c.existing_id
+                    """
+                )
+                cursor.execute(
+                    """
+                    UPDATE legislative_districts d
+                       SET geom_fingerprint = c.geom_fingerprint
+                      FROM district_changes c
+                     WHERE c.action = 'unchanged'
+                       AND d.id = c.existing_id
+                    """
+                )
+                cursor.execute(
+                    """
+                    UPDATE legislative_districts d
+                       SET valid_to = current_date - 1
+                      FROM district_changes c
+                     WHERE c.action = 'updated'
+                       AND d.id = c.existing_id
+                    """
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO legislative_districts
+                        (chamber, district_number, geom, geom_fingerprint,
+                         source_sr, source_objectid, valid_from)
+                    SELECT chamber, district_number, ST_GeomFromWKB(geom_wkb, 4326),
+                           geom_fingerprint, source_sr, source_objectid, current_date
+                      FROM district_changes
+                     WHERE action <> 'unchanged'
+                    """
+                )
+                cursor.execute("SELECT chamber, district_number, action FROM district_changes")
+                for chamber, number, action in cursor.fetchall():
+                    actions[(chamber, number)] = action
+    finally:
+        connection.close()
+    return BatchUpsertResult(actions=actions)
 
 
-def _supabase_upsert(
-    chamber: str,
-    district_number: int,
-    geom: MultiPolygon,
-    source_srid: int,
-    source_objectid: int,
-) -> UpsertResult:
+def _supabase_upsert_batch(records: list[DistrictRecord]) -> BatchUpsertResult:
     client = _get_supabase_client()
     existing_response = (
         client.table("legislative_districts")
-        .select("id, geom")
-        .eq("chamber", chamber)
-        .eq("district_number", district_number)
+        .select("id, chamber, district_number, geom_fingerprint")
         .is_("valid_to", "null")
-        .limit(1)
         .execute()
     )
-    existing_rows = existing_response.data or []
-    geometry_payload = mapping(geom)
-    if not existing_rows:
-        client.table("legislative_districts").insert(
+    existing = {
+        (row["chamber"], row["district_number"]): row
+        for row in existing_response.data or []
+    }
+    fingerprints = {
+        (record.chamber, record.district_number): geometry_fingerprint(record.geom)
+        for record in records
+    }
+    actions = {
+        key: _classify(
+            fingerprint,
+            (existing.get(key) or {}).get("id"),
+            (existing.get(key) or {}).get("geom_fingerprint"),
+        )
+        for key, fingerprint in fingerprints.items()
+    }
+    unknown = {existing[key]["id"]: key for key, action in actions.items() if action == "unknown"}
+    if unknown:
+        legacy_response = (
+            client.table("legislative_districts")
+            .select("id, geom")
+            .in_("id", list(unknown))
+            .execute()
+        )
+        records_by_key = {(record.chamber, record.district_number): record for record in records}
+        for row in legacy_response.data or []:
+            key = unknown[row["id"]]
+            if row.get("geom") is None:
+                raise RepositoryError("Existing district row missing geometry")
+            if geometries_equal(shape(row["geom"]), records_by_key[key].geom):
+                actions[key] = "unchanged"
+                client.table("legislative_districts").update(
+                    {"geom_fingerprint": fingerprints[key]}
+                ).eq("id", row["id"]).execute()
+            else:
+                actions[key] = "updated"
+
+    closed_ids: list[str] = []
+    new_rows: list[dict] = []
+    for record in records:
+        key = (record.chamber, record.district_number)
+        if actions[key] == "unchanged":
+            continue
+        if actions[key] == "updated":
+            closed_ids.append(existing[key]["id"])
+        new_rows.append(
             {
-                "chamber": chamber,
-                "district_number": district_number,
-                "geom": geometry_payload,
-                "source_sr": source_srid,
-                "source_objectid": source_objectid,
+                "chamber": record.chamber,
+                "district_number": record.district_number,
+                "geom": mapping(record.geom),
+                "geom_fingerprint": fingerprints[key],
+                "source_sr": record.source_srid,
+                "source_objectid": record.source_objectid,
+                "valid_from": date.today().isoformat(),
             }
-        ).execute()
-        return UpsertResult(action="inserted")
-    existing_row = existing_rows[0]
-    existing_geom = existing_row.get("geom")
-    if existing_geom is None:
-        raise RepositoryError("Existing district row missing geometry")
-    existing_shape = shape(existing_geom)
-    if geometries_equal(existing_shape, geom):
-        return UpsertResult(action="unchanged")
-    client.table("legislative_districts").update(
-        {"valid_to": (date.today() - timedelta(days=1)).isoformat()}
-    ).eq("id", existing_row["id"]).execute()
-    client.table("legislative_districts").insert(
+        )
+    if closed_ids:
+        client.table("legislative_districts").update(
+            {"valid_to": (date.today() - timedelta(days=1)).isoformat()}
+        ).in_("id", closed_ids).execute()
+    if new_rows:
+        client.table("legislative_districts").insert(new_rows).execute()
+    return BatchUpsertResult(actions=actions)
+
+
+def upsert_districts(records: Sequence[DistrictRecord]) -> BatchUpsertResult:
+    """
+    Batch form of upsert_district with the same per-district outcome.
+
+    Change detection compares geometry fingerprints, so unchanged districts never
+    move geometry over the wire. With DATABASE_URL the fingerprints and then the
+    changed geometries (as WKB) are COPYed into temp tables over one connection, and
+    the close-old/insert-new steps run as set-based statements in a single
+    transaction. Otherwise one Supabase client reads all active fingerprints once and
+    writes the closed and new rows in one request each.
+    """
+    deduped = _dedupe_records(records)
+    if not deduped:
+        return BatchUpsertResult()
+    if os.environ.get("DATABASE_URL"):
+        return _psycopg2_upsert_batch(deduped)
+    return _supabase_upsert_batch(deduped)
+
+
+def get_layer_state(layer_url: str) -> LayerState | None:
+    """
+    Returns the lastEditDate and feature-set hash recorded by the previous ingest.
+    """
+    if os.environ.get("DATABASE_URL"):
+        connection = _get_psycopg2_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT last_edit_date, features_sha256
+                      FROM gis_layer_state
+                     WHERE layer_url = %s
+                    """,
+                    (layer_url,),
+                )
+                row = cursor.fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        return LayerState(layer_url=layer_url, last_edit_date=row[0], features_sha256=row[1])
+    client = _get_supabase_client()
+    response = (
+        client.table("gis_layer_state")
+        .select("last_edit_date, features_sha256")
+        .eq("layer_url", layer_url)
+        .limit(1)
+        .execute()
+    )
+    rows = response.data or []
+    if not rows:
+        return None
+    return LayerState(
+        layer_url=layer_url,
+        last_edit_date=rows[0].get("last_edit_date"),
+        features_sha256=rows[0].get("features_sha256"),
+    )
+
+
+def save_layer_state(state: LayerState) -> None:
+    if os.environ.get("DATABASE_URL"):
+        connection = _get_psycopg2_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO gis_layer_state (layer_url, last_edit_date, features_sha256, updated_at)
+                    VALUES (%s, %s, %s, now())
+                    ON CONFLICT (layer_url) DO UPDATE
+                       SET last_edit_date = EXCLUDED.last_edit_date,
+                           features_sha256 = EXCLUDED.features_sha256,
+                           updated_at = now()
+                    """,
+                    (state.layer_url, state.last_edit_date, state.features_sha256),
+                )
+        finally:
+            connection.close()
+        return
+    client = _get_supabase_client()
+    client.table("gis_layer_state").upsert(
         {
-            "chamber": chamber,
-            "district_number": district_number,
-            "geom": geometry_payload,
-            "source_sr": source_srid,
-            "source_objectid": source_objectid,
-            "valid_from": date.today().isoformat(),
-        }
+            "layer_url": state.layer_url,
+            "last_edit_date": state.last_edit_date,
+            "features_sha256": state.features_sha256,
+        },
+        on_conflict="layer_url",
     ).execute()
-    return UpsertResult(action="updated")
 
 
-def upsert_district(
-    chamber: str,
-    district_number: int,
-    geom: MultiPolygon,
-    source_srid: int,
-    source_objectid: int,
-) -> UpsertResult:
+LEGISLATOR_COLUMNS = ("roster_key", "district", "house", "first_name", "last_name", "party", "title")
+
+
+def _geometry_from_value(value: object) -> MultiPolygon:
+    # PostgREST returns geometry either as GeoJSON or as hex-encoded EWKB.
+    if isinstance(value, dict):
+        return shape(value)
+    if isinstance(value, str):
+        return shapely.from_wkb(bytes.fromhex(value))
+    raise RepositoryError("Unsupported geometry encoding in legislative_districts row")
+
+
+def load_current_districts() -> list[DistrictGeometry]:
     """
-    Logic:
-    1. Find active row where:
-         chamber = ?
-         district_number = ?
-         valid_to IS NULL
-    2. If none exists → INSERT
-    3. If exists AND geometry is identical → NOOP
-    4. If exists AND geometry differs:
-         a. UPDATE existing row set valid_to = current_date - 1
-         b. INSERT new row with valid_from = current_date
+    Returns every active (valid_to IS NULL) district geometry.
     """
     if os.environ.get("DATABASE_URL"):
-        return _psycopg2_upsert(
-            chamber, district_number, geom, source_srid, source_objectid
-        )
-    return _supabase_upsert(
-        chamber, district_number, geom, source_srid, source_objectid
+        connection = _get_psycopg2_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT chamber, district_number, ST_AsBinary(geom)
+                      FROM legislative_districts
+                     WHERE valid_to IS NULL
+                    """
+                )
+                rows = cursor.fetchall()
+        finally:
+            connection.close()
+        return [
+            DistrictGeometry(chamber, district_number, shapely.from_wkb(bytes(wkb)))
+            for chamber, district_number, wkb in rows
+        ]
+    client = _get_supabase_client()
+    response = (
+        client.table("legislative_districts")
+        .select("chamber, district_number, geom")
+        .is_("valid_to", "null")
+        .execute()
     )
+    return [
+        DistrictGeometry(row["chamber"], row["district_number"], _geometry_from_value(row["geom"]))
+        for row in response.data or []
+    ]
+
+
+def load_legislators() -> list[dict]:
+    """
+    Returns the current legislators (roster key, district, house, name, party, title).
+    The legislators table keeps former members too; they are dropped by leg_status,
+    as split_legislators does for the snapshots.
+    """
+    columns = (*LEGISLATOR_COLUMNS, "leg_status")
+    if os.environ.get("DATABASE_URL"):
+        connection = _get_psycopg2_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT {', '.join(columns)} FROM legislators")
+                rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            connection.close()
+    else:
+        client = _get_supabase_client()
+        response = client.table("legislators").select(", ".join(columns)).execute()
+        rows = list(response.data or [])
+    active, _ = split_legislators(rows)
+    return [{column: row.get(column) for column in LEGISLATOR_COLUMNS} for row in active]
+
+
+def load_district_history() -> list[DistrictVersion]:
+    """
+    Returns every district version, active and closed, with its validity dates.
+    """
+    if os.environ.get("DATABASE_URL"):
+        connection = _get_psycopg2_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT chamber, district_number, ST_AsBinary(geom), valid_from, valid_to
+                      FROM legislative_districts
+                    """
+                )
+                rows = cursor.fetchall()
+        finally:
+            connection.close()
+        return [
+            DistrictVersion(chamber, number, shapely.from_wkb(bytes(wkb)), valid_from, valid_to)
+            for chamber, number, wkb, valid_from, valid_to in rows
+        ]
+    client = _get_supabase_client()
+    response = (
+        client.table("legislative_districts")
+        .select("chamber, district_number, geom, valid_from, valid_to")
+        .execute()
+    )
+    return [
+        DistrictVersion(
+            chamber=row["chamber"],
+            district_number=row["district_number"],
+            geom=_geometry_from_value(row["geom"]),
+            valid_from=date.fromisoformat(row["valid_from"]),
+            valid_to=date.fromisoformat(row["valid_to"]) if row.get("valid_to") else None,
+        )
+        for row in response.data or []
+    ]
@@ -0,0 +1,57 @@
+import io
+import json
+import urllib.parse
+from unittest import mock
+
+import pytest
+import requests
+
+from backend.gis import arcgis_client
+
+
+def _response(payload: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(payload).encode("utf-8"))
+    return response
+
+
+def test_fetch_layer_pages_generalized_query(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("ARCGIS_REST_ROOT", "https://example.com/arcgis/rest/services")
+    monkeypatch.setenv("ARCGIS_LEGISLATIVE_DISTRICTS_LAYER", "Districts/FeatureServer/0")
+    monkeypatch.setenv("ARCGIS_QUERY_PAGE_SIZE", "2")
+    monkeypatch.setenv("ARCGIS_QUERY_MAX_WORKERS", "3")
+    monkeypatch.setenv("ARCGIS_GEOMETRY_PRECISION", "5")
+    monkeypatch.setenv("NJLEG_DATA_DIR", str(tmp_path))
+    features = [{"properties": {"OBJECTID": index}} for index in range(5)]
+    metadata = {
+        "geometryType": "esriGeometryPolygon",
+        "spatialReference": {"wkid": 4326},
+        "objectIdField": "OBJECTID",
+    }
+
+    def fake_get(url: str, **kwargs: object) -> requests.Response:
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+        if query.get("f") == "pjson":
+            return _response(metadata)
+        if query.get("returnCountOnly") == "true":
+            return _response({"count": len(features)})
+        assert query["orderByFields"] == "OBJECTID"
+        assert query["geometryPrecision"] == "5"
+        offset = int(query["resultOffset"])
+        return _response({"features": features[offset : offset + int(query["resultRecordCount"])]})
+
+    with mock.patch("backend.http_client.get_session") as get_session:
+        get_session.return_value.get.side_effect = fake_get
+        layer = arcgis_client.fetch_layer()
+
+    assert list(layer.features) == features
+    offsets = sorted(
+        int(query["resultOffset"])
+        for query in (
+            dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(call.args[0]).query))
+            for call in get_session.return_value.get.call_args_list
+        )
+        if "resultOffset" in query
+    )
+    assert offsets == [0, 2, 4]
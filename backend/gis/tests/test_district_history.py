@@ -0,0 +1,63 @@
+from datetime import date
+
+from shapely.geometry import MultiPolygon, box
+
+from backend.gis.district_history import TemporalDistrictIndex
+from backend.gis.repository import DistrictVersion
+
+
+WEST = MultiPolygon([box(-75.0, 39.0, -74.5, 40.0)])
+EAST = MultiPolygon([box(-74.5, 39.0, -74.0, 40.0)])
+WIDE_WEST = MultiPolygon([box(-75.0, 39.0, -74.2, 40.0)])
+NARROW_EAST = MultiPolygon([box(-74.2, 39.0, -74.0, 40.0)])
+
+# Redistricting on 2022-01-01 moved the west/east border.
+HISTORY = [
+    DistrictVersion("S", 1, WEST, date(2012, 1, 1), date(2021, 12, 31)),
+    DistrictVersion("S", 2, EAST, date(2012, 1, 1), date(2021, 12, 31)),
+    DistrictVersion("S", 1, WIDE_WEST, date(2022, 1, 1), None),
+    DistrictVersion("S", 2, NARROW_EAST, date(2022, 1, 1), None),
+]
+
+
+def test_lookup_resolves_district_as_of_date() -> None:
+    index = TemporalDistrictIndex(HISTORY)
+    point = (39.5, -74.3)
+
+    assert index.lookup(*point, date(2019, 6, 1)).senate_district == 2
+    assert index.lookup(*point, date(2021, 12, 31)).senate_district == 2
+    assert index.lookup(*point, date(2022, 1, 1)).senate_district == 1
+    assert index.lookup(*point, date(2030, 1, 1)).senate_district == 1
+
+
+def test_lookup_before_history_finds_nothing() -> None:
+    index = TemporalDistrictIndex(HISTORY)
+
+    assert index.lookup(39.5, -74.3, date(2000, 1, 1)).senate_district is None
+    assert index.versions_at(date(2000, 1, 1)) == []
+
+
+def test_versions_at_uses_interval_index() -> None:
+    index = TemporalDistrictIndex(HISTORY)
+
+    versions = index.versions_at(date(2015, 3, 1))
+
+    assert {version.geom for version in versions} == {WEST, EAST}
+    batch = index.lookup_many([(39.5, -74.9), (39.5, -74.1)], date(2015, 3, 1))
+    assert [match.senate_district for match in batch] == [1, 2]
+
+
+def test_version_replaced_on_its_first_day_is_never_valid() -> None:
+    # Ingested and replaced on 2022-01-01: closed with valid_to the day before.
+    history = [
+        *HISTORY[:2],
+        DistrictVersion("S", 1, WEST, date(2022, 1, 1), date(2021, 12, 31)),
+        DistrictVersion("S", 1, WIDE_WEST, date(2022, 1, 1), None),
+        HISTORY[3],
+    ]
+    index = TemporalDistrictIndex(history)
+
+    assert {version.geom for version in index.versions_at(date(2022, 1, 1))} == {
+        WIDE_WEST,
+        NARROW_EAST,
+    }
@@ -0,0 +1,64 @@
+from shapely.geometry import MultiPolygon, Polygon
+
+from backend.gis.district_index import DistrictIndex, DistrictIndexCache
+from backend.gis.repository import DistrictGeometry
+
+
+def _box(minx: float, miny: float, maxx: float, maxy: float) -> MultiPolygon:
+    return MultiPolygon([Polygon([(minx, miny), (maxx, miny), (maxx, maxy), (minx, maxy)])])
+
+
+DISTRICTS = [
+    DistrictGeometry("S", 1, _box(-75.0, 39.0, -74.5, 39.5)),
+    DistrictGeometry("S", 2, _box(-74.5, 39.0, -74.0, 39.5)),
+    DistrictGeometry("A", 1, _box(-75.0, 39.0, -74.5, 39.5)),
+    DistrictGeometry("A", 2, _box(-74.5, 39.0, -74.0, 39.5)),
+]
+LEGISLATORS = [
+    {"roster_key": 10, "district": 2, "house": "Senate", "last_name": "Smith"},
+    {"roster_key": 20, "district": 2, "house": "Assembly", "last_name": "Jones"},
+    {"roster_key": 30, "district": 1, "house": "Assembly", "last_name": "Brown"},
+]
+
+
+def test_lookup_returns_districts_and_legislators() -> None:
+    index = DistrictIndex(DISTRICTS, LEGISLATORS)
+
+    match = index.lookup(39.25, -74.25)
+
+    assert match.senate_district == 2
+    assert match.assembly_district == 2
+    assert [legislator["roster_key"] for legislator in match.legislators] == [10, 20]
+
+
+def test_lookup_many_keeps_input_order_and_misses() -> None:
+    index = DistrictIndex(DISTRICTS, LEGISLATORS)
+
+    matches = index.lookup_many([(39.25, -74.25), (41.0, -70.0), (39.1, -74.9)])
+
+    assert [match.senate_district for match in matches] == [2, None, 1]
+    assert matches[1].legislators == []
+
+
+def test_single_chamber_layer_answers_for_both_chambers() -> None:
+    index = DistrictIndex([district for district in DISTRICTS if district.chamber == "S"])
+
+    match = index.lookup(39.1, -74.9)
+
+    assert (match.senate_district, match.assembly_district) == (1, 1)
+
+
+def test_cache_reloads_after_invalidate() -> None:
+    loads: list[int] = []
+
+    def loader() -> DistrictIndex:
+        loads.append(1)
+        return DistrictIndex(DISTRICTS)
+
+    cache = DistrictIndexCache(loader)
+    first = cache.get()
+    assert cache.get() is first
+    cache.invalidate()
+
+    assert cache.get() is not first
+    assert len(loads) == 2
@@ -0,0 +1,102 @@
+from unittest import mock
+
+import pytest
+
+from backend.arcgis import LayerFeatures
+from backend.gis import ingest_legislative_districts as ingest
+from backend.gis.repository import LayerState
+
+
+@pytest.fixture
+def ingest_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for key, value in {
+        "ARCGIS_REST_ROOT": "https://example.com/arcgis/rest/services",
+        "ARCGIS_LEGISLATIVE_DISTRICTS_LAYER": "Districts/FeatureServer/0",
+        "ARCGIS_QUERY_PAGE_SIZE": "100",
+        "ARCGIS_TARGET_SRID": "4326",
+        "GIS_INGESTION_ENABLED": "true",
+        "SUPABASE_URL": "https://example.supabase.co",
+        "SUPABASE_SERVICE_ROLE_KEY": "key",
+    }.items():
+        monkeypatch.setenv(key, value)
+
+
+METADATA = {
+    "name": "Senate",
+    "spatialReference": {"wkid": 4326},
+    "fields": [{"name": "OBJECTID"}, {"name": "DISTRICT"}],
+    "editingInfo": {"lastEditDate": 1700000000000},
+}
+LAYER_KEY = "https://example.com/arcgis/rest/services/Districts/FeatureServer/0"
+
+
+def make_layer(features: list[dict]) -> LayerFeatures:
+    return LayerFeatures(
+        features=features,
+        unchanged=False,
+        metadata=METADATA,
+    )
+
+
+def test_main_skips_reingest_when_layer_not_edited(ingest_env: None) -> None:
+    previous = LayerState(layer_url=LAYER_KEY, last_edit_date=1700000000000, features_sha256="abc")
+    with mock.patch.object(ingest, "fetch_layer", return_value=make_layer([])), mock.patch.object(
+        ingest, "get_layer_state", return_value=previous
+    ), mock.patch.object(ingest, "normalize_geometries") as normalize, mock.patch.object(
+        ingest, "upsert_districts"
+    ) as upsert:
+        assert ingest.main() == 0
+
+    normalize.assert_not_called()
+    upsert.assert_not_called()
+
+
+def test_main_skips_upserts_when_feature_hash_matches(ingest_env: None) -> None:
+    features = [{"properties": {"OBJECTID": 1, "DISTRICT": 1}, "geometry": None}]
+    previous = LayerState(
+        layer_url=LAYER_KEY,
+        last_edit_date=1600000000000,
+        features_sha256=ingest.feature_set_hash(features),
+    )
+    with mock.patch.object(ingest, "fetch_layer", return_value=make_layer(features)), mock.patch.object(
+        ingest, "get_layer_state", return_value=previous
+    ), mock.patch.object(ingest, "save_layer_state") as save, mock.patch.object(
+        ingest, "upsert_districts"
+    ) as upsert:
+        assert ingest.main() == 0
+
+    upsert.assert_not_called()
+    assert save.call_args.args[0].last_edit_date == 1700000000000
+
+
+def test_ingest_layer_upserts_prefetched_features() -> None:
+    features = [
+        {
+            "properties": {"OBJECTID": 7, "DISTRICT": 4},
+            "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+        }
+    ]
+    with mock.patch.object(ingest, "get_layer_state", return_value=None), mock.patch.object(
+        ingest, "save_layer_state"
+    ), mock.patch.object(ingest, "upsert_districts") as upsert, mock.patch.object(
+        ingest, "notify_districts_changed"
+    ):
+        upsert.return_value.count.return_value = 1
+        summary = ingest.ingest_layer(make_layer(features), LAYER_KEY)
+
+    (record,) = upsert.call_args.args[0]
+    assert (record.chamber, record.district_number, record.source_objectid) == ("S", 4, 7)
+    assert summary["total_features"] == 1
+
+
+def test_ingest_layer_skips_layer_unchanged_for_consumer() -> None:
+    layer = LayerFeatures(features=[], unchanged=True, metadata=METADATA)
+    with mock.patch.object(ingest, "get_layer_state") as get_state, mock.patch.object(
+        ingest, "normalize_geometries"
+    ) as normalize, mock.patch.object(ingest, "upsert_districts") as upsert:
+        summary = ingest.ingest_layer(layer, LAYER_KEY)
+
+    assert summary["action"] == "skipped"
+    get_state.assert_not_called()
+    normalize.assert_not_called()
+    upsert.assert_not_called()
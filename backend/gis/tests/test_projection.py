@@ -1,6 +1,11 @@
 from shapely.geometry import Polygon
 
-from backend.gis.geometry import geometries_equal, normalize_geometry
+from backend.gis.geometry import (
+    geometries_equal,
+    geometry_fingerprint,
+    normalize_geometries,
+    normalize_geometry,
+)
 
 
 def test_projection_3857_to_4326() -> None:
@@ -67,3 +72,46 @@ def test_idempotent_geometry_comparison() -> None:
         4326,
     )
     assert geometries_equal(multipolygon, multipolygon)
+
+
+def test_geometry_fingerprint_ignores_vertex_order_and_noise() -> None:
+    square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    rotated = Polygon([(1, 1), (0, 1), (0, 0), (1, 0)])
+    jittered = Polygon([(0, 0), (1, 0), (1, 1.00000001), (0, 1)])
+    moved = Polygon([(0, 0), (1, 0), (1, 1.001), (0, 1)])
+
+    assert geometry_fingerprint(square) == geometry_fingerprint(rotated)
+    assert geometry_fingerprint(square) == geometry_fingerprint(jittered)
+    assert geometry_fingerprint(square) != geometry_fingerprint(moved)
+
+
+def test_normalize_geometries_matches_single_feature_path() -> None:
+    features = [
+        {
+            "type": "Feature",
+            "properties": {},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1000 * i, 0], [1000 * i, 1000], [0, 1000], [0, 0]]],
+            },
+        }
+        for i in range(1, 4)
+    ]
+    # A self-intersecting bow tie that needs repair after projection.
+    features.append(
+        {
+            "type": "Feature",
+            "properties": {},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1000, 1000], [1000, 0], [0, 1000], [0, 0]]],
+            },
+        }
+    )
+
+    batch = normalize_geometries(features, 3857)
+
+    assert len(batch) == 4
+    assert all(geom.geom_type == "MultiPolygon" and geom.is_valid for geom in batch)
+    for feature, geom in zip(features[:3], batch):
+        assert geometries_equal(geom, normalize_geometry(feature, 3857))
@@ -0,0 +1,100 @@
+from unittest import mock
+
+import pytest
+from shapely.geometry import MultiPolygon, Polygon, mapping
+
+from backend.gis import repository
+from backend.gis.geometry import geometry_fingerprint
+from backend.gis.repository import DistrictRecord, upsert_districts
+
+
+def _square(size: float) -> MultiPolygon:
+    return MultiPolygon([Polygon([(0, 0), (size, 0), (size, size), (0, size)])])
+
+
+def _record(chamber: str, district_number: int, size: float) -> DistrictRecord:
+    return DistrictRecord(
+        chamber=chamber,
+        district_number=district_number,
+        geom=_square(size),
+        source_srid=4326,
+        source_objectid=district_number,
+    )
+
+
+def test_upsert_districts_psycopg2_ships_geometry_only_for_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DATABASE_URL", "postgresql://example")
+    connection = mock.MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchall.side_effect = [
+        [("A", 1, None, None), ("S", 2, "s2", geometry_fingerprint(_square(2)))],
+        [("A", 1, "inserted")],
+    ]
+    copied: list[str] = []
+    cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(buffer.read())
+
+    with mock.patch.object(repository.psycopg2, "connect", return_value=connection) as connect:
+        result = upsert_districts([_record("A", 1, 1), _record("S", 2, 2)])
+
+    connect.assert_called_once()
+    connection.__enter__.assert_called_once()
+    connection.close.assert_called_once()
+    fingerprint_rows, geometry_rows = (chunk.splitlines() for chunk in copied)
+    assert len(fingerprint_rows) == 2
+    assert len(geometry_rows) == 1
+    assert geometry_rows[0].split("\t")[:2] == ["A", "1"]
+    assert geometry_rows[0].split("\t")[2].startswith("\\\\x")
+    assert result.actions == {("A", 1): "inserted", ("S", 2): "unchanged"}
+
+
+def test_upsert_districts_supabase_compares_fingerprints(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    client = mock.MagicMock()
+    table = client.table.return_value
+    table.select.return_value.is_.return_value.execute.return_value.data = [
+        {"id": "a1", "chamber": "A", "district_number": 1, "geom_fingerprint": geometry_fingerprint(_square(1))},
+        {"id": "a2", "chamber": "A", "district_number": 2, "geom_fingerprint": geometry_fingerprint(_square(1))},
+        {"id": "a4", "chamber": "A", "district_number": 4, "geom_fingerprint": None},
+    ]
+    table.select.return_value.in_.return_value.execute.return_value.data = [
+        {"id": "a4", "geom": mapping(_square(4))},
+    ]
+
+    with mock.patch.object(repository, "_get_supabase_client", return_value=client):
+        result = upsert_districts(
+            [_record("A", 1, 1), _record("A", 2, 3), _record("A", 3, 1), _record("A", 4, 4)]
+        )
+
+    assert result.actions == {
+        ("A", 1): "unchanged",
+        ("A", 2): "updated",
+        ("A", 3): "inserted",
+        ("A", 4): "unchanged",
+    }
+    table.select.return_value.in_.assert_called_once_with("id", ["a4"])
+    table.update.return_value.in_.assert_called_once_with("id", ["a2"])
+    inserted_rows = table.insert.call_args.args[0]
+    assert [row["district_number"] for row in inserted_rows] == [2, 3]
+    assert all(row["geom_fingerprint"] for row in inserted_rows)
+
+
+def test_load_legislators_drops_former_members(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATABASE_URL", "postgresql://example")
+    connection = mock.MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [
+        (1, 7, "Senate", "Ann", "Lee", "D", "Senator", "Active"),
+        (2, 7, "Senate", "Bob", "Ray", "R", "Senator", "Former Member"),
+        (3, 7, "Assembly", "Cy", "Fox", "D", "Assemblyman", None),
+    ]
+
+    with mock.patch.object(repository.psycopg2, "connect", return_value=connection):
+        legislators = repository.load_legislators()
+
+    assert [legislator["roster_key"] for legislator in legislators] == [1, 3]
+    assert set(legislators[0]) == set(repository.LEGISLATOR_COLUMNS)
+    connection.close.assert_called_once()
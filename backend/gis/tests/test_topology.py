@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+from shapely.geometry import MultiPolygon, Polygon, box
+
+from backend.gis.topology import (
+    MANIFEST_FILENAME,
+    build_topology,
+    simplify_topology,
+    write_topology_artifacts,
+)
+
+
+def _decode(topology: dict) -> list[MultiPolygon]:
+    (sx, sy), (tx, ty) = topology["transform"]["scale"], topology["transform"]["translate"]
+    decoded = []
+    for geometry in topology["objects"]["districts"]["geometries"]:
+        polygons = []
+        for polygon in geometry["arcs"]:
+            rings = []
+            for ring in polygon:
+                points: list = []
+                for arc in ring:
+                    coords = topology["arcs"][arc] if arc >= 0 else topology["arcs"][~arc][::-1]
+                    points.extend(coords if not points else coords[1:])
+                rings.append([(x * sx + tx, y * sy + ty) for x, y in points])
+            polygons.append(Polygon(rings[0], rings[1:]))
+        decoded.append(MultiPolygon(polygons))
+    return decoded
+
+
+def _wavy_neighbours() -> list[MultiPolygon]:
+    border = [(1.0 + 0.01 * (i % 2), i / 50) for i in range(51)]
+    left = Polygon([(0, 0), *border, (0, 1)])
+    right = Polygon([(2, 0), (2, 1), *reversed(border)])
+    return [MultiPolygon([left]), MultiPolygon([right])]
+
+
+def test_shared_border_is_stored_once_and_round_trips() -> None:
+    geometries = _wavy_neighbours()
+    topology = build_topology(geometries, [{"district": 1}, {"district": 2}])
+
+    left_arcs = {arc if arc >= 0 else ~arc for arc in topology["objects"]["districts"]["geometries"][0]["arcs"][0][0]}
+    right_arcs = {arc if arc >= 0 else ~arc for arc in topology["objects"]["districts"]["geometries"][1]["arcs"][0][0]}
+    assert len(left_arcs & right_arcs) == 1
+    for original, decoded in zip(geometries, _decode(topology)):
+        assert original.symmetric_difference(decoded).area < 1e-4
+
+
+def test_enclave_shares_its_ring_with_the_hole() -> None:
+    outer = MultiPolygon([Polygon(box(0, 0, 3, 3).exterior.coords, [box(1, 1, 2, 2).exterior.coords])])
+    inner = MultiPolygon([box(1, 1, 2, 2)])
+
+    topology = build_topology([outer, inner], [{}, {}])
+
+    assert len(topology["arcs"]) == 2
+
+
+def test_simplification_keeps_neighbours_aligned() -> None:
+    topology = build_topology(_wavy_neighbours(), [{}, {}])
+
+    simplified = simplify_topology(topology, 0.05)
+
+    assert sum(map(len, simplified["arcs"])) < sum(map(len, topology["arcs"]))
+    left, right = _decode(simplified)
+    assert left.is_valid and right.is_valid
+    assert left.intersection(right).area < 1e-9
+
+
+def test_write_topology_artifacts(tmp_path: Path) -> None:
+    manifest = write_topology_artifacts(_wavy_neighbours(), [{}, {}], tmp_path, zooms=(6, 12))
+
+    assert set(manifest["levels"]) == {"full", "z6", "z12"}
+    on_disk = json.loads((tmp_path / MANIFEST_FILENAME).read_text())
+    assert on_disk == manifest
+    for entry in manifest["levels"].values():
+        assert (tmp_path / entry["file"]).stat().st_size == entry["bytes"]
+    assert manifest["levels"]["z6"]["bytes"] < manifest["levels"]["full"]["bytes"]
+
+
+def test_write_topology_artifacts_keeps_previous_generation(tmp_path: Path) -> None:
+    first = write_topology_artifacts(_wavy_neighbours(), [{}, {}], tmp_path, zooms=(6,))
+    first_files = {entry["file"] for entry in first["levels"].values()}
+
+    # Clients may still hold the first manifest, so its files outlive it.
+    write_topology_artifacts(_wavy_neighbours(), [{"district_number": 1}, {}], tmp_path, zooms=(6,))
+    assert all((tmp_path / name).exists() for name in first_files)
+
+    latest = write_topology_artifacts(
+        _wavy_neighbours(), [{"district_number": 1}, {}], tmp_path, zooms=(6,), keep_retired_for=0
+    )
+    on_disk = {path.name for path in tmp_path.glob("districts.*.topo.json")}
+    assert on_disk == {entry["file"] for entry in latest["levels"].values()}
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Sequence
+
+from shapely.geometry import LineString, MultiPolygon
+
+from backend.fs import write_atomic
+
+
+DEFAULT_QUANTIZATION = 100_000
+DEFAULT_ZOOMS = (6, 9, 12)
+MANIFEST_FILENAME = "manifest.json"
+# How long clients may cache the manifest, and so keep asking for the files it lists.
+MANIFEST_MAX_AGE = 300
+
+Point = tuple[int, int]
+
+
+def artifacts_dir(data_dir: Path) -> Path:
+    return data_dir / "artifacts" / "districts"
+
+
+def zoom_tolerance(zoom: int) -> float:
+    """Width of one 256px web-map tile pixel at zoom, in degrees."""
+    return 360.0 / (256 * 2**zoom)
+
+
+class _ArcIndex:
+    def __init__(self) -> None:
+        self.arcs: list[list[Point]] = []
+        self._lookup: dict[tuple[Point, ...], int] = {}
+
+    def add(self, points: list[Point]) -> int:
+        """Returns the arc index for points, or ~index when stored reversed."""
+        key = tuple(points)
+        if key in self._lookup:
+            return self._lookup[key]
+        reversed_key = tuple(reversed(points))
+        if reversed_key in self._lookup:
+            return ~self._lookup[reversed_key]
+        self._lookup[key] = len(self.arcs)
+        self.arcs.append(points)
+        return self._lookup[key]
+
+
+def _quantize_ring(coords: Sequence[Sequence[float]], translate: tuple[float, float], scale: tuple[float, float]) -> list[Point]:
+    ring: list[Point] = []
+    for x, y, *_ in coords:
+        point = (round((x - translate[0]) / scale[0]), round((y - translate[1]) / scale[1]))
+        if not ring or ring[-1] != point:
+            ring.append(point)
+    if ring and ring[0] == ring[-1]:
+        ring.pop()
+    return ring
+
+
+def _find_junctions(rings: list[list[Point]]) -> set[Point]:
+    # A vertex is a junction when rings pass through it with different neighbours,
+    # which is exactly where a shared border starts or ends.
+    neighbours: dict[Point, frozenset[Point]] = {}
+    junctions: set[Point] = set()
+    for ring in rings:
+        size = len(ring)
+        for index, point in enumerate(ring):
+            pair = frozenset((ring[index - 1], ring[(index + 1) % size]))
+            seen = neighbours.setdefault(point, pair)
+            if seen != pair:
+                junctions.add(point)
+    return junctions
+
+
+def _ring_arcs(ring: list[Point], junctions: set[Point], index: _ArcIndex) -> list[int]:
+    cuts = [position for position, point in enumerate(ring) if point in junctions]
+    if not cuts:
+        # A ring with no junction is stored whole, rotated to a canonical start so an
+        # enclave's exterior and its neighbour's hole resolve to one arc.
+        start = min(range(len(ring)), key=ring.__getitem__)
+        rotated = ring[start:] + ring[:start]
+        return [index.add(rotated + rotated[:1])]
+    rotated = ring[cuts[0]:] + ring[: cuts[0]]
+    offsets = [position - cuts[0] for position in cuts] + [len(ring)]
+    arcs = []
+    for begin, end in zip(offsets, offsets[1:]):
+        segment = rotated[begin : end + 1] if end < len(ring) else rotated[begin:] + rotated[:1]
+        arcs.append(index.add(segment))
+    return arcs
+
+
+def build_topology(
+    geometries: Sequence[MultiPolygon],
+    properties: Sequence[dict[str, Any]],
+    quantization: int = DEFAULT_QUANTIZATION,
+    object_name: str = "districts",
+) -> dict[str, Any]:
+    """
+    Encodes polygons as a quantized TopoJSON Topology whose shared borders are
+    stored once as arcs referenced by both neighbours.
+    """
+    minx = min(geom.bounds[0] for geom in geometries)
+    miny = min(geom.bounds[1] for geom in geometries)
+    maxx = max(geom.bounds[2] for geom in geometries)
+    maxy = max(geom.bounds[3] for geom in geometries)
+    scale = ((maxx - minx) / (quantization - 1) or 1.0, (maxy - miny) / (quantization - 1) or 1.0)
+    translate = (minx, miny)
+
+    quantized: list[list[list[list[Point]]]] = []
+    for geom in geometries:
+        polygons = []
+        for polygon in geom.geoms:
+            rings = [_quantize_ring(polygon.exterior.coords, translate, scale)]
+            rings.extend(_quantize_ring(interior.coords, translate, scale) for interior in polygon.interiors)
+            polygons.append([ring for ring in rings if len(ring) >= 3])
+        quantized.append([polygon for polygon in polygons if polygon])
+
+    junctions = _find_junctions([ring for polygons in quantized for polygon in polygons for ring in polygon])
+    index = _ArcIndex()
+    topology_geometries = []
+    for polygons, props in zip(quantized, properties):
+        topology_geometries.append(
+            {
+                "type": "MultiPolygon",
+                "arcs": [[_ring_arcs(ring, junctions, index) for ring in polygon] for polygon in polygons],
+                "properties": props,
+            }
+        )
+    return {
+        "type": "Topology",
+        "bbox": [minx, miny, maxx, maxy],
+        "transform": {"scale": list(scale), "translate": list(translate)},
+        "objects": {object_name: {"type": "GeometryCollection", "geometries": topology_geometries}},
+        "arcs": index.arcs,
+    }
+
+
+def _simplify_arc(arc: list[Point], tolerance: float) -> list[Point]:
+    if len(arc) <= 2:
+        return arc
+    simplified = [(int(x), int(y)) for x, y in LineString(arc).simplify(tolerance, preserve_topology=False).coords]
+    if arc[0] == arc[-1] and len(simplified) < 4:
+        return arc
+    return simplified
+
+
+def simplify_topology(topology: dict[str, Any], tolerance: float) -> dict[str, Any]:
+    """
+    Douglas-Peucker simplifies each arc once, so neighbours keep an identical border.
+    Rings that would collapse below four vertices keep their original arcs.
+    """
+    scale = topology["transform"]["scale"]
+    grid_tolerance = tolerance / max(scale)
+    arcs = [_simplify_arc(arc, grid_tolerance) for arc in topology["arcs"]]
+    for geometries in (obj["geometries"] for obj in topology["objects"].values()):
+        for geometry in geometries:
+            for polygon in geometry["arcs"]:
+                for ring in polygon:
+                    size = sum(len(arcs[arc if arc >= 0 else ~arc]) - 1 for arc in ring)
+                    if size < 3:
+                        for arc in ring:
+                            position = arc if arc >= 0 else ~arc
+                            arcs[position] = topology["arcs"][position]
+    return {**topology, "arcs": arcs}
+
+
+def _delta_encode(topology: dict[str, Any]) -> dict[str, Any]:
+    encoded = []
+    for arc in topology["arcs"]:
+        previous = (0, 0)
+        deltas = []
+        for x, y in arc:
+            deltas.append([x - previous[0], y - previous[1]])
+            previous = (x, y)
+        encoded.append(deltas)
+    return {**topology, "arcs": encoded}
+
+
+def write_topology_artifacts(
+    geometries: Sequence[MultiPolygon],
+    properties: Sequence[dict[str, Any]],
+    destination: Path,
+    zooms: Sequence[int] = DEFAULT_ZOOMS,
+    quantization: int = DEFAULT_QUANTIZATION,
+    keep_retired_for: float = MANIFEST_MAX_AGE,
+) -> dict[str, Any]:
+    """
+    Writes a full-resolution TopoJSON plus one simplified TopoJSON per zoom to
+    destination. File names carry a content hash so they can be cached forever;
+    manifest.json maps each level to its current file.
+
+    Files the previous manifest listed stay on disk for keep_retired_for seconds
+    after it is replaced, since clients may still hold that manifest; they are
+    removed by a later call.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+    manifest_path = destination / MANIFEST_FILENAME
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        previous_files = {entry["file"] for entry in previous["levels"].values()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        previous_files = set()
+    topology = build_topology(geometries, properties, quantization)
+    levels: dict[str, Any] = {"full": topology}
+    for zoom in zooms:
+        levels[f"z{zoom}"] = simplify_topology(topology, zoom_tolerance(zoom))
+
+    manifest: dict[str, Any] = {"levels": {}}
+    for level, level_topology in levels.items():
+        data = json.dumps(_delta_encode(level_topology), separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        filename = f"districts.{level}.{digest[:16]}.topo.json"
+        target = destination / filename
+        if not target.exists():
+            write_atomic(target, data)
+        manifest["levels"][level] = {
+            "file": filename,
+            "bytes": len(data),
+            "sha256": digest,
+            "tolerance": zoom_tolerance(int(level[1:])) if level != "full" else 0.0,
+        }
+    write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+    live = {entry["file"] for entry in manifest["levels"].values()}
+    now = time.time()
+    for stale in destination.glob("districts.*.topo.json"):
+        if stale.name in live:
+            continue
+        if stale.name in previous_files:
+            # Retired just now: its modification time marks when.
+            os.utime(stale, (now, now))
+        elif now - stale.stat().st_mtime >= keep_retired_for:
+            stale.unlink(missing_ok=True)
+    return manifest
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+from backend.fs import write_atomic
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    body_path: Path
+
+
+class HttpCache:
+    """
+    On-disk store of response bodies and their validators, keyed by URL.
+
+    Each URL gets a `<sha256>.json` metadata file and a `<sha256>.body` file under root,
+    so concurrent downloads of different URLs never contend on a shared index.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / f"{key}.json", self.root / f"{key}.body"
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CacheEntry(
+            url=url,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            body_path=body_path,
+        )
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        entry = self.lookup(url)
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url: str, source_path: Path, headers: Mapping[str, str]) -> None:
+        """Records source_path as the cached body for url if the response carried validators."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        meta_path, body_path = self._paths(url)
+        if not etag and not last_modified:
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(source_path, body_path)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified}
+        write_atomic(meta_path, json.dumps(meta, sort_keys=True).encode("utf-8"))
+
+    def store_bytes(self, url: str, data: bytes, headers: Mapping[str, str]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(suffix=".part", dir=self.root)
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            self.store(url, temp_path, headers)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def restore(self, url: str, target_path: Path) -> bool:
+        """Places the cached body for url at target_path. Returns False on a cache miss."""
+        entry = self.lookup(url)
+        if entry is None:
+            return False
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(entry.body_path, target_path)
+        return True
+
+    def forget(self, url: str) -> None:
+        """Drops the cached body and validators for url, so its next request is unconditional."""
+        meta_path, body_path = self._paths(url)
+        meta_path.unlink(missing_ok=True)
+        body_path.unlink(missing_ok=True)
+
+    def read_bytes(self, url: str) -> bytes | None:
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        return entry.body_path.read_bytes()
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    # Hard links are safe here because every writer replaces files via rename rather
+    # than rewriting them in place.
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{target.name}.", suffix=".part", dir=target.parent
+    )
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        temp_path.unlink()
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class HttpSettings:
+    connect_timeout: float = 10.0
+    read_timeout: float = 60.0
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+
+_lock = threading.Lock()
+_settings = HttpSettings()
+_session: requests.Session | None = None
+
+
+def _build_session(settings: HttpSettings) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.pool_connections,
+        pool_maxsize=settings.pool_maxsize,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Closes the pools once the last thread using a replaced session drops it.
+    weakref.finalize(session, adapter.close)
+    return session
+
+
+def configure(settings: HttpSettings) -> None:
+    """
+    Replaces the shared session so later requests use the new pool sizes and
+    timeouts. The previous session is not closed here, since other threads may be
+    mid-request on it; its pools are closed once it is no longer referenced.
+    """
+    global _session, _settings
+    with _lock:
+        _settings = settings
+        _session = _build_session(settings)
+
+
+def get_session() -> requests.Session:
+    """Returns the process-wide keep-alive session shared by every downloader and client."""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _build_session(_settings)
+        return _session
+
+
+def get_settings() -> HttpSettings:
+    return _settings
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    kwargs.setdefault("timeout", _settings.timeout)
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    kwargs.setdefault("timeout", _settings.timeout)
+    return get_session().post(url, **kwargs)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_END = ",]}" + _WHITESPACE
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonArrayStream:
+    """
+    Iterates the elements of one JSON array while the document is still arriving.
+
+    key names the array as a member of a top-level object ({"features": [...]});
+    None means the document itself is the array. Each element is decoded with
+    json.JSONDecoder.raw_decode as soon as its closing bracket has been read, and
+    consumed text is dropped, so only the element being decoded is held in memory.
+    The object's other members are collected in members as they are passed, which
+    makes members that precede the array available while it is being iterated.
+    A document without the array yields nothing, like payload.get(key, []).
+    """
+
+    def __init__(self, chunks: Iterable[bytes | str], key: str | None = None) -> None:
+        self._chunks = iter(chunks)
+        self._key = key
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._started = False
+        self.members: dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise JsonStreamError("JsonArrayStream can only be iterated once")
+        self._started = True
+        if self._key is None:
+            self._expect("[")
+            yield from self._iter_elements()
+            self._expect_end()
+            return
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                name = self._decode_value()
+                if not isinstance(name, str):
+                    raise JsonStreamError("Object keys must be strings")
+                self._expect(":")
+                if name == self._key and self._peek() == "[":
+                    self._pos += 1
+                    yield from self._iter_elements()
+                else:
+                    self.members[name] = self._decode_value()
+                if self._expect(",", "}") == "}":
+                    break
+        self._expect_end()
+
+    def _iter_elements(self) -> Iterator[Any]:
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            self._compact()
+            if self._expect(",", "]") == "]":
+                return
+
+    def _fill(self) -> bool:
+        """Reads another chunk into the buffer; False once the stream is exhausted."""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            self._buffer += self._text_decoder.decode(b"", final=True)
+            return False
+        self._buffer += chunk if isinstance(chunk, str) else self._text_decoder.decode(chunk)
+        return True
+
+    def _compact(self) -> None:
+        if self._pos > 65536 and self._pos * 2 > len(self._buffer):
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            self._buffer, self._pos = "", 0
+            if not self._fill():
+                raise JsonStreamError("Unexpected end of JSON document")
+
+    def _expect(self, *tokens: str) -> str:
+        token = self._peek()
+        if token not in tokens:
+            raise JsonStreamError(f"Expected {' or '.join(tokens)}, found {token!r}")
+        self._pos += 1
+        return token
+
+    def _expect_end(self) -> None:
+        try:
+            token = self._peek()
+        except JsonStreamError:
+            return
+        raise JsonStreamError(f"Unexpected trailing data {token!r}")
+
+    def _is_complete(self, value: Any, end: int) -> bool:
+        # A number is only known to be whole once a delimiter follows it; "12" may be
+        # the start of "1234" or "12e3" in the next chunk.
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return end < len(self._buffer) and self._buffer[end] in _NUMBER_END
+        return True
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                value, end = None, None
+            if end is not None and (self._eof or self._is_complete(value, end)):
+                self._pos = end
+                return value
+            # Quadruple the unread text so a large value is re-scanned only a few times.
+            target = len(self._buffer) + 3 * (len(self._buffer) - self._pos)
+            while len(self._buffer) < target and self._fill():
+                pass
+            if self._eof and end is None:
+                try:
+                    value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError as exc:
+                    raise JsonStreamError(f"Invalid JSON value: {exc}") from exc
+                self._pos = end
+                return value
+
+
+def iter_json_array(chunks: Iterable[bytes | str], key: str | None = None) -> Iterator[Any]:
+    """Yields the elements of the key array (or of a top-level array) from chunks."""
+    return iter(JsonArrayStream(chunks, key))
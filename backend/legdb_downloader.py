@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Sequence
 
-from backend.downloader import download_files, download_file
+import requests
+
+from backend.downloader import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PER_HOST_LIMIT,
+    DownloadJob,
+    download_file,
+    download_files,
+    download_many,
+    fetch_index_html,
+    resolve_download_url,
+)
+from backend.http_cache import HttpCache
 
 
 def download_legdb_session(
@@ -12,17 +25,82 @@ def download_legdb_session(
     year: int,
     filenames: Iterable[str],
     destination: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
 ) -> list[Path]:
-    session_url = f"{base_url.rstrip('/')}/{year}data"
+    session_url = _session_url(base_url, year)
     destination.mkdir(parents=True, exist_ok=True)
-    downloaded = download_files(session_url, filenames, destination)
-    _download_optional_readme(session_url, destination)
+    downloaded = download_files(session_url, filenames, destination, chunk_size, cache)
+    _download_optional_readme(session_url, destination, chunk_size, cache)
     return downloaded
 
 
-def _download_optional_readme(session_url: str, destination: Path) -> None:
+def download_legdb_sessions(
+    base_url: str,
+    years: Sequence[int],
+    filenames: Iterable[str],
+    destination: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+) -> list[Path]:
+    """
+    Downloads every year's files (into destination/<year>) as one bounded-parallel batch.
+
+    Each session's optional Readme.txt is fetched alongside its files.
+    """
+    if not years:
+        return []
+    filenames = tuple(filenames)
+    session_urls = [_session_url(base_url, year) for year in years]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(years)))) as executor:
+        index_pages = list(executor.map(fetch_index_html, session_urls))
+
+    jobs: list[DownloadJob] = []
+    for year, session_url, index_html in zip(years, session_urls, index_pages):
+        year_dir = destination / str(year)
+        for filename in filenames:
+            jobs.append(
+                DownloadJob(
+                    url=resolve_download_url(session_url, index_html, filename),
+                    target_path=year_dir / filename,
+                )
+            )
+        jobs.append(
+            DownloadJob(
+                url=f"{session_url}/Readme.txt",
+                target_path=year_dir / "Readme.txt",
+                optional=True,
+            )
+        )
+    downloaded = download_many(
+        jobs,
+        chunk_size,
+        cache,
+        max_workers=max_workers,
+        per_host_limit=per_host_limit,
+    )
+    return [
+        path
+        for job, path in zip(jobs, downloaded)
+        if path is not None and not job.optional
+    ]
+
+
+def _session_url(base_url: str, year: int) -> str:
+    return f"{base_url.rstrip('/')}/{year}data"
+
+
+def _download_optional_readme(
+    session_url: str,
+    destination: Path,
+    chunk_size: int,
+    cache: HttpCache | None,
+) -> None:
     readme_url = f"{session_url}/Readme.txt"
     try:
-        download_file(readme_url, destination)
-    except urllib.error.HTTPError:
+        download_file(readme_url, destination, chunk_size, cache)
+    except requests.HTTPError:
         return
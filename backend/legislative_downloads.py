@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import urllib.parse
-import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable, Iterator, Sequence
 
-from backend.downloader import download_file
+from backend import http_client
+from backend.downloader import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_WORKERS,
+    download_file,
+    stream_to_path,
+)
+from backend.http_cache import HttpCache
+from backend.json_stream import JsonStreamError, iter_json_array
 
 
 @dataclass(frozen=True)
@@ -20,24 +31,99 @@ class DownloadEntry:
     download_type: str
 
 
+@dataclass(frozen=True)
+class ZipMember:
+    """
+    A file inside a ZIP archive that parsers can use in place of a Path.
+
+    Supports the exists()/open() subset of the Path API the parsers rely on; the
+    member is decompressed and decoded lazily as it is read.
+    """
+
+    archive: Path
+    name: str
+
+    def exists(self) -> bool:
+        with zipfile.ZipFile(self.archive) as archive:
+            return self.name in archive.NameToInfo
+
+    def open(
+        self,
+        mode: str = "r",
+        encoding: str | None = None,
+        errors: str | None = None,
+        newline: str | None = None,
+    ) -> IO:
+        # The member keeps its own reference to the archive file handle, so the
+        # ZipFile can be closed as soon as the member is open.
+        with zipfile.ZipFile(self.archive) as archive:
+            member = archive.open(self.name)
+        if "b" in mode:
+            return member
+        return io.TextIOWrapper(member, encoding=encoding, errors=errors, newline=newline)
+
+    def read_text(self, encoding: str | None = None, errors: str | None = None) -> str:
+        with self.open("r", encoding=encoding, errors=errors) as f:
+            return f.read()
+
+
+@dataclass(frozen=True)
+class ArchiveManifest:
+    """What was last downloaded for a session archive, as recorded next to it."""
+
+    name: str
+    date_modified: str
+    sha256: str
+
+    @classmethod
+    def load(cls, path: Path) -> ArchiveManifest | None:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return cls(
+                name=payload["name"],
+                date_modified=payload["date_modified"],
+                sha256=payload["sha256"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def write(self, path: Path) -> None:
+        payload = {"name": self.name, "date_modified": self.date_modified, "sha256": self.sha256}
+        path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+
+
+@dataclass(frozen=True)
+class SessionArchive:
+    path: Path
+    entry: DownloadEntry
+    sha256: str
+    unchanged: bool
+
+
+MANIFEST_FILENAME = "manifest.json"
+UPLOADED_MANIFEST_FILENAME = "uploaded.json"
+
+
 class LegislativeDownloadError(RuntimeError):
     pass
 
 
-def _fetch_json(url: str) -> list[dict]:
-    with urllib.request.urlopen(url) as response:
-        payload = json.loads(response.read().decode("utf-8"))
-    if not isinstance(payload, list):
-        raise LegislativeDownloadError("Unexpected API response format")
-    return payload
+def _fetch_json(url: str) -> Iterator[dict]:
+    """Streams the elements of the API's top-level JSON array as they are decoded."""
+    with http_client.get(url, stream=True) as response:
+        response.raise_for_status()
+        try:
+            yield from iter_json_array(response.iter_content(DEFAULT_CHUNK_SIZE))
+        except JsonStreamError as exc:
+            raise LegislativeDownloadError("Unexpected API response format") from exc
 
 
 def fetch_download_path(base_url: str, download_type: str) -> str:
     url = f"{base_url.rstrip('/')}/api/downloads/bills/{urllib.parse.quote(download_type)}"
-    payload = _fetch_json(url)
-    if not payload:
+    first = next(iter(_fetch_json(url)), None)
+    if first is None:
         raise LegislativeDownloadError("No download path returned from API")
-    download_path = payload[0].get("Download_Path")
+    download_path = first.get("Download_Path")
     if not download_path:
         raise LegislativeDownloadError("Download_Path missing in API response")
     return download_path
@@ -56,9 +142,8 @@ def list_download_entries(
         f"{base_url.rstrip('/')}/api/downloads/{encoded_path}/"
         f"{pub_host}/{urllib.parse.quote(download_type)}"
     )
-    payload = _fetch_json(url)
     entries: list[DownloadEntry] = []
-    for entry in payload:
+    for entry in _fetch_json(url):
         entries.append(
             DownloadEntry(
                 name=entry.get("FileName", ""),
@@ -79,6 +164,21 @@ def select_session_directory(entries: Iterable[DownloadEntry], session_year: int
     raise LegislativeDownloadError(f"Session directory {target} not found")
 
 
+def _find_entry(entries: Iterable[DownloadEntry], name: str) -> DownloadEntry:
+    for entry in entries:
+        if entry.name == name:
+            return entry
+    raise LegislativeDownloadError(f"Entry {name} not found in listing")
+
+
+def _sha256_file(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(partial(f.read, chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def select_text_zip(entries: Iterable[DownloadEntry], session_year: int) -> str:
     preferred = f"DB{session_year}_TEXT.zip"
     for entry in entries:
@@ -90,37 +190,194 @@ def select_text_zip(entries: Iterable[DownloadEntry], session_year: int) -> str:
     raise LegislativeDownloadError("No downloadable ZIP found for session")
 
 
-def download_bill_tracking_session(
+def fetch_bill_tracking_archive(
     *,
     base_url: str,
     pub_base_url: str,
     download_type: str,
     session_year: int,
     destination: Path,
-    required_files: Iterable[str],
-) -> list[Path]:
-    destination.mkdir(parents=True, exist_ok=True)
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+) -> SessionArchive:
+    """
+    Makes sure destination holds the current session archive.
+
+    A manifest of the last download (listing name, DateModified and sha256) is kept in
+    destination. When the listing entry still matches it and the archive on disk still
+    hashes to the recorded value, the download is skipped. The returned archive is
+    flagged unchanged when its contents match the last archive passed to
+    record_archive_uploaded, so a run that fails after downloading is not mistaken
+    for one whose rows were uploaded.
+    """
     download_path = fetch_download_path(base_url, download_type)
     root_entries = list_download_entries(base_url, download_path, download_type, pub_base_url)
+    return _fetch_session_archive(
+        base_url=base_url,
+        pub_base_url=pub_base_url,
+        download_type=download_type,
+        download_path=download_path,
+        root_entries=root_entries,
+        session_year=session_year,
+        destination=destination,
+        chunk_size=chunk_size,
+        cache=cache,
+    )
+
+
+def fetch_bill_tracking_archives(
+    *,
+    base_url: str,
+    pub_base_url: str,
+    download_type: str,
+    session_years: Sequence[int],
+    destination_root: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[int, SessionArchive]:
+    """
+    Fetches every session year's archive into destination_root/<year> concurrently.
+
+    The download path and root listing are fetched once and shared by all years.
+    """
+    download_path = fetch_download_path(base_url, download_type)
+    root_entries = list_download_entries(base_url, download_path, download_type, pub_base_url)
+
+    def fetch(session_year: int) -> SessionArchive:
+        return _fetch_session_archive(
+            base_url=base_url,
+            pub_base_url=pub_base_url,
+            download_type=download_type,
+            download_path=download_path,
+            root_entries=root_entries,
+            session_year=session_year,
+            destination=destination_root / str(session_year),
+            chunk_size=chunk_size,
+            cache=cache,
+        )
+
+    years = list(dict.fromkeys(session_years))
+    if not years:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(years)))) as executor:
+        archives = list(executor.map(fetch, years))
+    return dict(zip(years, archives))
+
+
+def _fetch_session_archive(
+    *,
+    base_url: str,
+    pub_base_url: str,
+    download_type: str,
+    download_path: str,
+    root_entries: list[DownloadEntry],
+    session_year: int,
+    destination: Path,
+    chunk_size: int,
+    cache: HttpCache | None,
+) -> SessionArchive:
+    destination.mkdir(parents=True, exist_ok=True)
     session_dir = select_session_directory(root_entries, session_year)
     session_path = f"{download_path.rstrip('/')}/{session_dir}"
     session_entries = list_download_entries(
         base_url, session_path, download_type, pub_base_url
     )
     zip_name = select_text_zip(session_entries, session_year)
+    entry = _find_entry(session_entries, zip_name)
+
+    manifest_path = destination / MANIFEST_FILENAME
+    manifest = ArchiveManifest.load(manifest_path)
+    uploaded = ArchiveManifest.load(destination / UPLOADED_MANIFEST_FILENAME)
+    zip_path = destination / zip_name
+    if (
+        manifest is not None
+        and entry.date_modified
+        and manifest.name == entry.name
+        and manifest.date_modified == entry.date_modified
+        and zip_path.exists()
+        and _sha256_file(zip_path, chunk_size) == manifest.sha256
+    ):
+        unchanged = _matches_upload(uploaded, entry, manifest.sha256)
+        return SessionArchive(path=zip_path, entry=entry, sha256=manifest.sha256, unchanged=unchanged)
+
     zip_url = (
         f"{pub_base_url.rstrip('/')}/{download_path.strip('/')}/"
         f"{session_dir}/{zip_name}"
     )
-    zip_path = download_file(zip_url, destination)
-    extracted_paths: list[Path] = []
-    with zipfile.ZipFile(zip_path) as archive:
-        archive.extractall(destination)
-        extracted_paths = [destination / name for name in archive.namelist()]
+    zip_path = download_file(zip_url, destination, chunk_size, cache)
+    sha256 = _sha256_file(zip_path, chunk_size)
+    ArchiveManifest(name=entry.name, date_modified=entry.date_modified, sha256=sha256).write(
+        manifest_path
+    )
+    unchanged = _matches_upload(uploaded, entry, sha256)
+    return SessionArchive(path=zip_path, entry=entry, sha256=sha256, unchanged=unchanged)
+
+
+def _matches_upload(uploaded: ArchiveManifest | None, entry: DownloadEntry, sha256: str) -> bool:
+    return uploaded is not None and uploaded.name == entry.name and uploaded.sha256 == sha256
+
 
-    missing = [name for name in required_files if not (destination / name).exists()]
+def record_archive_uploaded(archive: SessionArchive) -> None:
+    """
+    Records that the rows parsed from archive have been uploaded, so the next fetch
+    of the same contents comes back flagged unchanged.
+    """
+    ArchiveManifest(
+        name=archive.entry.name,
+        date_modified=archive.entry.date_modified,
+        sha256=archive.sha256,
+    ).write(archive.path.parent / UPLOADED_MANIFEST_FILENAME)
+
+
+def open_archive_members(zip_path: Path, required_files: Iterable[str]) -> dict[str, ZipMember]:
+    """Returns a ZipMember per required file, without extracting anything."""
+    required = list(required_files)
+    with zipfile.ZipFile(zip_path) as archive:
+        names = set(archive.namelist())
+    missing = [name for name in required if name not in names]
     if missing:
         raise LegislativeDownloadError(
-            f"Missing required files after extraction: {', '.join(missing)}"
+            f"Missing required files in {zip_path.name}: {', '.join(missing)}"
         )
-    return extracted_paths
+    return {name: ZipMember(zip_path, name) for name in required}
+
+
+def extract_members(
+    members: Iterable[ZipMember],
+    destination: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[Path]:
+    destination.mkdir(parents=True, exist_ok=True)
+    extracted: list[Path] = []
+    for member in members:
+        target_path = destination / Path(member.name).name
+        with member.open("rb") as source:
+            stream_to_path(iter(partial(source.read, chunk_size), b""), target_path)
+        extracted.append(target_path)
+    return extracted
+
+
+def download_bill_tracking_session(
+    *,
+    base_url: str,
+    pub_base_url: str,
+    download_type: str,
+    session_year: int,
+    destination: Path,
+    required_files: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+) -> list[Path]:
+    """Downloads the session archive and extracts only the required members next to it."""
+    archive = fetch_bill_tracking_archive(
+        base_url=base_url,
+        pub_base_url=pub_base_url,
+        download_type=download_type,
+        session_year=session_year,
+        destination=destination,
+        chunk_size=chunk_size,
+        cache=cache,
+    )
+    members = open_archive_members(archive.path, required_files)
+    return extract_members(members.values(), destination, chunk_size)
@@ -0,0 +1,3 @@
+-- Generalized district geometry stored next to the full-resolution geometry_json
+ALTER TABLE public.districts ADD COLUMN IF NOT EXISTS geometry_generalized_json jsonb;
+ALTER TABLE public.draft_districts ADD COLUMN IF NOT EXISTS geometry_generalized_json jsonb;
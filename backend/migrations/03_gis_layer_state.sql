@@ -0,0 +1,8 @@
+-- Last seen ArcGIS editingInfo.lastEditDate and feature-set hash per layer,
+-- used by the GIS ingest to skip unchanged layers
+CREATE TABLE IF NOT EXISTS public.gis_layer_state (
+  layer_url text PRIMARY KEY,
+  last_edit_date bigint,
+  features_sha256 text,
+  updated_at timestamptz NOT NULL DEFAULT now()
+);
@@ -0,0 +1,3 @@
+-- sha256 of the normalized, fixed-precision WKB of each district geometry,
+-- compared instead of ST_Equals to detect unchanged districts
+ALTER TABLE public.legislative_districts ADD COLUMN IF NOT EXISTS geom_fingerprint text;
@@ -0,0 +1,20 @@
+-- Spatio-temporal index for as-of-date district lookups: geometry plus the
+-- validity range of each SCD2 version (open-ended while valid_to is null).
+-- valid_to is inclusive, so the range runs to valid_to + 1 exclusive. A version
+-- closed on the day it opened has valid_to = valid_from - 1 and an empty range,
+-- where daterange(valid_from, valid_to, '[]') would raise.
+DROP INDEX IF EXISTS public.idx_legislative_districts_geom_validity;
+CREATE INDEX IF NOT EXISTS idx_legislative_districts_geom_validity
+  ON public.legislative_districts
+  USING GIST (geom, daterange(valid_from, valid_to + 1));
+
+-- Districts containing a point on a given date; the predicates match the index
+-- expression so the planner can use it for redistricting-aware joins.
+CREATE OR REPLACE FUNCTION public.legislative_districts_as_of(lon double precision, lat double precision, as_of date)
+RETURNS SETOF public.legislative_districts AS $$
+  SELECT *
+    FROM public.legislative_districts d
+   WHERE d.geom && ST_SetSRID(ST_MakePoint(lon, lat), 4326)
+     AND daterange(d.valid_from, d.valid_to + 1) @> as_of
+     AND ST_Intersects(d.geom, ST_SetSRID(ST_MakePoint(lon, lat), 4326));
+$$ LANGUAGE sql STABLE;
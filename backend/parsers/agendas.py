@@ -2,20 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .utils import normalize_string, parse_date, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records, finish_records, new_records
 
+from .utils import normalize_string, parse_date, iter_csv_robust, convert_csv_issue
 
-def parse_agendas(path: Path) -> tuple[list[dict], list[dict]]:
+
+def parse_agendas(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the AGENDAS.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "agendas") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         comm_house = normalize_string(row.get("CommHouse"))
         date_str = row.get("Date")
         time_str = normalize_string(row.get("Time"))
@@ -45,20 +49,23 @@ def parse_agendas(path: Path) -> tuple[list[dict], list[dict]]:
                 "description": normalize_string(row.get("Description")),
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "agendas") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
 
 
-def parse_agenda_bills(path: Path) -> tuple[list[dict], list[dict]]:
+def parse_agenda_bills(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the BAGENDA.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "agenda_bills") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         comm_house = normalize_string(row.get("CommHouse"))
         date_str = row.get("Date")
         time_str = normalize_string(row.get("Time"))
@@ -100,20 +107,23 @@ def parse_agenda_bills(path: Path) -> tuple[list[dict], list[dict]]:
                 "bill_key": bill_key,
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "agenda_bills") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
 
 
-def parse_agenda_nominees(path: Path) -> tuple[list[dict], list[dict]]:
+def parse_agenda_nominees(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the NAGENDA.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "agenda_nominees") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         comm_house = normalize_string(row.get("CommHouse"))
         date_str = row.get("Date")
         time_str = normalize_string(row.get("Time"))
@@ -142,4 +152,5 @@ def parse_agenda_nominees(path: Path) -> tuple[list[dict], list[dict]]:
                 "position": normalize_string(row.get("Position")),
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "agenda_nominees") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
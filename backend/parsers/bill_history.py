@@ -1,65 +1,72 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from pathlib import Path
 
-from .utils import normalize_string, parse_date, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records
 
+from .utils import normalize_string, iter_csv_robust, convert_csv_issue
 
-def parse_bill_history(path: Path) -> tuple[list[dict], list[dict]]:
+# Left as raw cells by _history_record and parsed column by column.
+HISTORY_DATE_FIELDS = ("date",)
+
+
+def parse_bill_history(
+    path: Path, columnar: bool = False, max_workers: int = 1, executor: Executor | None = None
+) -> tuple[Records, list[dict]]:
     """
     Parses the BILLHIST.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    stream = iter_csv_robust(path, max_workers=max_workers, executor=executor)
+    records, issues = stream.convert_rows(_history_record, columnar, HISTORY_DATE_FIELDS)
+    csv_issues = [convert_csv_issue(i, "bill_history") for i in stream.issues]
+    return records, csv_issues + issues
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "bill_history") for i in parse_result.issues]
 
-    for row in parse_result.rows:
-        bill_type = normalize_string(row.get("BillType"))
-        bill_number = normalize_string(row.get("BillNumber"))
-        action = normalize_string(row.get("Action"))
-        date_str = row.get("Date")
+def _history_record(row: dict[str, str], issues: list[dict]) -> dict | None:
+    """One BILLHIST row as a bill_history record; runs in the parse workers."""
+    bill_type = normalize_string(row.get("BillType"))
+    bill_number = normalize_string(row.get("BillNumber"))
+    action = normalize_string(row.get("Action"))
+    date_str = row.get("Date")
 
-        if not bill_type or not bill_number:
-            issues.append({
-                "table": "bill_history",
-                "record_key": None,
-                "issue": "missing_key_fields",
-                "details": "Missing BillType or BillNumber",
-                "raw_data": str(row)
-            })
-            continue
+    if not bill_type or not bill_number:
+        issues.append({
+            "table": "bill_history",
+            "record_key": None,
+            "issue": "missing_key_fields",
+            "details": "Missing BillType or BillNumber",
+            "raw_data": str(row)
+        })
+        return None
 
-        try:
-            bill_number_int = int(float(bill_number))
-        except ValueError:
-            issues.append({
-                "table": "bill_history",
-                "record_key": f"{bill_type}-{bill_number}",
-                "issue": "invalid_bill_number",
-                "details": f"BillNumber '{bill_number}' is not numeric",
-                "raw_data": str(row)
-            })
-            continue
+    try:
+        bill_number_int = int(float(bill_number))
+    except ValueError:
+        issues.append({
+            "table": "bill_history",
+            "record_key": f"{bill_type}-{bill_number}",
+            "issue": "invalid_bill_number",
+            "details": f"BillNumber '{bill_number}' is not numeric",
+            "raw_data": str(row)
+        })
+        return None
 
-        bill_key = f"{bill_type.strip()}-{bill_number_int}"
+    bill_key = f"{bill_type.strip()}-{bill_number_int}"
 
-        action_by = normalize_string(row.get("ActionBy"))
+    action_by = normalize_string(row.get("ActionBy"))
 
-        # Unique key construction
-        bill_history_key = f"{bill_key}-{date_str}-{action}-{action_by}"[:255]
+    # Unique key construction
+    bill_history_key = f"{bill_key}-{date_str}-{action}-{action_by}"[:255]
 
-        records.append(
-            {
-                "bill_history_key": bill_history_key,
-                "bill_key": bill_key,
-                "bill_type": bill_type.strip(),
-                "bill_number": bill_number_int,
-                "action": action,
-                "date": parse_date(date_str),
-                "action_by": action_by,
-                "session_year": normalize_string(row.get("SessionYear")),
-            }
-        )
-    return records, issues
+    return {
+        "bill_history_key": bill_history_key,
+        "bill_key": bill_key,
+        "bill_type": bill_type.strip(),
+        "bill_number": bill_number_int,
+        "action": action,
+        "date": date_str,
+        "action_by": action_by,
+        "session_year": normalize_string(row.get("SessionYear")),
+    }
@@ -2,20 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .utils import normalize_string, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records, finish_records, new_records
 
+from .utils import normalize_string, iter_csv_robust, convert_csv_issue
 
-def parse_bill_subjects(path: Path) -> tuple[list[dict], list[dict]]:
+
+def parse_bill_subjects(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the BILLSUBJ.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "bill_subjects") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         bill_type = normalize_string(row.get("BillType"))
         bill_number = normalize_string(row.get("BillNumber"))
         subject_code = normalize_string(row.get("SubjectKey"))
@@ -52,4 +56,5 @@ def parse_bill_subjects(path: Path) -> tuple[list[dict], list[dict]]:
                 "subject_code": subject_code,
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "bill_subjects") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
@@ -1,65 +1,72 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from pathlib import Path
 
-from .utils import normalize_string, parse_date, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records
 
+from .utils import normalize_string, iter_csv_robust, convert_csv_issue
 
-def parse_bill_sponsors(path: Path) -> tuple[list[dict], list[dict]]:
+# Left as raw cells by _sponsor_record and parsed column by column.
+SPONSOR_DATE_FIELDS = ("spon_date", "with_date", "mod_date")
+
+
+def parse_bill_sponsors(
+    path: Path, columnar: bool = False, max_workers: int = 1, executor: Executor | None = None
+) -> tuple[Records, list[dict]]:
     """
     Parses the BILLSPON.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    stream = iter_csv_robust(path, max_workers=max_workers, executor=executor)
+    records, issues = stream.convert_rows(_sponsor_record, columnar, SPONSOR_DATE_FIELDS)
+    csv_issues = [convert_csv_issue(i, "bill_sponsors") for i in stream.issues]
+    return records, csv_issues + issues
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "bill_sponsors") for i in parse_result.issues]
 
-    for row in parse_result.rows:
-        bill_type = normalize_string(row.get("BillType"))
-        bill_number = normalize_string(row.get("BillNumber"))
-        sequence = normalize_string(row.get("Sequence"))
+def _sponsor_record(row: dict[str, str], issues: list[dict]) -> dict | None:
+    """One BILLSPON row as a bill_sponsors record; runs in the parse workers."""
+    bill_type = normalize_string(row.get("BillType"))
+    bill_number = normalize_string(row.get("BillNumber"))
+    sequence = normalize_string(row.get("Sequence"))
 
-        if not bill_type or not bill_number or not sequence:
-            issues.append({
-                "table": "bill_sponsors",
-                "record_key": None,
-                "issue": "missing_key_fields",
-                "details": "Missing BillType, BillNumber, or Sequence",
-                "raw_data": str(row)
-            })
-            continue
+    if not bill_type or not bill_number or not sequence:
+        issues.append({
+            "table": "bill_sponsors",
+            "record_key": None,
+            "issue": "missing_key_fields",
+            "details": "Missing BillType, BillNumber, or Sequence",
+            "raw_data": str(row)
+        })
+        return None
 
-        try:
-            bill_number_int = int(float(bill_number))
-            sequence_int = int(float(sequence))
-        except ValueError:
-            issues.append({
-                "table": "bill_sponsors",
-                "record_key": f"{bill_type}-{bill_number}-{sequence}",
-                "issue": "invalid_numeric_field",
-                "details": f"BillNumber '{bill_number}' or Sequence '{sequence}' is not numeric",
-                "raw_data": str(row)
-            })
-            continue
+    try:
+        bill_number_int = int(float(bill_number))
+        sequence_int = int(float(sequence))
+    except ValueError:
+        issues.append({
+            "table": "bill_sponsors",
+            "record_key": f"{bill_type}-{bill_number}-{sequence}",
+            "issue": "invalid_numeric_field",
+            "details": f"BillNumber '{bill_number}' or Sequence '{sequence}' is not numeric",
+            "raw_data": str(row)
+        })
+        return None
 
-        bill_key = f"{bill_type.strip()}-{bill_number_int}"
-        sponsor = normalize_string(row.get("Sponsor"))
-        bill_sponsor_key = f"{bill_key}-{sequence_int}"
+    bill_key = f"{bill_type.strip()}-{bill_number_int}"
+    sponsor = normalize_string(row.get("Sponsor"))
+    bill_sponsor_key = f"{bill_key}-{sequence_int}"
 
-        records.append(
-            {
-                "bill_sponsor_key": bill_sponsor_key,
-                "bill_key": bill_key,
-                "bill_type": bill_type.strip(),
-                "bill_number": bill_number_int,
-                "sequence": sequence_int,
-                "sponsor": sponsor,
-                "sponsor_type": normalize_string(row.get("Type")),
-                "status": normalize_string(row.get("Status")),
-                "spon_date": parse_date(row.get("SponDate")),
-                "with_date": parse_date(row.get("WithDate")),
-                "mod_date": parse_date(row.get("ModDate")),
-            }
-        )
-    return records, issues
+    return {
+        "bill_sponsor_key": bill_sponsor_key,
+        "bill_key": bill_key,
+        "bill_type": bill_type.strip(),
+        "bill_number": bill_number_int,
+        "sequence": sequence_int,
+        "sponsor": sponsor,
+        "sponsor_type": normalize_string(row.get("Type")),
+        "status": normalize_string(row.get("Status")),
+        "spon_date": row.get("SponDate"),
+        "with_date": row.get("WithDate"),
+        "mod_date": row.get("ModDate"),
+    }
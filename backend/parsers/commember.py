@@ -2,20 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .utils import normalize_string, parse_date, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records, finish_records, new_records
 
+from .utils import normalize_string, parse_date, iter_csv_robust, convert_csv_issue
 
-def parse_committee_members(path: Path) -> tuple[list[dict], list[dict]]:
+
+def parse_committee_members(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the COMEMBER.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "committee_members") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         code = normalize_string(row.get("Code"))
         member = normalize_string(row.get("Member"))
         assignment = normalize_string(row.get("Assignment_to_Committee"))
@@ -46,4 +50,5 @@ def parse_committee_members(path: Path) -> tuple[list[dict], list[dict]]:
                 "mod_date": parse_date(row.get("ModDate")),
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "committee_members") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
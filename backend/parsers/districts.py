@@ -1,18 +1,31 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Iterable
 
 
-def parse_districts(feature_collection: dict[str, Any]) -> tuple[list[dict], list[dict]]:
+def parse_districts(
+    features: Iterable[dict[str, Any]],
+    generalized_features: Iterable[dict[str, Any]] | None = None,
+) -> tuple[list[dict], list[dict]]:
     """
-    Parses GeoJSON features into district records.
+    Parses GeoJSON features, read one at a time, into district records.
+    When generalized_features is given, each record also carries the generalized
+    geometry of the matching district as geometry_generalized_json.
     Returns (valid_records, issues).
     """
     records: list[dict] = []
     issues: list[dict] = []
+    generalized_geometries: dict[str, Any] | None = None
+    if generalized_features is not None:
+        generalized_geometries = {}
+        for feature in generalized_features:
+            properties = feature.get("properties", {})
+            district_number = _extract_district_number(properties)
+            key = str(district_number) if district_number is not None else _fallback_key(properties)
+            generalized_geometries[key] = feature.get("geometry")
 
-    for feature in feature_collection.get("features", []):
+    for feature in features:
         properties = feature.get("properties", {})
         district_number = _extract_district_number(properties)
         name = _extract_name(properties)
@@ -34,15 +47,19 @@ def parse_districts(feature_collection: dict[str, Any]) -> tuple[list[dict], lis
              district_key = fallback
 
         geometry_json = json.dumps(feature.get("geometry"), sort_keys=True)
-        records.append(
-            {
-                "district_key": district_key,
-                "district_number": district_number,
-                "name": name,
-                "properties": properties,
-                "geometry_json": geometry_json,
-            }
-        )
+        record = {
+            "district_key": district_key,
+            "district_number": district_number,
+            "name": name,
+            "properties": properties,
+            "geometry_json": geometry_json,
+        }
+        if generalized_geometries is not None:
+            generalized = generalized_geometries.get(district_key)
+            record["geometry_generalized_json"] = (
+                json.dumps(generalized, sort_keys=True) if generalized is not None else None
+            )
+        records.append(record)
     return records, issues
 
 
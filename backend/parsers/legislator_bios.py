@@ -2,20 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .utils import normalize_string, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records, finish_records, new_records
 
+from .utils import normalize_string, iter_csv_robust, convert_csv_issue
 
-def parse_legislator_bios(path: Path) -> tuple[list[dict], list[dict]]:
+
+def parse_legislator_bios(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the LEGBIO.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "legislator_bios") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         roster_key = normalize_string(row.get("Roster Key"))
         if not roster_key:
             issues.append({
@@ -44,4 +48,5 @@ def parse_legislator_bios(path: Path) -> tuple[list[dict], list[dict]]:
                 "bio_text": normalize_string(row.get("Bio")),
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "legislator_bios") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
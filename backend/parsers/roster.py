@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .utils import normalize_string, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records, finish_records, new_records
+
+from .utils import normalize_string, iter_csv_robust, convert_csv_issue
 
 
 HOUSE_MAP = {
@@ -11,17 +13,19 @@ HOUSE_MAP = {
 }
 
 
-def parse_roster(path: Path) -> tuple[list[dict], list[dict]]:
+def parse_roster(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the ROSTER.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "legislators") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         roster_key = normalize_string(row.get("Roster Key"))
         if not roster_key:
             issues.append({
@@ -83,4 +87,5 @@ def parse_roster(path: Path) -> tuple[list[dict], list[dict]]:
                 "email": normalize_string(row.get("Email")),
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "legislators") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
@@ -2,20 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .utils import normalize_string, parse_csv_robust, convert_csv_issue
+from backend.columnar import Records, finish_records, new_records
 
+from .utils import normalize_string, iter_csv_robust, convert_csv_issue
 
-def parse_subject_headings(path: Path) -> tuple[list[dict], list[dict]]:
+
+def parse_subject_headings(
+    path: Path, columnar: bool = False, max_workers: int = 1
+) -> tuple[Records, list[dict]]:
     """
     Parses the SUBJHEADINGS.TXT file.
     Returns (valid_records, issues).
     """
-    records: list[dict] = []
+    records = new_records(columnar)
 
-    parse_result = parse_csv_robust(path)
-    issues = [convert_csv_issue(i, "subject_headings") for i in parse_result.issues]
+    stream = iter_csv_robust(path, max_workers=max_workers)
+    issues: list[dict] = []
 
-    for row in parse_result.rows:
+    for _, row in stream:
         subj_abbrev = normalize_string(row.get("SubjAbbrev"))
         if not subj_abbrev:
             issues.append({
@@ -33,4 +37,5 @@ def parse_subject_headings(path: Path) -> tuple[list[dict], list[dict]]:
                 "description": normalize_string(row.get("Description")),
             }
         )
-    return records, issues
+    csv_issues = [convert_csv_issue(i, "subject_headings") for i in stream.issues]
+    return finish_records(records), csv_issues + issues
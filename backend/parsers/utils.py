@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import csv
+import multiprocessing
+import re
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from backend.columnar import Records, finish_records, new_records
 
 
 def normalize_string(value: str | None) -> str | None:
@@ -14,13 +23,49 @@ def normalize_string(value: str | None) -> str | None:
     return cleaned if cleaned else None
 
 
+# Worker processes are spawned rather than forked: the pools are also started from
+# the API's background sync thread, and forking a threaded process can deadlock.
+PROCESS_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# Physical lines per run when a CSV file is parsed on several processes.
+CSV_CHUNK_LINES = 20000
+
+# Turns a parsed row into a table record, appending any problems with the row to the
+# issue list; returning None drops the row. Converters run inside the worker
+# processes, so they must be module-level functions, and every record they return
+# has the same keys in the same order. Date fields are left as the raw cells and
+# converted a column at a time afterwards (see convert_rows).
+RowConverter = Callable[[Dict[str, str], List[Dict[str, Any]]], Optional[Dict[str, Any]]]
+
+DATE_FORMATS = ("%m/%d/%Y %H:%M:%S", "%m/%d/%Y")
+DATE_CACHE_SIZE = 8192
+
+# The shape of nearly every NJLEG date cell: 3/20/2024 0:00:00 (time optional).
+_NJLEG_TIMESTAMP = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})(?: (\d{1,2}):(\d{2}):(\d{2}))?")
+
+
 def parse_date(value: str | None) -> Optional[str]:
+    """ISO date for an NJLEG date or timestamp cell, or None when it is not one."""
     if value is None:
         return None
-    text = str(value).strip()
+    return _parse_date_text(str(value))
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_text(value: str) -> Optional[str]:
+    # The same few thousand dates repeat across every table, so results are memoized.
+    text = value.strip()
     if not text:
         return None
-    for fmt in ("%m/%d/%Y %H:%M:%S", "%m/%d/%Y"):
+    match = _NJLEG_TIMESTAMP.fullmatch(text)
+    if match:
+        month, day, year, hour, minute, second = match.groups()
+        if hour is None or (int(hour) < 24 and int(minute) < 60 and int(second) < 60):
+            try:
+                return date(int(year), int(month), int(day)).isoformat()
+            except ValueError:
+                return None
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(text, fmt).date().isoformat()
         except ValueError:
@@ -28,139 +73,520 @@ def parse_date(value: str | None) -> Optional[str]:
     return None
 
 
+def parse_dates(values: Iterable[str | None]) -> List[Optional[str]]:
+    """Column-at-a-time parse_date: each distinct value in the column is converted once."""
+    converted: Dict[str | None, Optional[str]] = {}
+    result: List[Optional[str]] = []
+    for value in values:
+        if value not in converted:
+            converted[value] = parse_date(value)
+        result.append(converted[value])
+    return result
+
+
 @dataclass
 class CsvParseResult:
     rows: List[Dict[str, str]] = field(default_factory=list)
     issues: List[Dict[str, Any]] = field(default_factory=list)
 
 
-def parse_csv_robust(
-    path: Path,
-    encoding: str = "latin1",
-    row_start_markers: Optional[List[str]] = None
-) -> CsvParseResult:
-    """
-    Parses a CSV file robustly, capturing malformed rows and attempting to fix split rows.
+class _RecordParser:
+    """Record reassembly and row parsing state, shared by CsvRowStream and chunk workers."""
 
-    Args:
-        path: Path to the CSV file.
-        encoding: File encoding.
-        row_start_markers: A list of valid strings that the first column MUST start with to be considered a new row.
-                           If provided, lines NOT starting with one of these will be treated as continuations of the previous line.
-                           Example for bills: ["S", "A", "SR", "AR", "SCR", "ACR", "SJR", "AJR"]
-    """
-    result = CsvParseResult()
-    if not path.exists():
-        return result
+    def __init__(self, reassemble: bool = False) -> None:
+        self.reassemble = reassemble
+        self.issues: List[Dict[str, Any]] = []
+        self.reconstructed_count = 0
+        self.row_count = 0
+        self.header: List[str] = []
 
-    try:
-        with path.open("r", encoding=encoding, newline="") as f:
-            all_lines = f.readlines()
-    except Exception as e:
-        result.issues.append({
+    def _read_failed(self, error: Exception) -> None:
+        self.issues.append({
             "line_num": 0,
             "raw": "",
-            "error": f"Failed to read file: {e}"
+            "error": f"Failed to read file: {error}"
         })
-        return result
-
-    if not all_lines:
-        return result
 
-    raw_lines = []
-    # Header is always the first line
-    header_line = all_lines[0].strip()
-    raw_lines.append(header_line)
+    def _physical_lines(self, f: Iterable[str]) -> Iterator[str]:
+        try:
+            yield from f
+        except Exception as e:
+            self._read_failed(e)
 
-    if row_start_markers:
-        # Smart reconstruction logic
-        current_record_parts = []
-        reconstructed_count = 0
+    def _records(self, lines: Iterator[str]) -> Iterator[str]:
+        # Header is always the first line
+        header_line = next(lines, None)
+        if header_line is None:
+            return
+        header_line = header_line.strip()
+        yield header_line
+        if not self.reassemble:
+            for line in lines:
+                stripped = line.strip()
+                if stripped:
+                    yield stripped
+            return
+        header_len = _field_count(header_line)
 
-        # Start from second line (index 1)
-        for line in all_lines[1:]:
+        # Whether the record being assembled leaves a quoted field open, and its field
+        # count, are carried forward line by line, so each physical line is scanned
+        # once however many lines the record spans. The field count is only needed
+        # when a short line might continue the record, so it is worked out then.
+        parts: List[str] = []
+        fields: Optional[int] = None
+        in_quotes = False
+        for line in lines:
             stripped = line.strip()
             if not stripped:
                 continue
-
-            # Check if this line starts a new record
-            # We check if the line STARTS with any of the markers followed by common delimiters or just the marker
-            # Actually, typically it's "S,123,..." so starts with "S" is risky if "Synopsis" starts with "S".
-            # Markers should be distinct.
-            # For bills: S, A, etc. usually followed by a comma if it's a CSV.
-            # But the raw line might be quoted: "S",...
-            # We'll stick to simple startswith for now as provided by the user's heuristic.
-            is_new_record = any(stripped.startswith(m) for m in row_start_markers)
-
-            if is_new_record:
-                # Flush previous record if exists
-                if current_record_parts:
-                    # Join with space to recover from newline split
-                    full_line = " ".join(current_record_parts)
-                    raw_lines.append(full_line)
-                    if len(current_record_parts) > 1:
-                        reconstructed_count += 1
-                    current_record_parts = []
-
-                current_record_parts.append(stripped)
+            if in_quotes:
+                # Doubled quotes are escapes and leave the quoted field open.
+                if '"' in stripped.replace('""', ""):
+                    # Reopening the field puts csv back where the record left it.
+                    more, in_quotes = _line_state('"' + stripped)
+                    if fields is not None:
+                        fields += more - 1
+            elif not parts or stripped.count(",") + 1 >= header_len:
+                # Quoted commas only add to the raw count, so a line with a full
+                # record's worth of commas always starts a new record.
+                if parts:
+                    yield self._flush(parts)
+                    parts = []
+                fields = None
+                in_quotes = _ends_in_quotes(stripped)
             else:
-                # Continuation
-                current_record_parts.append(stripped)
+                if fields is None:
+                    fields = _line_state(" ".join(parts))[0]
+                line_fields, line_open = _line_state(stripped)
+                if fields + line_fields - 1 > header_len:
+                    yield self._flush(parts)
+                    parts = []
+                    fields, in_quotes = line_fields, line_open
+                elif '"' in stripped:
+                    # Joined after a space, a leading quote is no longer at a field start.
+                    more, in_quotes = _line_state(" " + stripped)
+                    fields += more - 1
+                else:
+                    fields += line_fields - 1
+            parts.append(stripped)
+        if parts:
+            yield self._flush(parts)
 
-        # Flush the final record
-        if current_record_parts:
-            full_line = " ".join(current_record_parts)
-            raw_lines.append(full_line)
-            if len(current_record_parts) > 1:
-                reconstructed_count += 1
+    def _flush(self, parts: List[str]) -> str:
+        if len(parts) > 1:
+            self.reconstructed_count += 1
+        return " ".join(parts)
 
-        if reconstructed_count > 0:
+    def _note_reconstructed(self) -> None:
+        if self.reconstructed_count > 0:
             # We log this as an "issue" just so the user sees it in the report,
             # but it's actually a successful repair.
-            result.issues.append({
+            self.issues.append({
                 "line_num": 0,
-                "raw": f"Reconstructed {reconstructed_count} split records",
-                "error": "Info: Split rows detected and merged based on start markers."
+                "raw": f"Reconstructed {self.reconstructed_count} split records",
+                "error": "Info: Split rows detected and merged by quote and column tracking."
+            })
+
+    def _parse(
+        self, records: Iterator[str], line_offset: int = 0
+    ) -> Iterator[Tuple[int, Dict[str, str]]]:
+        try:
+            reader = csv.reader(records)
+            header = next(reader, None)
+        except csv.Error as e:
+            self.issues.append({
+                "line_num": 1,
+                "raw": "",
+                "error": f"Failed to parse header: {e}"
             })
+            return
+
+        if not header:
+            return
+
+        self.header = header
+        header_len = len(header)
+
+        line_num = 1 + line_offset
+        for line_num, row in enumerate(reader, start=2 + line_offset):
+            if len(row) != header_len:
+                self.issues.append({
+                    "line_num": line_num,
+                    "raw": ",".join(row),
+                    "error": f"Column mismatch: expected {header_len}, got {len(row)}"
+                })
+                continue
+            yield line_num, dict(zip(header, row))
+        self.row_count = line_num - 1 - line_offset
+
+
+class CsvRowStream(_RecordParser):
+    """
+    Lazily parsed rows of a CSV file.
+
+    Iterating reads the file one physical line at a time and yields (line_num, row)
+    for each well-formed record, where line_num counts records with the header as 1.
+    Malformed records are recorded in issues as they are met; the "Reconstructed N
+    split records" note is added once the file is exhausted. Only the record being
+    assembled is held in memory.
+
+    With reassemble, records split across physical lines are put back together in a
+    single pass (joined with a space): a line continues the record while a quoted
+    field is still open, and a line too short to be a record on its own continues
+    it when the joined record still fits the header. Otherwise every non-blank line
+    is one record.
+
+    With max_workers above 1 the file is cut into runs of about chunk_lines lines,
+    each starting at a line with a full record's worth of commas, and the runs are
+    parsed in a process pool: executor when given, shared with other files, or
+    otherwise a pool of its own. Rows and issues come back in file order with the
+    same line numbers. Should a run end inside a quoted field, the cut after it may
+    have split a record, so the rest of the file is parsed in this process.
+    convert_rows also runs the table's row conversion in the workers. Workers send
+    rows and records back as tuples of values rather than dicts.
+
+    Args:
+        path: Path to the CSV file, or any object exposing exists()/open() such as a
+              ZipMember reading straight out of the session archive.
+        encoding: File encoding.
+        max_workers: Processes used to parse the file; 1 parses it in this process.
+        chunk_lines: Physical lines per run handed to a worker.
+        reassemble: Whether to rejoin records split across lines.
+        executor: Process pool of max_workers workers to parse the runs on.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        encoding: str = "latin1",
+        max_workers: int = 1,
+        chunk_lines: int = CSV_CHUNK_LINES,
+        reassemble: bool = False,
+        executor: Executor | None = None,
+    ) -> None:
+        super().__init__(reassemble)
+        self.path = path
+        self.encoding = encoding
+        self.max_workers = max_workers
+        self.chunk_lines = chunk_lines
+        self.executor = executor
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        for segment in self._segments(None):
+            if isinstance(segment, _ChunkResult):
+                for line_num, values in segment.rows:
+                    yield line_num + segment.line_offset, dict(zip(segment.header, values))
+            else:
+                yield from segment
+
+    def convert_rows(
+        self,
+        convert: RowConverter,
+        columnar: bool = False,
+        date_fields: Tuple[str, ...] = (),
+    ) -> Tuple[Records, List[Dict[str, Any]]]:
+        """
+        Runs convert over every row and returns (records, issues), where issues are
+        the ones convert raised; parsing issues stay in self.issues. The date_fields
+        of each run of records go through parse_dates as whole columns. Records are
+        a ColumnarTable when columnar is set.
+        """
+        records = new_records(columnar)
+        issues: List[Dict[str, Any]] = []
+        for segment in self._segments((convert, date_fields)):
+            if isinstance(segment, _ChunkResult):
+                issues.extend(segment.record_issues)
+                blocks: Iterable[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]] = [
+                    (segment.record_fields, segment.records)
+                ]
+            else:
+                # Rows parsed here are converted a run's worth at a time too.
+                rows = (row for _, row in segment)
+                blocks = (
+                    _convert_rows(block, convert, date_fields, issues)
+                    for block in iter(lambda: list(islice(rows, CSV_CHUNK_LINES)), [])
+                )
+            for fields, values in blocks:
+                for record_values in values:
+                    records.append(dict(zip(fields, record_values)))
+        return finish_records(records), issues
+
+    def _segments(self, conversion: _Conversion | None) -> Iterator[_Segment]:
+        """The file as worker results and runs of rows parsed here, in file order."""
+        if not self.path.exists():
+            return
+        try:
+            f = self.path.open("r", encoding=self.encoding, newline="")
+        except Exception as e:
+            self._read_failed(e)
+            return
+        with f:
+            if self.max_workers > 1:
+                yield from self._parse_chunked(f, conversion)
+            else:
+                yield self._parse(self._records(self._physical_lines(f)))
+        self._note_reconstructed()
+
+    def _parse_chunked(self, f: IO[str], conversion: _Conversion | None) -> Iterator[_Segment]:
+        lines = iter(f)
+        try:
+            header = next(lines, None)
+        except Exception as e:
+            self._read_failed(e)
+            return
+        if header is None:
+            return
+        header_len = _field_count(header.strip())
+        chunks = _split_chunks(lines, header_len, self.chunk_lines)
+        leading = [item for item in (next(chunks, None), next(chunks, None)) if item is not None]
+        if len(leading) < 2 or not header_len or any(error for _, error in leading):
+            # Too small to split, without a usable header, or unreadable early on.
+            rest = _rejoin(leading, chunks)
+            yield self._parse(self._records(self._physical_lines(chain([header], rest))))
+            return
+
+        pending: Deque[Tuple[List[str], Optional[Future], Optional[Exception]]] = deque()
+        exhausted = False
+        line_offset = 0
+        pool = (
+            nullcontext(self.executor)
+            if self.executor is not None
+            else ProcessPoolExecutor(max_workers=self.max_workers, mp_context=PROCESS_POOL_CONTEXT)
+        )
+        with pool as executor:
+
+            def submit(chunk: List[str]) -> Future:
+                return executor.submit(_parse_chunk, header, chunk, self.reassemble, conversion)
+
+            try:
+                for chunk, _ in leading:
+                    pending.append((chunk, submit(chunk), None))
+                while pending:
+                    # Keep a bounded window of runs in flight so the file is read ahead
+                    # of the workers without being held in memory all at once.
+                    while not exhausted and len(pending) < 2 * self.max_workers:
+                        item = next(chunks, None)
+                        if item is None:
+                            exhausted = True
+                        elif item[1] is not None:
+                            pending.append((item[0], None, item[1]))
+                            exhausted = True
+                        else:
+                            pending.append((item[0], submit(item[0]), None))
+                    chunk, future, error = pending.popleft()
+                    result = future.result() if future is not None else None
+                    if result is not None and (result.closed or (exhausted and not pending)):
+                        result.line_offset = line_offset
+                        yield result
+                        for issue in result.issues:
+                            self.issues.append({**issue, "line_num": issue["line_num"] + line_offset})
+                        self.reconstructed_count += result.reconstructed_count
+                        line_offset += result.row_count
+                        continue
+                    # This run hit a read error or may end inside a quoted field that the
+                    # next run continues; every earlier run was clean, so parsing resumes
+                    # here from this run's first line.
+                    for _, later, _ in pending:
+                        if later is not None:
+                            later.cancel()
+                    entries = [(chunk, error)] + [(run_lines, err) for run_lines, _, err in pending]
+                    pending.clear()
+                    rest = _rejoin(entries, chunks)
+                    yield self._parse(
+                        self._records(self._physical_lines(chain([header], rest))), line_offset
+                    )
+                    return
+            finally:
+                # A shared pool outlives this file, so runs nobody will read are dropped.
+                for _, later, _ in pending:
+                    if later is not None:
+                        later.cancel()
+
+
+@dataclass
+class _ChunkResult:
+    # Without a converter, each row as (line_num, values) in header order; with one,
+    # each record's values in record_fields order and the issues the converter raised.
+    header: List[str]
+    rows: List[Tuple[int, Tuple[str, ...]]]
+    record_fields: Tuple[str, ...]
+    records: List[Tuple[Any, ...]]
+    record_issues: List[Dict[str, Any]]
+    issues: List[Dict[str, Any]]
+    row_count: int
+    reconstructed_count: int
+    closed: bool
+    # Rows parsed before this run, set once the run is accepted.
+    line_offset: int = 0
+
+
+# What CsvRowStream._segments yields: a worker's run, or rows parsed in this process.
+_Segment = Union[_ChunkResult, Iterator[Tuple[int, Dict[str, str]]]]
 
+# A converter and the date fields parsed from its records.
+_Conversion = Tuple[RowConverter, Tuple[str, ...]]
+
+
+def _convert_rows(
+    rows: Iterable[Dict[str, str]],
+    convert: RowConverter,
+    date_fields: Tuple[str, ...],
+    issues: List[Dict[str, Any]],
+) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """Converts rows into (field names, value tuples), parsing each date column at once."""
+    fields: Tuple[str, ...] = ()
+    values: List[Tuple[Any, ...]] = []
+    for row in rows:
+        record = convert(row, issues)
+        if record is not None:
+            fields = fields or tuple(record)
+            values.append(tuple(record.values()))
+    if values and date_fields:
+        columns = list(zip(*values))
+        for name in date_fields:
+            position = fields.index(name)
+            columns[position] = tuple(parse_dates(columns[position]))
+        values = list(zip(*columns))
+    return fields, values
+
+
+def _parse_chunk(
+    header: str, lines: List[str], reassemble: bool, conversion: _Conversion | None = None
+) -> _ChunkResult:
+    """
+    Parses one run of lines in a worker, and converts its rows when conversion is
+    given; line numbers start after the header.
+    """
+    parser = _RecordParser(reassemble)
+    records = list(parser._records(iter([header, *lines])))
+    rows: List[Tuple[int, Tuple[str, ...]]] = []
+    record_fields: Tuple[str, ...] = ()
+    converted: List[Tuple[Any, ...]] = []
+    record_issues: List[Dict[str, Any]] = []
+    if conversion is None:
+        rows = [(line_num, tuple(row.values())) for line_num, row in parser._parse(iter(records))]
     else:
-        # Standard: just add all non-empty lines
-        raw_lines.extend([line.strip() for line in all_lines[1:] if line.strip()])
+        record_fields, converted = _convert_rows(
+            (row for _, row in parser._parse(iter(records))), *conversion, record_issues
+        )
+    # The run is closed when every record became its own row and the last one does
+    # not leave a quoted field open, which csv would carry into the next record.
+    closed = parser.row_count == len(records) - 1 and not _ends_in_quotes(records[-1])
+    return _ChunkResult(
+        parser.header,
+        rows,
+        record_fields,
+        converted,
+        record_issues,
+        parser.issues,
+        parser.row_count,
+        parser.reconstructed_count,
+        closed,
+    )
 
-    # Second pass: Parse CSV from the (potentially reconstructed) lines
+
+def _split_chunks(
+    lines: Iterator[str], header_len: int, chunk_lines: int
+) -> Iterator[Tuple[List[str], Optional[Exception]]]:
+    """
+    Cuts lines into runs of at least chunk_lines lines, each starting at a line
+    that _RecordParser._records starts a new record with unless a quoted field is
+    open; _parse_chunk reports that case as a run that is not closed. A read error
+    ends the runs, and is yielded with the lines read before it.
+    """
+    chunk: List[str] = []
     try:
-        reader = csv.reader(raw_lines)
-        header = next(reader, None)
-    except csv.Error as e:
-        result.issues.append({
-            "line_num": 1,
-            "raw": "",
-            "error": f"Failed to parse header: {e}"
-        })
-        return result
+        for line in lines:
+            if (
+                len(chunk) >= chunk_lines
+                and line.count(",") + 1 >= header_len
+                and line.strip()
+            ):
+                yield chunk, None
+                chunk = []
+            chunk.append(line)
+    except Exception as e:
+        yield chunk, e
+        return
+    if chunk:
+        yield chunk, None
 
-    if not header:
-        return result
 
-    header_len = len(header)
+def _rejoin(
+    entries: Iterable[Tuple[List[str], Optional[Exception]]],
+    chunks: Iterator[Tuple[List[str], Optional[Exception]]],
+) -> Iterator[str]:
+    """The lines of entries and then of the remaining chunks, re-raising a read error."""
+    for lines, error in chain(entries, chunks):
+        yield from lines
+        if error is not None:
+            raise error
+
+
+def _field_count(text: str) -> int:
+    try:
+        return len(next(csv.reader([text]), []))
+    except csv.Error:
+        return 0
+
+
+def _line_state(text: str) -> Tuple[int, bool]:
+    """
+    The number of fields csv reads from text and whether text leaves a quoted field
+    open. Only a quote at the start of a field opens one, so a literal quote inside
+    an unquoted field (5" pipe) does not.
+    """
+    if '"' not in text:
+        return text.count(",") + 1, False
+    try:
+        rows = list(csv.reader([text, ""]))
+    except csv.Error:
+        return 0, False
+    return len(rows[0]), len(rows) == 1
+
+
+# A line of complete fields, each either quoted or not starting with a quote; csv
+# reads such a line without leaving a quoted field open. Lines this misses ("" escapes,
+# stray quotes) fall back to csv itself.
+_CSV_FIELD = r'(?:"[^"]*"|[^",][^,]*|)'
+_CLOSED_LINE = re.compile(f"{_CSV_FIELD}(?:,{_CSV_FIELD})*")
 
-    # Iterate remaining lines
-    for line_num, row in enumerate(reader, start=2):
-        if len(row) != header_len:
-            # Row length mismatch
-            result.issues.append({
-                "line_num": line_num,
-                "raw": ",".join(row),
-                "error": f"Column mismatch: expected {header_len}, got {len(row)}"
-            })
-            continue
 
-        # Create dict
-        row_dict = dict(zip(header, row))
-        result.rows.append(row_dict)
+def _ends_in_quotes(record: str) -> bool:
+    """Whether csv would carry a quoted field left open by record into the next line."""
+    if '"' not in record or _CLOSED_LINE.fullmatch(record):
+        return False
+    return _line_state(record)[1]
 
+
+def iter_csv_robust(
+    path: Path,
+    encoding: str = "latin1",
+    max_workers: int = 1,
+    reassemble: bool = False,
+    executor: Executor | None = None,
+) -> CsvRowStream:
+    """
+    Streaming form of parse_csv_robust: iterate the result for (line_num, row) pairs,
+    or call convert_rows, then read its issues.
+    """
+    return CsvRowStream(path, encoding, max_workers, reassemble=reassemble, executor=executor)
+
+
+def parse_csv_robust(
+    path: Path, encoding: str = "latin1", max_workers: int = 1, reassemble: bool = False
+) -> CsvParseResult:
+    """
+    Parses a CSV file robustly, capturing malformed rows and, with reassemble,
+    rejoining split rows. Collects iter_csv_robust into lists; see CsvRowStream for
+    the arguments.
+    """
+    stream = iter_csv_robust(path, encoding, max_workers, reassemble)
+    result = CsvParseResult(rows=[row for _, row in stream])
+    result.issues = stream.issues
     return result
 
+
 def convert_csv_issue(csv_issue: Dict[str, Any], table: str) -> Dict[str, Any]:
     return {
         "table": table,
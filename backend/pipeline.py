@@ -1,21 +1,46 @@
 from __future__ import annotations
 
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 import urllib.error
 
+from backend import http_client
+from backend.columnar import ColumnarTable, Records, select_rows
 from backend.config import PRIMARY_KEYS, PipelineConfig, draft_table_name
 from backend.downloader import download_files, download_file
+from backend.http_cache import HttpCache
 from backend.data_merge import merge_rows_by_key
 from backend.legdb_readme import ensure_required_tables
-from backend.legdb_downloader import download_legdb_session
+from backend.legdb_downloader import download_legdb_sessions
 from backend.legislative_downloads import (
     LegislativeDownloadError,
-    download_bill_tracking_session,
+    ZipMember,
+    extract_members,
+    SessionArchive,
+    fetch_bill_tracking_archives,
+    open_archive_members,
+    record_archive_uploaded,
+)
+from backend.arcgis import (
+    GeometryOptions,
+    LayerFeatures,
+    fetch_features_if_edited,
+    layer_cache_dir,
+    layer_for_consumer,
+    mark_layer_consumed,
+)
+from backend.gis.geometry import TARGET_SRID, normalize_geometries
+from backend.gis.ingest_legislative_districts import ingest_layer, layer_key
+from backend.gis.topology import (
+    MANIFEST_FILENAME as TOPOLOGY_MANIFEST,
+    artifacts_dir,
+    write_topology_artifacts,
 )
-from backend.arcgis import fetch_all_features
 from backend.parsers import (
     parse_bill_sponsors,
     parse_committee_members,
@@ -33,6 +58,7 @@ from backend.parsers import (
     parse_legislator_bios,
     parse_subject_headings,
 )
+from backend.parsers.utils import PROCESS_POOL_CONTEXT
 from backend.snapshot import (
     backup_dir,
     create_backup,
@@ -86,6 +112,65 @@ class PipelineResult:
     agenda_nominees: int
     legislator_bios: int
     subject_headings: int
+    bill_tracking_unchanged: bool = False
+    districts_unchanged: bool = False
+
+
+# Tables whose rows come entirely from the bill-tracking session archive.
+BILL_TRACKING_TABLES = frozenset(
+    {
+        "bills",
+        "legislators",
+        "bill_sponsors",
+        "committee_members",
+        "bill_history",
+        "bill_subjects",
+        "bill_documents",
+        "committees",
+        "agendas",
+        "agenda_bills",
+        "agenda_nominees",
+        "legislator_bios",
+        "subject_headings",
+    }
+)
+
+
+# Date columns used to pick the newest row when several sessions share a key.
+MERGE_DATE_FIELDS: dict[str, tuple[str, ...]] = {
+    "bills": ("mod_date", "intro_date", "proposed_date", "ldoa"),
+    "bill_sponsors": ("mod_date", "spon_date", "with_date"),
+    "committee_members": ("mod_date",),
+    "bill_history": ("date",),
+    "agendas": ("date",),
+}
+
+SessionSources = dict[str, Path | ZipMember]
+
+# (table, session file, parser) for every bill-tracking table, roughly largest file
+# first so a parse pool starts on the slowest tables straight away.
+SESSION_TABLES: tuple[tuple[str, str, Callable[..., tuple[Records, list[dict]]]], ...] = (
+    ("bill_history", "BILLHIST.TXT", parse_bill_history),
+    ("bill_sponsors", "BILLSPON.TXT", parse_bill_sponsors),
+    ("bills", "MAINBILL.TXT", parse_mainbill),
+    ("bill_subjects", "BILLSUBJ.TXT", parse_bill_subjects),
+    ("bill_documents", "BILLWP.TXT", parse_bill_documents),
+    ("agenda_bills", "BAGENDA.TXT", parse_agenda_bills),
+    ("committee_members", "COMEMBER.TXT", parse_committee_members),
+    ("agendas", "AGENDAS.TXT", parse_agendas),
+    ("agenda_nominees", "NAGENDA.TXT", parse_agenda_nominees),
+    ("legislators", "ROSTER.TXT", parse_roster),
+    ("legislator_bios", "LEGBIO.TXT", parse_legislator_bios),
+    ("committees", "COMMITTEE.TXT", parse_committees),
+    ("subject_headings", "SUBJHEADINGS.TXT", parse_subject_headings),
+)
+
+# The tables whose files are large enough to be split across csv_parse_workers
+# processes; their parsers convert rows inside the workers and share one pool.
+CHUNKED_TABLES = frozenset({"bill_history", "bill_sponsors", "bills"})
+
+# Vote files are small, so the pool hands them out in batches.
+VOTE_FILES_PER_TASK = 16
 
 
 def _index_by_key(rows: Iterable[dict], key: str) -> dict[str, dict]:
@@ -97,65 +182,185 @@ def _index_by_key(rows: Iterable[dict], key: str) -> dict[str, dict]:
     return indexed
 
 
-def _diff_rows(current_rows: list[dict], previous_rows: list[dict], key: str) -> list[dict]:
+def _diff_rows(current_rows: Records, previous_rows: list[dict], key: str) -> Records:
     previous_map = _index_by_key(previous_rows, key)
-    changed: list[dict] = []
-    for row in current_rows:
+    changed: list[int] = []
+    for position, row in enumerate(current_rows):
         row_key = str(row.get(key))
         if row_key not in previous_map or previous_map[row_key] != row:
-            changed.append(row)
-    return changed
+            changed.append(position)
+    return select_rows(current_rows, changed)
 
 
 def _to_validation_issues(issues_dicts: list[dict]) -> list[ValidationIssue]:
     return [ValidationIssue(**i) for i in issues_dicts]
 
 
+def _parse_sessions(
+    parser: Callable[..., tuple[Records, list[dict]]],
+    sources_by_year: dict[int, SessionSources],
+    filename: str,
+    table: str,
+    columnar: bool = False,
+    max_workers: int = 1,
+    executor: Executor | None = None,
+) -> tuple[Records, list[dict]]:
+    """
+    Parses filename from every session, newest first, keeping the newest row per key.
+    With columnar set the parser builds ColumnarTables and the sessions are stacked
+    into one; max_workers above 1 parses each large file on a process pool, executor
+    when given.
+    """
+    options: dict[str, object] = {}
+    if columnar:
+        options["columnar"] = True
+    if max_workers > 1:
+        options["max_workers"] = max_workers
+    if executor is not None:
+        options["executor"] = executor
+    tables: list[ColumnarTable] = []
+    records: Records = []
+    issues: list[dict] = []
+    for year in sorted(sources_by_year, reverse=True):
+        year_records, year_issues = parser(sources_by_year[year][filename], **options)
+        if columnar:
+            tables.append(year_records)
+        else:
+            records.extend(year_records)
+        issues.extend(year_issues)
+    if columnar:
+        records = tables[0] if len(tables) == 1 else ColumnarTable.concat(tables)
+    if len(sources_by_year) > 1:
+        records = merge_rows_by_key(records, PRIMARY_KEYS[table], MERGE_DATE_FIELDS.get(table, ()))
+    return records, issues
+
+
+def _parse_tables(
+    config: PipelineConfig,
+    sources_by_year: dict[int, SessionSources],
+    vote_files: list[Path],
+) -> dict[str, tuple[Records, list[dict]]]:
+    """
+    Parses every session table and the vote files into (records, issues) per table.
+
+    With parse_max_workers above 1 each table, all of its sessions included, and
+    each vote file is a job on one process pool, so the stage takes about as long as
+    the largest table. Inside the pool every file is parsed whole; csv_parse_workers
+    only splits files when the tables are parsed one at a time, and then every
+    session's BILLHIST, BILLSPON and MAINBILL share one pool of that many processes.
+    """
+    if config.parse_max_workers <= 1:
+        pool = (
+            ProcessPoolExecutor(
+                max_workers=config.csv_parse_workers, mp_context=PROCESS_POOL_CONTEXT
+            )
+            if config.csv_parse_workers > 1
+            else nullcontext()
+        )
+        with pool as executor:
+            parsed = {
+                table: _parse_sessions(
+                    parser,
+                    sources_by_year,
+                    filename,
+                    table,
+                    config.columnar_parse,
+                    config.csv_parse_workers,
+                    executor if table in CHUNKED_TABLES else None,
+                )
+                for table, filename, parser in SESSION_TABLES
+            }
+        parsed["vote_records"] = _concat_parsed(map(parse_vote_file, vote_files))
+        return parsed
+
+    with ProcessPoolExecutor(
+        max_workers=config.parse_max_workers, mp_context=PROCESS_POOL_CONTEXT
+    ) as executor:
+        futures = {
+            table: executor.submit(
+                _parse_sessions,
+                parser,
+                sources_by_year,
+                filename,
+                table,
+                config.columnar_parse,
+            )
+            for table, filename, parser in SESSION_TABLES
+        }
+        votes = executor.map(parse_vote_file, vote_files, chunksize=VOTE_FILES_PER_TASK)
+        parsed = {table: future.result() for table, future in futures.items()}
+        parsed["vote_records"] = _concat_parsed(votes)
+    return parsed
+
+
+def _concat_parsed(
+    results: Iterable[tuple[list[dict], list[dict]]],
+) -> tuple[list[dict], list[dict]]:
+    records: list[dict] = []
+    issues: list[dict] = []
+    for file_records, file_issues in results:
+        records.extend(file_records)
+        issues.extend(file_issues)
+    return records, issues
+
+
 def run_pipeline(config: PipelineConfig, date_str: str | None = None) -> PipelineResult:
     if not config.supabase_url or not config.supabase_service_key:
         raise RuntimeError("Supabase URL and key are required to run the pipeline.")
 
+    http_client.configure(
+        http_client.HttpSettings(
+            connect_timeout=config.http_connect_timeout,
+            read_timeout=config.http_read_timeout,
+            pool_maxsize=config.http_pool_maxsize,
+        )
+    )
     run_date = date_str or datetime.utcnow().strftime("%Y-%m-%d")
     raw_dir = config.data_dir / "raw" / run_date
     downloads_dir = raw_dir / "downloads"
-    readme_path = download_file(config.legdb_readme_url, downloads_dir)
+    cache = HttpCache(config.data_dir / "http_cache")
+    readme_path = download_file(
+        config.legdb_readme_url, downloads_dir, config.download_chunk_size, cache
+    )
     readme_text = readme_path.read_text(encoding="latin1", errors="ignore")
     ensure_required_tables(
         readme_text,
         ("MainBill", "Roster", "BillSpon", "COMember", "BillHist", "BillSubj", "BillWP", "Committee", "Agendas", "BAgendas", "NAgendas", "LegBio", "SubjHeadings"),
     )
-    _download_bill_tracking(config, downloads_dir)
-    _download_legdb_sessions(config, raw_dir / "legdb")
-    votes_dir = raw_dir / "votes"
-    vote_files = download_votes(config.votes_base_url, config.votes_readme_urls, votes_dir)
-    feature_collection = fetch_all_features(config.gis_service_url)
-
-    # Parse existing tables
-    bills, bills_parse_issues = parse_mainbill(downloads_dir / "MAINBILL.TXT")
-    legislators, legislators_parse_issues = parse_roster(downloads_dir / "ROSTER.TXT")
+    sources_by_year, archives = _download_bill_tracking(config, downloads_dir, cache)
+    bill_tracking_unchanged = bool(archives) and all(
+        archive.unchanged for archive in archives.values()
+    )
+    _download_legdb_sessions(config, raw_dir / "legdb", cache)
+    vote_files = _download_votes(config, config.data_dir / "votes", cache)
+    district_layer, generalized_layer = _fetch_districts(config, cache)
+    topology_layer = _fetch_topology_layer(config, cache)
+    districts_unchanged = district_layer.unchanged and (
+        generalized_layer is None or generalized_layer.unchanged
+    )
+
+    parsed = _parse_tables(config, sources_by_year, vote_files)
+    bills, bills_parse_issues = parsed["bills"]
+    legislators, legislators_parse_issues = parsed["legislators"]
     active_legislators, former_legislators = split_legislators(legislators)
-    bill_sponsors, bill_sponsors_parse_issues = parse_bill_sponsors(downloads_dir / "BILLSPON.TXT")
-    committee_members, committee_members_parse_issues = parse_committee_members(downloads_dir / "COMEMBER.TXT")
-
-    vote_records = []
-    vote_records_parse_issues = []
-    for vote_file in vote_files:
-        v_recs, v_issues = parse_vote_file(vote_file)
-        vote_records.extend(v_recs)
-        vote_records_parse_issues.extend(v_issues)
-
-    districts, districts_parse_issues = parse_districts(feature_collection)
-
-    # Parse new tables
-    bill_history, bill_history_parse_issues = parse_bill_history(downloads_dir / "BILLHIST.TXT")
-    bill_subjects, bill_subjects_parse_issues = parse_bill_subjects(downloads_dir / "BILLSUBJ.TXT")
-    bill_documents, bill_documents_parse_issues = parse_bill_documents(downloads_dir / "BILLWP.TXT")
-    committees, committees_parse_issues = parse_committees(downloads_dir / "COMMITTEE.TXT")
-    agendas, agendas_parse_issues = parse_agendas(downloads_dir / "AGENDAS.TXT")
-    agenda_bills, agenda_bills_parse_issues = parse_agenda_bills(downloads_dir / "BAGENDA.TXT")
-    agenda_nominees, agenda_nominees_parse_issues = parse_agenda_nominees(downloads_dir / "NAGENDA.TXT")
-    legislator_bios, legislator_bios_parse_issues = parse_legislator_bios(downloads_dir / "LEGBIO.TXT")
-    subject_headings, subject_headings_parse_issues = parse_subject_headings(downloads_dir / "SUBJHEADINGS.TXT")
+    bill_sponsors, bill_sponsors_parse_issues = parsed["bill_sponsors"]
+    committee_members, committee_members_parse_issues = parsed["committee_members"]
+    vote_records, vote_records_parse_issues = parsed["vote_records"]
+
+    districts, districts_parse_issues = parse_districts(
+        district_layer.features,
+        generalized_layer.features if generalized_layer is not None else None,
+    )
+
+    bill_history, bill_history_parse_issues = parsed["bill_history"]
+    bill_subjects, bill_subjects_parse_issues = parsed["bill_subjects"]
+    bill_documents, bill_documents_parse_issues = parsed["bill_documents"]
+    committees, committees_parse_issues = parsed["committees"]
+    agendas, agendas_parse_issues = parsed["agendas"]
+    agenda_bills, agenda_bills_parse_issues = parsed["agenda_bills"]
+    agenda_nominees, agenda_nominees_parse_issues = parsed["agenda_nominees"]
+    legislator_bios, legislator_bios_parse_issues = parsed["legislator_bios"]
+    subject_headings, subject_headings_parse_issues = parsed["subject_headings"]
 
     session_window = build_session_window(
         config.session_lookback_count,
@@ -204,6 +409,7 @@ def run_pipeline(config: PipelineConfig, date_str: str | None = None) -> Pipelin
     committee_members_result = validate_committee_members(committee_members)
     vote_records_result = validate_vote_records(vote_records)
     districts_result = validate_districts(districts)
+    _write_district_topology(config, districts_result.valid_rows, topology_layer)
 
     bill_history_result = validate_bill_history(bill_history, bills_result.valid_rows)
     bill_subjects_result = validate_bill_subjects(bill_subjects, bills_result.valid_rows)
@@ -256,6 +462,13 @@ def run_pipeline(config: PipelineConfig, date_str: str | None = None) -> Pipelin
 
     client = SupabaseClient(config.supabase_url, config.supabase_service_key)
 
+    # An unchanged session archive parses to the rows already uploaded by an earlier
+    # run, so diffing its tables again would be wasted work. Drafts are keyed by
+    # run_date and still go up, so every run keeps its own draft snapshot.
+    skipped_tables = BILL_TRACKING_TABLES if bill_tracking_unchanged else frozenset()
+    if districts_unchanged:
+        skipped_tables |= {"districts"}
+
     _upload_draft(client, "bills", bills, run_date)
     _upload_draft(client, "legislators", legislators, run_date)
     _upload_draft(client, "bill_sponsors", bill_sponsors, run_date)
@@ -279,28 +492,37 @@ def run_pipeline(config: PipelineConfig, date_str: str | None = None) -> Pipelin
         issue_payloads = [issue.as_dict(run_date=run_date) for issue in all_issues]
         client.upsert("data_validation_issues", issue_payloads)
 
-    _upload_changed(client, "bills", bills_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "legislators", legislators_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "bill_sponsors", bill_sponsors_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "committee_members", committee_members_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "vote_records", vote_records_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "districts", districts_result.valid_rows, config.data_dir, run_date)
-
-    _upload_changed(client, "bill_history", bill_history_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "bill_subjects", bill_subjects_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "bill_documents", bill_documents_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "committees", committees_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "agendas", agendas_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "agenda_bills", agenda_bills_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "agenda_nominees", agenda_nominees_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "legislator_bios", legislator_bios_result.valid_rows, config.data_dir, run_date)
-    _upload_changed(client, "subject_headings", subject_headings_result.valid_rows, config.data_dir, run_date)
+    _upload_changed(client, "bills", bills_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "legislators", legislators_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "bill_sponsors", bill_sponsors_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "committee_members", committee_members_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "vote_records", vote_records_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "districts", districts_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    for layer in (district_layer, generalized_layer):
+        if layer is not None:
+            mark_layer_consumed(layer, "districts")
+    if config.gis_ingest_legislative_districts:
+        _ingest_legislative_districts(config, district_layer)
+
+    _upload_changed(client, "bill_history", bill_history_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "bill_subjects", bill_subjects_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "bill_documents", bill_documents_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "committees", committees_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "agendas", agendas_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "agenda_bills", agenda_bills_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "agenda_nominees", agenda_nominees_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "legislator_bios", legislator_bios_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    _upload_changed(client, "subject_headings", subject_headings_result.valid_rows, config.data_dir, run_date, skipped_tables)
+    for archive in archives.values():
+        if not archive.unchanged:
+            record_archive_uploaded(archive)
 
     enforce_retention(config.data_dir, config.retention_days, config.backup_retention_count)
 
     return PipelineResult(
         bills=len(bills_result.valid_rows),
         legislators=len(legislators_result.valid_rows),
+        former_legislators=len(former_legislators),
         bill_sponsors=len(bill_sponsors_result.valid_rows),
         committee_members=len(committee_members_result.valid_rows),
         vote_records=len(vote_records_result.valid_rows),
@@ -315,47 +537,235 @@ def run_pipeline(config: PipelineConfig, date_str: str | None = None) -> Pipelin
         agenda_nominees=len(agenda_nominees_result.valid_rows),
         legislator_bios=len(legislator_bios_result.valid_rows),
         subject_headings=len(subject_headings_result.valid_rows),
+        bill_tracking_unchanged=bill_tracking_unchanged,
+        districts_unchanged=districts_unchanged,
     )
 
 
-def _download_bill_tracking(config: PipelineConfig, downloads_dir: Path) -> None:
-    session_year = max(config.bill_tracking_years)
+def _download_bill_tracking(
+    config: PipelineConfig,
+    downloads_dir: Path,
+    cache: HttpCache,
+) -> tuple[dict[int, SessionSources], dict[int, SessionArchive]]:
+    """
+    Returns the table sources for every configured session year, and the session
+    archives they came from; the archives are empty when the per-table fallback
+    downloads were used.
+
+    Archives are fetched concurrently and kept under data_dir/bill_tracking/<year>
+    with their manifests, so an unchanged listing entry skips the download entirely.
+    Tables are read straight out of each ZIP; they are only extracted to
+    downloads_dir/<year> when NJLEG_EXTRACT_BILL_TRACKING is set.
+    """
     try:
-        download_bill_tracking_session(
+        archives = fetch_bill_tracking_archives(
             base_url="https://www.njleg.state.nj.us",
             pub_base_url="https://pub.njleg.state.nj.us",
             download_type=config.download_type,
-            session_year=session_year,
-            destination=downloads_dir,
-            required_files=config.files_to_download,
+            session_years=config.bill_tracking_years,
+            destination_root=config.data_dir / "bill_tracking",
+            chunk_size=config.download_chunk_size,
+            cache=cache,
+            max_workers=config.download_max_workers,
         )
+        members_by_year = {
+            year: open_archive_members(archive.path, config.files_to_download)
+            for year, archive in archives.items()
+        }
     except LegislativeDownloadError:
-        download_files(config.base_url, config.files_to_download, downloads_dir)
+        paths = download_files(
+            config.base_url,
+            config.files_to_download,
+            downloads_dir,
+            config.download_chunk_size,
+            cache,
+            max_workers=config.download_max_workers,
+            per_host_limit=config.download_per_host_limit,
+        )
+        return {max(config.bill_tracking_years): {path.name: path for path in paths}}, {}
+
+    sources_by_year: dict[int, SessionSources] = {}
+    for year, members in members_by_year.items():
+        if config.extract_bill_tracking:
+            paths = extract_members(
+                members.values(), downloads_dir / str(year), config.download_chunk_size
+            )
+            sources_by_year[year] = {path.name: path for path in paths}
+        else:
+            sources_by_year[year] = dict(members)
+    return sources_by_year, archives
+
+
+def _download_legdb_sessions(
+    config: PipelineConfig,
+    destination: Path,
+    cache: HttpCache,
+) -> list[Path]:
+    return download_legdb_sessions(
+        config.legdb_base_url,
+        config.legdb_years,
+        config.files_to_download,
+        destination,
+        config.download_chunk_size,
+        cache,
+        max_workers=config.download_max_workers,
+        per_host_limit=config.download_per_host_limit,
+    )
+
+
+def _download_votes(
+    config: PipelineConfig,
+    destination: Path,
+    cache: HttpCache,
+) -> list[Path]:
+    # Vote files from sessions before the oldest tracked session no longer change,
+    # so once mirrored they are not requested again.
+    return download_votes(
+        config.votes_base_url,
+        config.votes_readme_urls,
+        destination,
+        config.download_chunk_size,
+        cache,
+        frozen_before_year=min(config.bill_tracking_years, default=None),
+        max_workers=config.download_max_workers,
+        per_host_limit=config.download_per_host_limit,
+    )
+
+
+def _fetch_districts(
+    config: PipelineConfig,
+    cache: HttpCache,
+) -> tuple[LayerFeatures, LayerFeatures | None]:
+    """
+    Returns (layer, generalized_layer). With generalization configured
+    the primary collection is generalized, unless NJLEG_GIS_STORE_FULL_GEOMETRY asks
+    for full resolution alongside a second, generalized fetch. Each collection is kept
+    in the layer cache under data_dir/gis, shared with the GIS ingest, and is only
+    re-downloaded when the layer's lastEditDate moves; within
+    NJLEG_GIS_FETCH_WINDOW_SECONDS of the last check no request is made at all.
+    """
+    options = GeometryOptions(
+        max_allowable_offset=config.gis_max_allowable_offset,
+        geometry_precision=config.gis_geometry_precision,
+        quantization_tolerance=config.gis_quantization_tolerance,
+    )
+    store_side_by_side = config.gis_store_full_geometry and options.enabled
+    primary_options = None if store_side_by_side else options
+    primary = fetch_features_if_edited(
+        config.gis_service_url,
+        layer_cache_dir(config.data_dir / "gis", config.gis_service_url, primary_options),
+        cache,
+        max_workers=config.download_max_workers,
+        geometry_options=primary_options,
+        reuse_within=config.gis_fetch_window_seconds,
+        consumer="districts",
+    )
+    if not store_side_by_side:
+        return primary, None
+    generalized = fetch_features_if_edited(
+        config.gis_service_url,
+        layer_cache_dir(config.data_dir / "gis", config.gis_service_url, options),
+        cache,
+        max_workers=config.download_max_workers,
+        geometry_options=options,
+        reuse_within=config.gis_fetch_window_seconds,
+        consumer="districts",
+    )
+    return primary, generalized
+
+
+def _fetch_topology_layer(config: PipelineConfig, cache: HttpCache) -> LayerFeatures:
+    """
+    The district layer at full resolution for the TopoJSON artifacts, which simplify
+    it per zoom themselves. Without generalization it is the districts table's own
+    fetch, found in the layer cache without another request.
+    """
+    return fetch_features_if_edited(
+        config.gis_service_url,
+        layer_cache_dir(config.data_dir / "gis", config.gis_service_url),
+        cache,
+        max_workers=config.download_max_workers,
+        reuse_within=config.gis_fetch_window_seconds,
+        consumer="district_topology",
+    )
 
 
-def _download_legdb_sessions(config: PipelineConfig, destination: Path) -> list[Path]:
-    downloaded: list[Path] = []
-    for year in config.legdb_years:
-        downloaded.extend(
-            download_legdb_session(config.legdb_base_url, year, config.files_to_download, destination / str(year))
+def _ingest_legislative_districts(config: PipelineConfig, layer: LayerFeatures) -> None:
+    """
+    Feeds legislative_districts from the layer already fetched for the districts
+    table, so a full sync downloads the polygons once. Skipped while the features
+    match the set last ingested, whichever of the sync or the GIS ingest did so.
+    """
+    options = None
+    if not config.gis_store_full_geometry:
+        options = GeometryOptions(
+            max_allowable_offset=config.gis_max_allowable_offset,
+            geometry_precision=config.gis_geometry_precision,
+            quantization_tolerance=config.gis_quantization_tolerance,
         )
-    return downloaded
+    layer = layer_for_consumer(layer, "legislative_districts")
+    ingest_layer(layer, layer_key(config.gis_service_url, options))
+    mark_layer_consumed(layer, "legislative_districts")
+
+
+def _write_district_topology(
+    config: PipelineConfig,
+    districts: list[dict],
+    layer: LayerFeatures,
+) -> None:
+    """
+    Writes shared-border TopoJSON for the map UI: full resolution plus one
+    simplified level per NJLEG_DISTRICT_TOPOLOGY_ZOOMS entry. Geometries come from
+    the full-resolution layer rather than the districts rows, whose geometry_json
+    is already generalized when NJLEG_GIS_* generalization is on.
+    """
+    destination = artifacts_dir(config.data_dir)
+    if not districts or (layer.unchanged and (destination / TOPOLOGY_MANIFEST).exists()):
+        return
+    full_resolution, _ = parse_districts(layer.features)
+    geometry_by_key = {record["district_key"]: record["geometry_json"] for record in full_resolution}
+    districts = [district for district in districts if district["district_key"] in geometry_by_key]
+    geometries = normalize_geometries(
+        (
+            {"geometry": json.loads(geometry_by_key[district["district_key"]])}
+            for district in districts
+        ),
+        TARGET_SRID,
+    )
+    properties = [
+        {
+            "district_key": district["district_key"],
+            "district_number": district.get("district_number"),
+            "name": district.get("name"),
+        }
+        for district in districts
+    ]
+    write_topology_artifacts(geometries, properties, destination, config.district_topology_zooms)
+    mark_layer_consumed(layer, "district_topology")
 
 
 def _upload_changed(
     client: SupabaseClient,
     table: str,
-    current_rows: list[dict],
+    current_rows: Records,
     base_dir: Path,
     run_date: str,
+    skipped_tables: frozenset[str] = frozenset(),
 ) -> None:
+    if table in skipped_tables:
+        return
     key = PRIMARY_KEYS[table]
     previous_rows = load_latest_snapshot(base_dir, table, exclude_date=run_date)
     changed_rows = _diff_rows(current_rows, previous_rows, key)
     client.upsert(table, changed_rows)
 
 
-def _upload_draft(client: SupabaseClient, table: str, rows: list[dict], run_date: str) -> None:
+def _upload_draft(
+    client: SupabaseClient,
+    table: str,
+    rows: Records,
+    run_date: str,
+) -> None:
     draft_table = draft_table_name(table)
-    draft_rows = [{**row, "run_date": run_date} for row in rows]
+    draft_rows = ({**row, "run_date": run_date} for row in rows)
     client.upsert(draft_table, draft_rows)
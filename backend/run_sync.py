@@ -33,6 +33,10 @@ def main() -> int:
     print(f"Legislator bios: {result.legislator_bios}")
     print(f"Subject headings: {result.subject_headings}")
     print(f"Validation issues: {result.validation_issues}")
+    if result.bill_tracking_unchanged:
+        print("Bill tracking archive unchanged; skipped bill-tracking uploads.")
+    if result.districts_unchanged:
+        print("District layer unchanged; skipped district uploads.")
     return 0
 
 
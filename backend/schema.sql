@@ -108,6 +108,7 @@ create table if not exists public.districts (
   name text,
   properties jsonb,
   geometry_json jsonb,
+  geometry_generalized_json jsonb,
   updated_at timestamptz default now()
 );
 
@@ -116,6 +117,7 @@ create table if not exists public.legislative_districts (
   chamber text not null check (chamber in ('A','S')),
   district_number int not null,
   geom geometry(MultiPolygon, 4326) not null,
+  geom_fingerprint text,
   source_sr int not null,
   source_objectid int not null,
   valid_from date not null default current_date,
@@ -124,6 +126,13 @@ create table if not exists public.legislative_districts (
   unique (chamber, district_number, valid_to)
 );
 
+create table if not exists public.gis_layer_state (
+  layer_url text primary key,
+  last_edit_date bigint,
+  features_sha256 text,
+  updated_at timestamptz not null default now()
+);
+
 -- New Tables
 
 create table if not exists public.bill_history (
@@ -301,6 +310,7 @@ create table if not exists public.draft_districts (
   name text,
   properties jsonb,
   geometry_json jsonb,
+  geometry_generalized_json jsonb,
   run_date date,
   ingested_at timestamptz default now()
 );
@@ -406,3 +416,4 @@ create index if not exists idx_agenda_bills_bill_key on public.agenda_bills(bill
 create index if not exists idx_agenda_nominees_agenda_key on public.agenda_nominees(agenda_key);
 create index if not exists idx_agendas_committee_code on public.agendas(committee_code);
 create index if not exists idx_committee_members_committee_code on public.committee_members(committee_code);
+create index if not exists idx_legislative_districts_geom_validity on public.legislative_districts using gist (geom, daterange(valid_from, valid_to + 1));
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Iterable, Sequence
+from typing import Sequence
+
+from backend.columnar import Records, select_rows
 
 
 @dataclass(frozen=True)
@@ -32,15 +34,16 @@ def build_session_window(
 
 
 def filter_rows_by_date(
-    rows: Iterable[dict],
+    rows: Records,
     date_fields: Sequence[str],
     cutoff: date,
-) -> list[dict]:
-    filtered: list[dict] = []
-    for row in rows:
-        if _row_is_recent(row, date_fields, cutoff):
-            filtered.append(row)
-    return filtered
+) -> Records:
+    kept = [
+        position
+        for position, row in enumerate(rows)
+        if _row_is_recent(row, date_fields, cutoff)
+    ]
+    return select_rows(rows, kept)
 
 
 def _row_is_recent(row: dict, date_fields: Sequence[str], cutoff: date) -> bool:
@@ -6,6 +6,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Iterable
 
+from backend.columnar import ColumnarTable
+
 
 def snapshot_dir(base_dir: Path, date_str: str) -> Path:
     return base_dir / "processed" / date_str
@@ -18,9 +20,13 @@ def backup_dir(base_dir: Path, date_str: str) -> Path:
 def write_snapshot(table: str, rows: Iterable[dict], target_dir: Path) -> Path:
     target_dir.mkdir(parents=True, exist_ok=True)
     output_path = target_dir / f"{table}.jsonl"
+    if isinstance(rows, ColumnarTable):
+        lines = rows.json_lines()
+    else:
+        lines = (json.dumps(row, sort_keys=True) for row in rows)
     with output_path.open("w", encoding="utf-8") as file:
-        for row in rows:
-            file.write(json.dumps(row, sort_keys=True))
+        for line in lines:
+            file.write(line)
             file.write("\n")
     return output_path
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import json
-import math
-import urllib.request
+from itertools import islice
 from typing import Iterable
 
+from backend import http_client
+
 
 class SupabaseClient:
     def __init__(self, base_url: str, service_key: str) -> None:
@@ -12,12 +13,10 @@ class SupabaseClient:
         self.service_key = service_key
 
     def upsert(self, table: str, rows: Iterable[dict], batch_size: int = 500) -> None:
-        rows_list = list(rows)
-        if not rows_list:
-            return
-        batches = math.ceil(len(rows_list) / batch_size)
-        for i in range(batches):
-            batch = rows_list[i * batch_size : (i + 1) * batch_size]
+        # Batches are cut from the iterator, so rows decoded from a ColumnarTable or
+        # built by a generator are only ever held one batch at a time.
+        iterator = iter(rows)
+        while batch := list(islice(iterator, batch_size)):
             self._post_batch(table, batch)
 
     def _post_batch(self, table: str, batch: list[dict]) -> None:
@@ -28,11 +27,9 @@ class SupabaseClient:
             "Authorization": f"Bearer {self.service_key}",
             "Prefer": "resolution=merge-duplicates,return=representation",
         }
-        request = urllib.request.Request(
-            url=url,
+        response = http_client.post(
+            url,
             data=json.dumps(batch).encode("utf-8"),
             headers=headers,
-            method="POST",
         )
-        with urllib.request.urlopen(request) as response:
-            response.read()
+        response.raise_for_status()
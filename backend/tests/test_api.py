@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from fastapi.testclient import TestClient
 from backend.api import app
@@ -26,3 +28,88 @@ def test_trigger_sync(client):
     # Status should now be running (or completed if it finishes very fast, but it's a background task)
     status_resp = client.get("/status")
     assert status_resp.json()["status"] in ["running", "completed", "failed"]
+
+def test_district_lookup(client):
+    from shapely.geometry import MultiPolygon, Polygon
+
+    from backend.gis.district_index import DistrictIndex
+    from backend.gis.repository import DistrictGeometry
+
+    square = MultiPolygon([Polygon([(-75, 39), (-74, 39), (-74, 40), (-75, 40)])])
+    index = DistrictIndex(
+        [DistrictGeometry("S", 7, square), DistrictGeometry("A", 7, square)],
+        [{"roster_key": 1, "district": 7, "house": "Senate", "last_name": "Smith"}],
+    )
+    with mock.patch("backend.api.district_index_cache") as cache:
+        cache.get.return_value = index
+        single = client.get("/districts/lookup", params={"lat": 39.5, "lon": -74.5})
+        batch = client.post(
+            "/districts/lookup",
+            json={"points": [{"lat": 39.5, "lon": -74.5}, {"lat": 10, "lon": 10}]},
+        )
+
+    assert single.status_code == 200
+    assert single.json()["senate_district"] == 7
+    assert single.json()["legislators"][0]["last_name"] == "Smith"
+    results = batch.json()["results"]
+    assert [result["assembly_district"] for result in results] == [7, None]
+
+def test_district_lookup_unavailable(client):
+    with mock.patch("backend.api.district_index_cache") as cache:
+        cache.get.side_effect = RuntimeError("no database")
+        response = client.get("/districts/lookup", params={"lat": 39.5, "lon": -74.5})
+
+    assert response.status_code == 503
+
+def test_district_topology_served_with_cache_headers(client, tmp_path, monkeypatch):
+    from shapely.geometry import MultiPolygon, box
+
+    from backend.gis.topology import artifacts_dir, write_topology_artifacts
+
+    monkeypatch.setenv("NJLEG_DATA_DIR", str(tmp_path))
+    manifest = write_topology_artifacts(
+        [MultiPolygon([box(0, 0, 1, 1)]), MultiPolygon([box(1, 0, 2, 1)])],
+        [{"district_number": 1}, {"district_number": 2}],
+        artifacts_dir(tmp_path),
+        zooms=(6,),
+    )
+
+    listing = client.get("/districts/topology")
+    filename = listing.json()["levels"]["z6"]["file"]
+    topology = client.get(f"/districts/topology/{filename}")
+
+    assert listing.headers["cache-control"] == "public, max-age=300"
+    assert topology.status_code == 200
+    assert "immutable" in topology.headers["cache-control"]
+    assert topology.json()["type"] == "Topology"
+    assert filename == manifest["levels"]["z6"]["file"]
+    assert client.get("/districts/topology/..%2Fmanifest.json").status_code == 404
+
+def test_district_lookup_as_of(client):
+    from backend.gis.district_index import DistrictMatch
+
+    with mock.patch("backend.api.lookup_districts_as_of") as lookup:
+        lookup.return_value = [DistrictMatch(senate_district=3, assembly_district=3)]
+        response = client.get(
+            "/districts/lookup", params={"lat": 39.5, "lon": -74.5, "as_of": "2019-06-01"}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["senate_district"] == 3
+    assert "legislators" not in response.json()
+    points, as_of = lookup.call_args.args
+    assert points == [(39.5, -74.5)]
+    assert str(as_of) == "2019-06-01"
+
+def test_district_reload_drops_history_index(client):
+    from backend.gis.district_history import temporal_district_index_cache
+
+    with mock.patch("backend.api.district_index_cache") as cache, mock.patch.object(
+        temporal_district_index_cache, "_index", object()
+    ):
+        cache.get.return_value = []
+        response = client.post("/districts/reload")
+        assert temporal_district_index_cache._index is None
+
+    assert response.status_code == 200
+    assert response.json()["districts"] == 0
@@ -0,0 +1,222 @@
+import io
+import json
+import threading
+import time
+import urllib.parse
+from unittest import mock
+
+import pytest
+import requests
+
+from backend.arcgis import (
+    ArcGISQueryError,
+    GeometryOptions,
+    fetch_all_features,
+    fetch_features_if_edited,
+    feature_set_hash,
+    layer_cache_dir,
+    layer_for_consumer,
+    mark_layer_consumed,
+)
+
+
+SERVICE_URL = "https://example.com/arcgis/rest/services/Districts/FeatureServer/0"
+
+
+def make_response(payload):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(payload).encode("utf-8"))
+    return response
+
+
+def fake_service(features, page_size, state):
+    def fake_get(url, **kwargs):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+        if query.get("f") == "pjson":
+            return make_response({"maxRecordCount": page_size, "objectIdField": "OBJECTID"})
+        if query.get("returnCountOnly") == "true":
+            return make_response({"count": state.get("count", len(features))})
+        assert query["orderByFields"] == "OBJECTID"
+        with state["lock"]:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        offset = int(query["resultOffset"])
+        # Finish early pages last to prove results are reassembled by offset.
+        time.sleep(0.02 if offset == 0 else 0.005)
+        with state["lock"]:
+            state["active"] -= 1
+        return make_response({"features": features[offset : offset + page_size]})
+
+    return fake_get
+
+
+@mock.patch("backend.http_client.get_session")
+def test_fetch_all_features_fetches_pages_concurrently_in_order(mock_get_session):
+    features = [{"id": index} for index in range(10)]
+    state = {"lock": threading.Lock(), "active": 0, "peak": 0}
+    mock_get_session.return_value.get.side_effect = fake_service(features, 3, state)
+
+    collection = fetch_all_features(SERVICE_URL, max_workers=4)
+
+    assert collection["features"] == features
+    assert state["peak"] > 1
+    requested = [call.args[0] for call in mock_get_session.return_value.get.call_args_list]
+    assert sum("resultOffset" in url for url in requested) == 4
+
+
+@mock.patch("backend.http_client.get_session")
+def test_fetch_all_features_keeps_paging_past_stale_count(mock_get_session):
+    features = [{"id": index} for index in range(7)]
+    state = {"lock": threading.Lock(), "active": 0, "peak": 0, "count": 6}
+    mock_get_session.return_value.get.side_effect = fake_service(features, 3, state)
+
+    collection = fetch_all_features(SERVICE_URL, max_workers=2)
+
+    assert collection["features"] == features
+
+
+@mock.patch("backend.http_client.get_session")
+def test_fetch_all_features_rejects_short_and_failed_pages(mock_get_session):
+    features = [{"id": index} for index in range(10)]
+    state = {"lock": threading.Lock(), "active": 0, "peak": 0}
+    service = fake_service(features, 3, state)
+
+    def short_first_page(url, **kwargs):
+        if "resultOffset=0&" in url:
+            return make_response({"features": features[:2]})
+        return service(url, **kwargs)
+
+    mock_get_session.return_value.get.side_effect = short_first_page
+    with pytest.raises(ArcGISQueryError, match="returned 2 of 3"):
+        fetch_all_features(SERVICE_URL, max_workers=2)
+
+    def failed_page(url, **kwargs):
+        if "resultOffset=3&" in url:
+            return make_response({"error": {"code": 500, "message": "Timeout"}})
+        return service(url, **kwargs)
+
+    mock_get_session.return_value.get.side_effect = failed_page
+    with pytest.raises(ArcGISQueryError, match="Timeout"):
+        fetch_all_features(SERVICE_URL, max_workers=2)
+
+
+@mock.patch("backend.http_client.get_session")
+def test_fetch_all_features_requests_generalized_geometry(mock_get_session):
+    features = [{"id": 0, "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [4, 0], [0, -2], [0, 2]]]}}]
+    responses = [
+        {"maxRecordCount": 10},
+        {"count": 1},
+        {
+            "features": features,
+            "transform": {"originPosition": "upperLeft", "scale": [0.5, 0.5], "translate": [-75.0, 41.0]},
+        },
+    ]
+    mock_get_session.return_value.get.side_effect = [make_response(payload) for payload in responses]
+    options = GeometryOptions(max_allowable_offset=0.001, geometry_precision=5, quantization_tolerance=0.5)
+
+    collection = fetch_all_features(SERVICE_URL, geometry_options=options)
+
+    page_url = mock_get_session.return_value.get.call_args_list[2].args[0]
+    query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(page_url).query))
+    assert query["maxAllowableOffset"] == "0.001"
+    assert query["geometryPrecision"] == "5"
+    assert json.loads(query["quantizationParameters"])["tolerance"] == 0.5
+    assert collection["features"][0]["geometry"]["coordinates"] == [
+        [[-75.0, 41.0], [-73.0, 41.0], [-73.0, 42.0], [-73.0, 41.0]]
+    ]
+
+
+@mock.patch("backend.http_client.get_session")
+def test_fetch_features_if_edited_skips_unedited_layer(mock_get_session, tmp_path):
+    features = [{"id": index} for index in range(3)]
+    metadata = {"maxRecordCount": 10, "editingInfo": {"lastEditDate": 1700000000000}}
+
+    def fake_get(url, **kwargs):
+        if "f=pjson" in url:
+            return make_response(metadata)
+        if "returnCountOnly" in url:
+            return make_response({"count": len(features)})
+        return make_response({"features": features})
+
+    mock_get_session.return_value.get.side_effect = fake_get
+
+    first = fetch_features_if_edited(SERVICE_URL, tmp_path)
+    mark_layer_consumed(first, "default")
+    calls_after_first = mock_get_session.return_value.get.call_count
+    second = fetch_features_if_edited(SERVICE_URL, tmp_path)
+
+    assert first.unchanged is False
+    assert second.unchanged is True
+    assert list(second.features) == features
+    assert len(second.features) == len(features)
+    assert second.features_sha256 == first.features_sha256 == feature_set_hash(features)
+    assert mock_get_session.return_value.get.call_count == calls_after_first + 1
+
+    metadata["editingInfo"]["lastEditDate"] += 1
+    third = fetch_features_if_edited(SERVICE_URL, tmp_path)
+
+    assert third.unchanged is True
+    assert mock_get_session.return_value.get.call_count > calls_after_first + 2
+
+
+@mock.patch("backend.http_client.get_session")
+def test_fetch_features_if_edited_reuses_state_within_window(mock_get_session, tmp_path):
+    features = [{"id": index} for index in range(3)]
+    metadata = {"maxRecordCount": 10, "editingInfo": {"lastEditDate": 1700000000000}}
+
+    def fake_get(url, **kwargs):
+        if "f=pjson" in url:
+            return make_response(metadata)
+        if "returnCountOnly" in url:
+            return make_response({"count": len(features)})
+        return make_response({"features": features})
+
+    mock_get_session.return_value.get.side_effect = fake_get
+    state_dir = layer_cache_dir(tmp_path, SERVICE_URL)
+
+    first = fetch_features_if_edited(SERVICE_URL, state_dir, reuse_within=60, consumer="districts")
+    calls_after_first = mock_get_session.return_value.get.call_count
+    # A second consumer of the same layer query resolves to the same directory.
+    second = fetch_features_if_edited(
+        SERVICE_URL, layer_cache_dir(tmp_path, SERVICE_URL), reuse_within=60, consumer="ingest"
+    )
+    # Not marked consumed, as after a failed upload: still reported as changed.
+    retried = fetch_features_if_edited(SERVICE_URL, state_dir, reuse_within=60, consumer="districts")
+    mark_layer_consumed(retried, "districts")
+    again = fetch_features_if_edited(SERVICE_URL, state_dir, reuse_within=60, consumer="districts")
+
+    assert mock_get_session.return_value.get.call_count == calls_after_first
+    assert list(second.features) == list(first.features) == features
+    assert second.metadata == metadata
+    assert (first.unchanged, second.unchanged, retried.unchanged, again.unchanged) == (
+        False,
+        False,
+        False,
+        True,
+    )
+    # The districts download handed on to the ingest is judged by the ingest's state.
+    assert layer_for_consumer(again, "ingest").unchanged is False
+    mark_layer_consumed(layer_for_consumer(again, "ingest"), "ingest")
+    assert layer_for_consumer(again, "ingest").unchanged is True
+    assert layer_cache_dir(tmp_path, SERVICE_URL, GeometryOptions(geometry_precision=5)) != state_dir
+
+
+@mock.patch("backend.http_client.get_session")
+def test_fetch_features_if_edited_keeps_no_state_for_failed_query(mock_get_session, tmp_path):
+    metadata = {"maxRecordCount": 10, "editingInfo": {"lastEditDate": 1700000000000}}
+
+    def fake_get(url, **kwargs):
+        if "f=pjson" in url:
+            return make_response(metadata)
+        if "returnCountOnly" in url:
+            return make_response({"count": 3})
+        return make_response({"error": {"code": 400, "message": "Invalid query"}})
+
+    mock_get_session.return_value.get.side_effect = fake_get
+
+    with pytest.raises(ArcGISQueryError):
+        fetch_features_if_edited(SERVICE_URL, tmp_path)
+
+    # Neither state nor a partly written feature file is left behind.
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,118 @@
+import json
+
+from backend.columnar import ColumnarTable
+from backend.data_merge import merge_rows_by_key
+from backend.parsers import parse_bill_sponsors
+from backend.snapshot import write_snapshot
+from backend.supabase_loader import SupabaseClient
+from backend.validation import validate_bill_sponsors, validate_bills
+
+
+BILLSPON = (
+    "BillType,BillNumber,Sequence,Sponsor,Type,Status,SponDate,WithDate,ModDate\n"
+    "A,1,1,Smith,Primary,Active,01/10/2024,,01/12/2024\n"
+    "A,1,2,Jones,Co,Active,01/10/2024,,01/12/2024\n"
+    "S,5,1,Smith,Primary,Active,02/01/2024,,02/02/2024\n"
+    ",7,1,Nobody,Primary,Active,,,\n"
+)
+
+
+def test_columnar_table_round_trips_rows() -> None:
+    rows = [
+        {"key": "A-1", "number": 1, "flag": True, "ratio": 1.0},
+        {"key": "A-2", "number": 1, "flag": None, "ratio": None},
+        {"key": "A-1", "number": 2},
+    ]
+    table = ColumnarTable.from_rows(rows)
+
+    assert len(table) == 3
+    assert table.column_names == ("key", "number", "flag", "ratio")
+    # Values that compare equal across types keep their own type.
+    assert [type(row["flag"]) for row in table] == [bool, type(None), type(None)]
+    assert type(table[0]["ratio"]) is float
+    assert table.to_rows() == [
+        rows[0],
+        rows[1],
+        {"key": "A-1", "number": 2, "flag": None, "ratio": None},
+    ]
+    assert table.column("key").tolist() == ["A-1", "A-2", "A-1"]
+    assert table.distinct("key") == {"A-1", "A-2"}
+
+
+def test_take_and_concat_keep_rows_columnar() -> None:
+    first = ColumnarTable.from_rows([{"key": "A-1", "v": "x"}, {"key": "A-2", "v": "y"}])
+    second = ColumnarTable.from_rows([{"key": "S-1", "extra": 3}])
+
+    subset = first.take([1])
+    assert isinstance(subset, ColumnarTable)
+    assert subset.to_rows() == [{"key": "A-2", "v": "y"}]
+    assert subset.distinct("key") == {"A-2"}
+
+    combined = ColumnarTable.concat([first, second])
+    assert combined.to_rows() == [
+        {"key": "A-1", "v": "x", "extra": None},
+        {"key": "A-2", "v": "y", "extra": None},
+        {"key": "S-1", "v": None, "extra": 3},
+    ]
+
+
+def test_json_lines_match_json_dumps() -> None:
+    rows = [
+        {"b": "café \"quoted\"", "a": 1, "c": None},
+        {"b": "plain", "a": 2.5, "c": False},
+    ]
+    table = ColumnarTable.from_rows(rows)
+    assert list(table.json_lines()) == [json.dumps(row, sort_keys=True) for row in rows]
+
+
+def test_parser_columnar_output_matches_dicts(tmp_path) -> None:
+    path = tmp_path / "BILLSPON.TXT"
+    path.write_text(BILLSPON, encoding="utf-8")
+
+    rows, row_issues = parse_bill_sponsors(path)
+    table, table_issues = parse_bill_sponsors(path, columnar=True)
+
+    assert isinstance(table, ColumnarTable)
+    assert table.to_rows() == rows
+    assert table_issues == row_issues
+
+
+def test_validation_merge_and_snapshot_accept_tables(tmp_path) -> None:
+    bills = [
+        {"bill_key": "A-1", "bill_type": "A", "bill_number": 1},
+        {"bill_key": "A-2", "bill_type": "Q", "bill_number": 2},
+    ]
+    sponsors = [
+        {"bill_sponsor_key": "A-1-1", "bill_key": "A-1", "mod_date": "2024-01-01"},
+        {"bill_sponsor_key": "A-1-1", "bill_key": "A-1", "mod_date": "2024-03-01"},
+        {"bill_sponsor_key": "A-2-1", "bill_key": "A-2", "mod_date": "2024-01-01"},
+    ]
+    bills_table = ColumnarTable.from_rows(bills)
+    sponsors_table = ColumnarTable.from_rows(sponsors)
+
+    bills_result = validate_bills(bills_table)
+    assert isinstance(bills_result.valid_rows, ColumnarTable)
+    assert bills_result.valid_rows.to_rows() == validate_bills(bills).valid_rows
+
+    merged = merge_rows_by_key(sponsors_table, "bill_sponsor_key", ["mod_date"])
+    assert isinstance(merged, ColumnarTable)
+    assert merged.to_rows() == merge_rows_by_key(sponsors, "bill_sponsor_key", ["mod_date"])
+
+    sponsors_result = validate_bill_sponsors(merged, bills_result.valid_rows)
+    assert sponsors_result.valid_rows.to_rows() == [sponsors[1]]
+    assert [issue.issue for issue in sponsors_result.issues] == ["unknown_bill_key"]
+
+    table_path = write_snapshot("bill_sponsors", sponsors_table, tmp_path / "columnar")
+    list_path = write_snapshot("bill_sponsors", sponsors, tmp_path / "rows")
+    assert table_path.read_bytes() == list_path.read_bytes()
+
+
+def test_upsert_batches_columnar_tables(monkeypatch) -> None:
+    table = ColumnarTable.from_rows({"key": f"K-{i}"} for i in range(5))
+    batches = []
+    monkeypatch.setattr(SupabaseClient, "_post_batch", lambda self, name, batch: batches.append(batch))
+
+    SupabaseClient("https://example.test", "key").upsert("bills", table, batch_size=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[-1] == [{"key": "K-4"}]
@@ -12,6 +12,8 @@ def test_load_config_defaults() -> None:
         assert cfg.supabase_url == "https://zgtevahaudnjpocptzgj.supabase.co"
         assert cfg.supabase_service_key == ""
         assert cfg.supabase_db_url == ""
+        # Tables are parsed in the main process unless a pool is asked for.
+        assert cfg.parse_max_workers == 1
 
 
 def test_load_config_env_vars() -> None:
@@ -1,6 +1,20 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from pathlib import Path
-from backend.parsers.utils import parse_csv_robust
+from backend.parsers.billspon import _sponsor_record
+from backend.parsers.mainbill import parse_mainbill
+from backend.parsers.utils import (
+    PROCESS_POOL_CONTEXT,
+    CsvRowStream,
+    _RecordParser,
+    iter_csv_robust,
+    parse_csv_robust,
+    parse_date,
+    parse_dates,
+)
 
 def test_parse_csv_robust_splits(tmp_path):
     # Create a CSV with split rows
@@ -17,10 +31,7 @@ def test_parse_csv_robust_splits(tmp_path):
     file_path = tmp_path / "broken.csv"
     file_path.write_text(csv_content, encoding="utf-8")
 
-    # Markers include "S," and "A,"
-    markers = ["S,", "A,"]
-
-    result = parse_csv_robust(file_path, encoding="utf-8", row_start_markers=markers)
+    result = parse_csv_robust(file_path, encoding="utf-8", reassemble=True)
 
     # Should result in 3 rows, not 4
     assert len(result.rows) == 3
@@ -45,8 +56,258 @@ def test_parse_csv_robust_no_split(tmp_path):
     file_path = tmp_path / "clean.csv"
     file_path.write_text(csv_content, encoding="utf-8")
 
-    markers = ["S,", "A,"]
-    result = parse_csv_robust(file_path, encoding="utf-8", row_start_markers=markers)
+    result = parse_csv_robust(file_path, encoding="utf-8")
 
     assert len(result.rows) == 2
     assert not any("Reconstructed" in str(i.get("error", "")) for i in result.issues)
+
+class CountingSource:
+    """Path-like source that records how many physical lines have been read."""
+
+    def __init__(self, text):
+        self.lines = text.splitlines(keepends=True)
+        self.read = 0
+
+    def exists(self):
+        return True
+
+    def open(self, *args, **kwargs):
+        source = self
+
+        class Handle:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def __iter__(self):
+                for line in source.lines:
+                    source.read += 1
+                    yield line
+
+        return Handle()
+
+
+def test_iter_csv_robust_yields_rows_as_lines_are_read():
+    source = CountingSource(
+        "BillType,BillNumber,Synopsis\n"
+        "S,100,Normal Bill\n"
+        "S,123,This is a synopsis\n"
+        "that was split.\n"
+        "A,200\n"
+        "A,300,Last Bill\n"
+    )
+    stream = iter_csv_robust(source, reassemble=True)
+    rows = iter(stream)
+
+    assert next(rows) == (2, {"BillType": "S", "BillNumber": "100", "Synopsis": "Normal Bill"})
+    # The first record is only known to be complete once the next one starts.
+    assert source.read == 3
+
+    assert [line_num for line_num, _ in rows] == [3, 5]
+    assert [issue["line_num"] for issue in stream.issues] == [4, 0]
+    assert stream.issues[1]["raw"] == "Reconstructed 1 split records"
+
+
+def test_parse_csv_robust_reassembles_quoted_fields_across_lines(tmp_path):
+    csv_content = (
+        '"BillType","BillNumber","Synopsis","ModDate"\n'
+        '"A  ",4,"Reforms municipal responsibilities\n'
+        'A, B and C; appropriates ""$16 million"".",6/20/2024 0:00:00\n'
+        '"S  ",101,"Single line",4/4/2024 0:00:00\n'
+    )
+    file_path = tmp_path / "MAINBILL.TXT"
+    file_path.write_text(csv_content, encoding="utf-8")
+
+    result = parse_csv_robust(file_path, encoding="utf-8", reassemble=True)
+
+    assert [row["BillType"] for row in result.rows] == ["A  ", "S  "]
+    assert result.rows[0]["Synopsis"] == (
+        'Reforms municipal responsibilities A, B and C; appropriates "$16 million".'
+    )
+    assert result.rows[0]["ModDate"] == "6/20/2024 0:00:00"
+    assert [issue["raw"] for issue in result.issues] == ["Reconstructed 1 split records"]
+
+
+@pytest.mark.parametrize("reassemble", [False, True])
+def test_literal_quote_inside_a_field_does_not_open_a_quoted_field(tmp_path, reassemble):
+    file_path = tmp_path / "stray.csv"
+    file_path.write_text('A,B,C\n1,the 5" pipe,x\n2,b,c\n3,b,c\n4,b,c\n', encoding="utf-8")
+
+    result = parse_csv_robust(file_path, encoding="utf-8", reassemble=reassemble)
+
+    assert [row["A"] for row in result.rows] == ["1", "2", "3", "4"]
+    assert result.rows[0]["B"] == 'the 5" pipe'
+    assert result.issues == []
+
+
+def test_split_records_are_only_reassembled_on_request(tmp_path):
+    file_path = tmp_path / "broken.csv"
+    file_path.write_text("A,B,C\n1,b,start\nof c\n2,b,c\n", encoding="utf-8")
+
+    result = parse_csv_robust(file_path, encoding="utf-8")
+
+    assert [row["A"] for row in result.rows] == ["1", "2"]
+    assert [issue["line_num"] for issue in result.issues] == [3]
+
+
+@pytest.mark.parametrize(
+    "tail, reconstructed",
+    [
+        # Closed records: every run is parsed by a worker.
+        ('S,7,"Quoted, with a comma"\n', 28),
+        # A literal quote inside an unquoted field opens nothing.
+        ('S,7,the 5" pipe\n', 28),
+        # A quoted field opened after a literal quote runs into the next line, so
+        # parsing falls back to this process from that run on.
+        ('S,7,x"y,"open\n', 29),
+    ],
+)
+def test_chunked_parse_matches_single_process(tmp_path, tail, reconstructed):
+    body = "".join(
+        f'A,{n},"Synopsis {n} split\nover two lines"\nshort,{n}\n' if n % 3 == 0 else f"A,{n},Plain {n}\n"
+        for n in range(40)
+    )
+    file_path = tmp_path / "chunked.csv"
+    file_path.write_text("BillType,BillNumber,Synopsis\n" + body + tail + body, encoding="utf-8")
+
+    def parse(**options):
+        stream = CsvRowStream(file_path, encoding="utf-8", **options)
+        return list(stream), stream.issues
+
+    rows, issues = parse(reassemble=True)
+    assert parse(reassemble=True, max_workers=2, chunk_lines=5) == (rows, issues)
+    assert any(issue["line_num"] > 40 for issue in issues)
+    assert issues[-1]["raw"] == f"Reconstructed {reconstructed} split records"
+
+
+def _write_billspon(path, rows):
+    lines = ["BillType,BillNumber,Sequence,Sponsor,Type,Status,SponDate,WithDate,ModDate\n"]
+    for n in range(rows):
+        sponsor = f'"Smith, Jo {n % 7}"' if n % 5 else "Smith"
+        bill_type = "" if n % 97 == 0 else "A"
+        lines.append(f"{bill_type},{n // 3 + 1},{n % 3 + 1},{sponsor},Primary,,1/{n % 28 + 1}/2024,,\n")
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_rows_converted_in_workers_match_single_process(tmp_path, columnar):
+    first, second = tmp_path / "2024.TXT", tmp_path / "2022.TXT"
+    _write_billspon(first, 300)
+    _write_billspon(second, 120)
+
+    def convert(path, **options):
+        stream = CsvRowStream(path, encoding="utf-8", chunk_lines=40, **options)
+        records, issues = stream.convert_rows(_sponsor_record, columnar)
+        return list(records), issues, stream.issues
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=PROCESS_POOL_CONTEXT) as executor:
+        # One pool serves every file it is handed.
+        for path in (first, second):
+            expected = convert(path)
+            assert convert(path, max_workers=2, executor=executor) == expected
+    assert len(expected[0]) == 118
+    assert [issue["issue"] for issue in expected[1]] == ["missing_key_fields"] * 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs at least two CPUs")
+def test_mainbill_parses_faster_on_two_workers(tmp_path):
+    header = (
+        "BillType,BillNumber,CurrentStatus,LDOA,IntroDate,ActualBillNumber,FirstPrime,"
+        "Synopsis,ProposedDate,Abstract,ModDate\n"
+    )
+    rows = (
+        f'"A  ",{n},"APP",3/20/2024 0:00:00,1/9/2024 0:00:00,"A{n}","Lopez, Yvonne ",'
+        f'"Reforms municipal responsibilities concerning provision of housing {n}.",'
+        f'11/17/2023 0:00:00,"Housing, affordable",4/4/2024 0:00:00\n'
+        for n in range(1, 150_001)
+    )
+    path = tmp_path / "MAINBILL.TXT"
+    path.write_text(header + "".join(rows), encoding="latin1")
+
+    start = time.perf_counter()
+    serial = parse_mainbill(path)
+    serial_seconds = time.perf_counter() - start
+    with ProcessPoolExecutor(max_workers=2, mp_context=PROCESS_POOL_CONTEXT) as executor:
+        # Start the workers before timing; a sync pays for that once, not per file.
+        list(executor.map(abs, range(2)))
+        start = time.perf_counter()
+        parallel = parse_mainbill(path, max_workers=2, executor=executor)
+        parallel_seconds = time.perf_counter() - start
+
+    assert parallel == serial
+    assert parallel_seconds < serial_seconds
+
+
+def _marker_records(lines):
+    # The bill-type marker scan the quote-aware assembler replaced.
+    markers = ["S", "A", "SR", "AR", "SCR", "ACR", "SJR", "AJR"]
+    lines = iter(lines)
+    yield next(lines).strip()
+    parts = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if parts and any(stripped.startswith(marker) for marker in markers):
+            yield " ".join(parts)
+            parts = []
+        parts.append(stripped)
+    if parts:
+        yield " ".join(parts)
+
+
+def _best_of(runs, count_records):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        count = sum(1 for _ in count_records())
+        timings.append(time.perf_counter() - start)
+    return min(timings), count
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("continuation_lines", [8, 40])
+def test_record_assembly_is_linear_and_beats_the_marker_scan(continuation_lines):
+    header = ",".join(f'"Column{n}"' for n in range(27)) + "\n"
+    record = (
+        ['"A  ",{n},"APP",3/20/2024 0:00:00,"A{n}","D",2024,,"Lopez, Yvonne ","Reforms\n']
+        + [f'provision of ""affordable"" housing, line {j}\n' for j in range(continuation_lines)]
+        + ['and more.",,"A257",' + ",".join(["x"] * 17) + "\n"]
+    )
+    lines = [header]
+    n = 0
+    while len(lines) < 40_000:
+        n += 1
+        lines.extend(line.replace("{n}", str(n)) for line in record)
+
+    assembled, records = _best_of(3, lambda: _RecordParser(True)._records(iter(lines)))
+    baseline, _ = _best_of(3, lambda: _marker_records(lines))
+
+    assert records == n + 1
+    assert assembled < baseline
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("3/20/2024 0:00:00", "2024-03-20"),
+        (" 1/9/2024 ", "2024-01-09"),
+        ("01/09/2024 23:59:59", "2024-01-09"),
+        ("2/30/2024 0:00:00", None),
+        ("1/1/2024 24:00:00", None),
+        ("2024-01-01", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date_matches_strptime_formats(value, expected):
+    assert parse_date(value) == expected
+
+
+def test_parse_dates_converts_a_column():
+    column = ["3/20/2024 0:00:00", None, "3/20/2024 0:00:00", "bad"]
+
+    assert parse_dates(column) == ["2024-03-20", None, "2024-03-20", None]
@@ -0,0 +1,45 @@
+import json
+from unittest import mock
+
+from backend.arcgis import LayerFeatures
+from backend.parsers.districts import parse_districts
+from backend.pipeline import _write_district_topology
+
+
+def _features(coordinates):
+    yield {
+        "properties": {"DISTRICT": 7, "NAME": "District 7"},
+        "geometry": {"type": "Polygon", "coordinates": coordinates},
+    }
+
+
+def test_parse_districts_keeps_generalized_geometry_side_by_side():
+    full = [[[0, 0], [1, 0], [1, 0.5], [1, 1], [0, 0]]]
+    generalized = [[[0, 0], [1, 0], [1, 1], [0, 0]]]
+
+    records, issues = parse_districts(_features(full), _features(generalized))
+
+    assert issues == []
+    assert json.loads(records[0]["geometry_json"])["coordinates"] == full
+    assert json.loads(records[0]["geometry_generalized_json"])["coordinates"] == generalized
+
+
+def test_parse_districts_without_generalized_collection():
+    records, _ = parse_districts(_features([[[0, 0], [1, 0], [1, 1], [0, 0]]]))
+
+    assert "geometry_generalized_json" not in records[0]
+
+
+def test_topology_is_built_from_the_full_resolution_layer(tmp_path):
+    full = [[[0, 0], [1, 0], [1, 0.5], [1, 1], [0, 0]]]
+    generalized = [[[0, 0], [1, 0], [1, 1], [0, 0]]]
+    districts, _ = parse_districts(_features(generalized))
+    layer = LayerFeatures(features=list(_features(full)), unchanged=False, metadata={})
+    config = mock.Mock(data_dir=tmp_path, district_topology_zooms=(6,))
+
+    with mock.patch("backend.pipeline.write_topology_artifacts") as write:
+        _write_district_topology(config, districts, layer)
+
+    (geometry,), properties, _, _ = write.call_args.args
+    assert len(geometry.geoms[0].exterior.coords) == len(full[0])
+    assert properties == [{"district_key": "7", "district_number": 7, "name": "District 7"}]
@@ -1,26 +1,54 @@
-import urllib.request
-from pathlib import Path
+import gc
+import io
+import threading
+import time
 from unittest import mock
-from backend.downloader import download_file, download_files, resolve_download_url
 
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
 
-class FakeResponse:
+from backend import http_client
+
+from backend.downloader import (
+    DownloadJob,
+    download_file,
+    download_files,
+    download_many,
+    resolve_download_url,
+    stream_url_chunks,
+)
+from backend.http_cache import HttpCache
+
+
+class FakeBody(io.BytesIO):
     def __init__(self, data):
-        self.data = data
+        super().__init__(data)
+        self.read_sizes = []
+
+    def read(self, size=-1):
+        self.read_sizes.append(size)
+        return super().read(size)
+
 
-    def read(self):
-        return self.data
+class BrokenBody(FakeBody):
+    def read(self, size=-1):
+        if self.read_sizes:
+            raise ConnectionResetError("connection dropped")
+        return super().read(size)
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+def make_response(data=b"", status=200, headers=None, body_cls=FakeBody):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.raw = body_cls(data)
+    return response
 
 
-@mock.patch("urllib.request.urlopen")
-def test_download_file(mock_urlopen, tmp_path):
-    mock_urlopen.return_value = FakeResponse(b"file content")
+@mock.patch("backend.http_client.get_session")
+def test_download_file(mock_get_session, tmp_path):
+    mock_get_session.return_value.get.return_value = make_response(b"file content")
 
     url = "http://example.com/test.txt"
     destination = tmp_path
@@ -30,14 +58,42 @@ def test_download_file(mock_urlopen, tmp_path):
     assert result_path == destination / "test.txt"
     assert result_path.exists()
     assert result_path.read_bytes() == b"file content"
-    mock_urlopen.assert_called_once_with(url)
+    mock_get_session.return_value.get.assert_called_once_with(
+        url, headers={}, stream=True, timeout=http_client.get_settings().timeout
+    )
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_file_reads_in_chunks(mock_get_session, tmp_path):
+    response = make_response(b"x" * 10)
+    mock_get_session.return_value.get.return_value = response
+
+    result_path = download_file("http://example.com/big.zip", tmp_path, chunk_size=4)
+
+    assert result_path.read_bytes() == b"x" * 10
+    assert response.raw.read_sizes == [4, 4, 4, 4]
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_file_interrupted_keeps_previous_file(mock_get_session, tmp_path):
+    existing = tmp_path / "MAINBILL.TXT"
+    existing.write_bytes(b"previous")
+    mock_get_session.return_value.get.return_value = make_response(
+        b"partial content", body_cls=BrokenBody
+    )
+
+    with pytest.raises(ConnectionResetError):
+        download_file("http://example.com/MAINBILL.TXT", tmp_path, chunk_size=4)
+
+    assert existing.read_bytes() == b"previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["MAINBILL.TXT"]
 
 
 @mock.patch("backend.downloader.fetch_index_html")
-@mock.patch("urllib.request.urlopen")
-def test_download_files(mock_urlopen, mock_fetch_index, tmp_path):
+@mock.patch("backend.http_client.get_session")
+def test_download_files(mock_get_session, mock_fetch_index, tmp_path):
     mock_fetch_index.return_value = '<html><a href="file1.txt">file1.txt</a></html>'
-    mock_urlopen.return_value = FakeResponse(b"content")
+    mock_get_session.return_value.get.return_value = make_response(b"content")
 
     base_url = "http://example.com"
     filenames = ["file1.txt"]
@@ -51,6 +107,16 @@ def test_download_files(mock_urlopen, mock_fetch_index, tmp_path):
     assert results[0].read_bytes() == b"content"
 
 
+@mock.patch("backend.http_client.get_session")
+def test_download_file_http_error(mock_get_session, tmp_path):
+    mock_get_session.return_value.get.return_value = make_response(status=404)
+
+    with pytest.raises(requests.HTTPError):
+        download_file("http://example.com/missing.txt", tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_resolve_download_url():
     index_html = '<html><a href="subdir/file.txt">link</a></html>'
     base_url = "http://example.com"
@@ -60,3 +126,109 @@ def test_resolve_download_url():
 
     url = resolve_download_url(base_url, index_html, "other.txt")
     assert url == "http://example.com/other.txt"
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_file_revalidates_with_cache(mock_get_session, tmp_path):
+    cache = HttpCache(tmp_path / "http_cache")
+    url = "http://example.com/MAINBILL.TXT"
+    session = mock_get_session.return_value
+    session.get.return_value = make_response(b"bills", headers={"ETag": '"v1"'})
+
+    download_file(url, tmp_path / "day1", cache=cache)
+
+    session.get.return_value = make_response(status=304)
+    result_path = download_file(url, tmp_path / "day2", cache=cache)
+
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert result_path.read_bytes() == b"bills"
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_file_skips_cache_without_validators(mock_get_session, tmp_path):
+    cache = HttpCache(tmp_path / "http_cache")
+    url = "http://example.com/ROSTER.TXT"
+    mock_get_session.return_value.get.return_value = make_response(b"roster")
+
+    download_file(url, tmp_path, cache=cache)
+
+    assert cache.lookup(url) is None
+    assert cache.conditional_headers(url) == {}
+
+
+def test_download_many_respects_per_host_limit(tmp_path):
+    lock = threading.Lock()
+    active = {"a.example.com": 0, "b.example.com": 0}
+    peak = {"a.example.com": 0, "b.example.com": 0}
+
+    def fake_save(url, target_path, chunk_size, cache):
+        host = url.split("/")[2]
+        with lock:
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+        time.sleep(0.01)
+        target_path.write_bytes(url.encode())
+        with lock:
+            active[host] -= 1
+
+    jobs = [
+        DownloadJob(url=f"http://{host}/{i}.txt", target_path=tmp_path / host / f"{i}.txt")
+        for host in ("a.example.com", "b.example.com")
+        for i in range(6)
+    ]
+    with mock.patch("backend.downloader._save_url_to_path", side_effect=fake_save):
+        results = download_many(jobs, max_workers=8, per_host_limit=2)
+
+    assert results == [job.target_path for job in jobs]
+    assert peak["a.example.com"] <= 2
+    assert peak["b.example.com"] <= 2
+
+
+def test_download_many_optional_job_missing(tmp_path):
+    def fake_save(url, target_path, chunk_size, cache):
+        if url.endswith("Readme.txt"):
+            raise requests.HTTPError("404 Client Error: Not Found")
+        target_path.write_bytes(b"data")
+
+    jobs = [
+        DownloadJob(url="http://example.com/MAINBILL.TXT", target_path=tmp_path / "MAINBILL.TXT"),
+        DownloadJob(url="http://example.com/Readme.txt", target_path=tmp_path / "Readme.txt", optional=True),
+    ]
+    with mock.patch("backend.downloader._save_url_to_path", side_effect=fake_save):
+        results = download_many(jobs)
+
+    assert results == [tmp_path / "MAINBILL.TXT", None]
+
+
+@mock.patch("backend.http_client.get_session")
+def test_stream_url_chunks_caches_streamed_body(mock_get_session, tmp_path):
+    cache = HttpCache(tmp_path / "cache")
+    url = "http://example.com/layer/query"
+    mock_get_session.return_value.get.side_effect = [
+        make_response(b'{"features": []}', headers={"ETag": '"v1"'}),
+        make_response(status=304),
+    ]
+
+    first = b"".join(stream_url_chunks(url, cache, chunk_size=4))
+    second = b"".join(stream_url_chunks(url, cache, chunk_size=4))
+
+    assert first == second == b'{"features": []}'
+    assert cache.read_bytes(url) == first
+    assert list((tmp_path / "cache").glob("*.part")) == []
+
+
+def test_configure_keeps_session_in_use_open_until_released():
+    session = http_client.get_session()
+    pools = session.get_adapter("https://example.com").poolmanager.pools
+    session.get_adapter("https://example.com").poolmanager.connection_from_url("https://example.com")
+    try:
+        http_client.configure(http_client.HttpSettings(pool_maxsize=4))
+
+        # A download_many worker may still be reading through the old session.
+        assert len(pools) == 1
+        assert http_client.get_session() is not session
+        del session
+        gc.collect()
+        assert len(pools) == 0
+    finally:
+        http_client.configure(http_client.HttpSettings())
@@ -0,0 +1,26 @@
+import pytest
+
+from backend.fs import atomic_writer, write_atomic
+
+
+def test_write_atomic_replaces_the_target(tmp_path):
+    target = tmp_path / "state.json"
+    target.write_bytes(b"old")
+
+    write_atomic(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_atomic_writer_keeps_the_previous_file_when_writing_fails(tmp_path):
+    target = tmp_path / "features.ndjson"
+    target.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_writer(target) as f:
+            f.write(b"partial")
+            raise RuntimeError("fetch failed")
+
+    assert target.read_bytes() == b"old"
+    assert [path.name for path in tmp_path.iterdir()] == ["features.ndjson"]
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from backend.json_stream import JsonArrayStream, JsonStreamError, iter_json_array
+
+
+def byte_chunks(document, size=1):
+    data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+def test_streams_array_member_across_tiny_chunks():
+    document = {
+        "type": "FeatureCollection",
+        "transform": {"scale": [0.5, 0.5]},
+        "features": [{"id": index, "name": "Ocean Cty – Toms River", "area": 12345.678} for index in range(5)],
+        "exceededTransferLimit": False,
+    }
+    stream = JsonArrayStream(byte_chunks(document), "features")
+
+    seen = []
+    for feature in stream:
+        # Members that precede the array are available while it is iterated.
+        assert stream.members["transform"] == {"scale": [0.5, 0.5]}
+        seen.append(feature)
+
+    assert seen == document["features"]
+    assert stream.members == {
+        "type": "FeatureCollection",
+        "transform": {"scale": [0.5, 0.5]},
+        "exceededTransferLimit": False,
+    }
+
+
+def test_numbers_split_across_chunks_decode_whole():
+    assert list(iter_json_array([b"[12", b"34, 5", b".25, 1e", b"3]"])) == [1234, 5.25, 1000.0]
+
+
+def test_yields_before_document_is_complete():
+    def chunks():
+        yield b'{"features": [{"id": 1}, '
+        raise AssertionError("read past the first feature")
+
+    assert next(iter_json_array(chunks(), "features")) == {"id": 1}
+
+
+def test_missing_array_yields_nothing():
+    stream = JsonArrayStream([b'{"error": {"code": 400}}'], "features")
+
+    assert list(stream) == []
+    assert stream.members == {"error": {"code": 400}}
+
+
+@pytest.mark.parametrize("payload", [b'{"features": [1, 2', b"[1, 2] 3", b'{"not": "a list"}'])
+def test_malformed_documents_raise(payload):
+    with pytest.raises(JsonStreamError):
+        list(iter_json_array([payload]))
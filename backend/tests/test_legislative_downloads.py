@@ -4,30 +4,30 @@ import zipfile
 from unittest import mock
 
 import pytest
+import requests
 
 from backend import legislative_downloads
 from backend.legislative_downloads import (
     LegislativeDownloadError,
     download_bill_tracking_session,
+    extract_members,
+    fetch_bill_tracking_archive,
+    fetch_bill_tracking_archives,
     fetch_download_path,
     list_download_entries,
+    open_archive_members,
+    record_archive_uploaded,
     select_session_directory,
     select_text_zip,
 )
+from backend.parsers.utils import parse_csv_robust
 
 
-class FakeResponse:
-    def __init__(self, payload: bytes):
-        self._payload = payload
-
-    def read(self) -> bytes:
-        return self._payload
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
+def make_response(payload: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(payload)
+    return response
 
 
 def _json_bytes(value) -> bytes:
@@ -71,11 +71,12 @@ def test_download_bill_tracking_session_extracts_files(tmp_path):
 
     response_queue = [*api_responses, zip_bytes]
 
-    def fake_urlopen(_):
+    def fake_get(url, **kwargs):
         payload = response_queue.pop(0)
-        return FakeResponse(payload)
+        return make_response(payload)
 
-    with mock.patch("urllib.request.urlopen", side_effect=fake_urlopen) as urlopen_mock:
+    with mock.patch("backend.http_client.get_session") as get_session_mock:
+        get_session_mock.return_value.get.side_effect = fake_get
         extracted = download_bill_tracking_session(
             base_url="https://www.njleg.state.nj.us",
             pub_base_url="https://pub.njleg.state.nj.us",
@@ -93,7 +94,7 @@ def test_download_bill_tracking_session_extracts_files(tmp_path):
     assert (tmp_path / "MAINBILL.TXT").exists()
     assert (tmp_path / "ROSTER.TXT").exists()
     assert len(extracted) == 4
-    assert urlopen_mock.call_count == 4
+    assert get_session_mock.return_value.get.call_count == 4
 
 
 def test_fetch_download_path_rejects_non_list() -> None:
@@ -195,11 +196,12 @@ def test_download_bill_tracking_session_missing_required_file(tmp_path) -> None:
 
     response_queue = [*api_responses, zip_bytes]
 
-    def fake_urlopen(_):
+    def fake_get(url, **kwargs):
         payload = response_queue.pop(0)
-        return FakeResponse(payload)
+        return make_response(payload)
 
-    with mock.patch("urllib.request.urlopen", side_effect=fake_urlopen):
+    with mock.patch("backend.http_client.get_session") as get_session_mock:
+        get_session_mock.return_value.get.side_effect = fake_get
         with pytest.raises(LegislativeDownloadError, match="Missing required files"):
             download_bill_tracking_session(
                 base_url="https://www.njleg.state.nj.us",
@@ -238,3 +240,159 @@ def test_list_download_entries_urls() -> None:
         "https://www.njleg.state.nj.us/api/downloads/|leg-databases/"
         "pub.njleg.state.nj.us/Bill_Tracking"
     )
+
+
+def _write_zip(path, members: dict[str, str]) -> None:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, text in members.items():
+            archive.writestr(name, text)
+
+
+def test_open_archive_members_reads_without_extracting(tmp_path) -> None:
+    zip_path = tmp_path / "DB2024_TEXT.zip"
+    _write_zip(
+        zip_path,
+        {
+            "ROSTER.TXT": "Roster Key,LastName\n1,Smith\n",
+            "UNUSED.TXT": "ignored\n",
+        },
+    )
+
+    members = open_archive_members(zip_path, ["ROSTER.TXT"])
+    result = parse_csv_robust(members["ROSTER.TXT"])
+
+    assert result.rows == [{"Roster Key": "1", "LastName": "Smith"}]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["DB2024_TEXT.zip"]
+
+
+def test_extract_members_only_writes_required(tmp_path) -> None:
+    zip_path = tmp_path / "DB2024_TEXT.zip"
+    _write_zip(zip_path, {"MAINBILL.TXT": "header\n", "UNUSED.TXT": "ignored\n"})
+
+    members = open_archive_members(zip_path, ["MAINBILL.TXT"])
+    extracted = extract_members(members.values(), tmp_path / "out")
+
+    assert extracted == [tmp_path / "out" / "MAINBILL.TXT"]
+    assert extracted[0].read_text() == "header\n"
+    assert not (tmp_path / "out" / "UNUSED.TXT").exists()
+
+
+def test_fetch_bill_tracking_archive_skips_unchanged_entry(tmp_path) -> None:
+    listing = [
+        _json_bytes([{"Download_Path": "/leg-databases"}]),
+        _json_bytes(
+            [
+                {
+                    "FileName": "2024data",
+                    "Type": "D",
+                    "DateModified": "",
+                    "Ext": "",
+                    "DownloadType": "Bill_Tracking",
+                }
+            ]
+        ),
+        _json_bytes(
+            [
+                {
+                    "FileName": "DB2024_TEXT.zip",
+                    "Type": "F",
+                    "DateModified": "2024-03-20T04:00:00",
+                    "Ext": ".zip",
+                    "DownloadType": "Bill_Tracking",
+                }
+            ]
+        ),
+    ]
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as archive:
+        archive.writestr("MAINBILL.TXT", "header\n")
+    response_queue = [*listing, zip_buffer.getvalue(), *listing, *listing]
+
+    def fake_get(url, **kwargs):
+        return make_response(response_queue.pop(0))
+
+    kwargs = dict(
+        base_url="https://www.njleg.state.nj.us",
+        pub_base_url="https://pub.njleg.state.nj.us",
+        download_type="Bill_Tracking",
+        session_year=2024,
+        destination=tmp_path,
+    )
+    with mock.patch("backend.http_client.get_session") as get_session_mock:
+        get_session_mock.return_value.get.side_effect = fake_get
+        first = fetch_bill_tracking_archive(**kwargs)
+        # Downloaded but never uploaded: the archive is reused, not reported unchanged.
+        second = fetch_bill_tracking_archive(**kwargs)
+        record_archive_uploaded(second)
+        third = fetch_bill_tracking_archive(**kwargs)
+
+    assert not first.unchanged
+    assert not second.unchanged
+    assert third.unchanged
+    assert third.sha256 == second.sha256 == first.sha256
+    assert get_session_mock.return_value.get.call_count == 10
+    assert response_queue == []
+
+
+def test_fetch_bill_tracking_archives_shares_root_listing(tmp_path) -> None:
+    def session_zip(year: int) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("MAINBILL.TXT", f"header\n{year}\n")
+        return buffer.getvalue()
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/api/downloads/bills/Bill_Tracking"):
+            return make_response(_json_bytes([{"Download_Path": "/leg-databases"}]))
+        if url.endswith(".zip"):
+            return make_response(session_zip(int(url.rsplit("DB", 1)[1][:4])))
+        for year in (2022, 2024):
+            if f"|{year}data/" in url:
+                return make_response(
+                    _json_bytes(
+                        [
+                            {
+                                "FileName": f"DB{year}_TEXT.zip",
+                                "Type": "F",
+                                "DateModified": "",
+                                "Ext": ".zip",
+                                "DownloadType": "Bill_Tracking",
+                            }
+                        ]
+                    )
+                )
+        return make_response(
+            _json_bytes(
+                [
+                    {
+                        "FileName": f"{year}data",
+                        "Type": "D",
+                        "DateModified": "",
+                        "Ext": "",
+                        "DownloadType": "Bill_Tracking",
+                    }
+                    for year in (2022, 2024)
+                ]
+            )
+        )
+
+    with mock.patch("backend.http_client.get_session") as get_session_mock:
+        get_session_mock.return_value.get.side_effect = fake_get
+        archives = fetch_bill_tracking_archives(
+            base_url="https://www.njleg.state.nj.us",
+            pub_base_url="https://pub.njleg.state.nj.us",
+            download_type="Bill_Tracking",
+            session_years=(2024, 2022),
+            destination_root=tmp_path,
+        )
+
+    assert sorted(archives) == [2022, 2024]
+    assert archives[2022].path == tmp_path / "2022" / "DB2022_TEXT.zip"
+    members = open_archive_members(archives[2022].path, ["MAINBILL.TXT"])
+    assert members["MAINBILL.TXT"].read_text() == "header\n2022\n"
+    urls = [call.args[0] for call in get_session_mock.return_value.get.call_args_list]
+    root_listing_url = (
+        "https://www.njleg.state.nj.us/api/downloads/|leg-databases/"
+        "pub.njleg.state.nj.us/Bill_Tracking"
+    )
+    assert urls.count(root_listing_url) == 1
@@ -0,0 +1,66 @@
+from unittest import mock
+
+from backend.columnar import ColumnarTable
+from backend.pipeline import SESSION_TABLES, _parse_tables
+
+
+BILLSPON = (
+    "BillType,BillNumber,Sequence,Sponsor,Type,Status,SponDate,WithDate,ModDate\n"
+    "A,1,1,Smith,Primary,Active,01/10/2024,,01/12/2024\n"
+    "S,5,x,Smith,Primary,Active,02/01/2024,,02/02/2024\n"
+)
+ROSTER = (
+    "Roster Key,Party,LegislativeDistrict,Title,LegislativeTitle,FirstName,LastName,Sex,Address,City,State,Zipcode,LegislativeStatus,House\n"
+    "1,D,1,Mr.,Senator,Ann,Lee,F,1 Main St,Trenton,NJ,08601,Active,S\n"
+)
+
+
+def _config(parse_max_workers: int, columnar_parse: bool = False) -> mock.Mock:
+    return mock.Mock(
+        parse_max_workers=parse_max_workers,
+        columnar_parse=columnar_parse,
+        csv_parse_workers=1,
+    )
+
+
+def _sources(tmp_path):
+    (tmp_path / "BILLSPON.TXT").write_text(BILLSPON, encoding="latin1")
+    (tmp_path / "ROSTER.TXT").write_text(ROSTER, encoding="latin1")
+    # Tables missing from the session parse to nothing, as with an empty archive.
+    return {2024: {filename: tmp_path / filename for _, filename, _ in SESSION_TABLES}}
+
+
+def _vote_files(tmp_path):
+    paths = []
+    for name, voter in (("A2024.TXT", "Smith"), ("S2024.TXT", "Jones")):
+        path = tmp_path / name
+        path.write_text(f"Legislator,Vote,Date\n{voter},Y,1/1/2024\n", encoding="latin1")
+        paths.append(path)
+    return paths
+
+
+def test_pooled_parse_matches_in_process_parse(tmp_path) -> None:
+    sources = _sources(tmp_path)
+    vote_files = _vote_files(tmp_path)
+
+    in_process = _parse_tables(_config(1), sources, vote_files)
+    pooled = _parse_tables(_config(2), sources, vote_files)
+
+    assert set(pooled) == {table for table, _, _ in SESSION_TABLES} | {"vote_records"}
+    assert pooled == in_process
+    bill_sponsors, bill_sponsor_issues = pooled["bill_sponsors"]
+    assert [row["bill_sponsor_key"] for row in bill_sponsors] == ["A-1-1"]
+    assert [issue["issue"] for issue in bill_sponsor_issues] == ["invalid_numeric_field"]
+    assert [row["source_file"] for row in pooled["vote_records"][0]] == ["A2024.TXT", "S2024.TXT"]
+
+
+def test_pooled_parse_returns_columnar_tables(tmp_path) -> None:
+    sources = _sources(tmp_path)
+
+    parsed = _parse_tables(_config(2, columnar_parse=True), sources, [])
+
+    legislators, _ = parsed["legislators"]
+    assert isinstance(legislators, ColumnarTable)
+    assert len(legislators) == 1
+    assert legislators.to_rows() == _parse_tables(_config(1), sources, [])["legislators"][0]
+    assert parsed["vote_records"] == ([], [])
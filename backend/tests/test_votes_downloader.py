@@ -0,0 +1,156 @@
+import hashlib
+import io
+from unittest import mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from backend.http_cache import HttpCache
+from backend.votes_downloader import (
+    MANIFEST_FILENAME,
+    download_votes,
+    extract_vote_filenames,
+    load_vote_manifest,
+)
+
+
+BASE_URL = "https://example.com/votes"
+README_URL = f"{BASE_URL}/_Readme.txt"
+
+README = """Vote files
+A2022.TXT   12/01/2023  Assembly votes 2022-2023
+S2024.TXT   10/01/2026  Senate votes 2024-2025
+"""
+
+
+def make_response(data=b"", status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.raw = io.BytesIO(data)
+    return response
+
+
+def fake_server(files, calls):
+    def fake_get(url, headers=None, **kwargs):
+        name = url.rsplit("/", 1)[-1]
+        calls.append((name, dict(headers or {})))
+        body, etag = files[name]
+        if headers and headers.get("If-None-Match") == etag:
+            return make_response(status=304, headers={"ETag": etag})
+        return make_response(body, headers={"ETag": etag})
+
+    return fake_get
+
+
+def test_extract_vote_filenames():
+    assert extract_vote_filenames(README) == ["A2022.TXT", "S2024.TXT"]
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_votes_fetches_only_new_or_active_files(mock_get_session, tmp_path):
+    files = {
+        "_Readme.txt": (README.encode(), '"r1"'),
+        "A2022.TXT": (b"old votes", '"a1"'),
+        "S2024.TXT": (b"new votes", '"s1"'),
+    }
+    calls = []
+    mock_get_session.return_value.get.side_effect = fake_server(files, calls)
+    cache = HttpCache(tmp_path / "cache")
+    destination = tmp_path / "votes"
+
+    paths = download_votes(
+        BASE_URL, [README_URL], destination, cache=cache, frozen_before_year=2024
+    )
+
+    assert paths == [destination / "A2022.TXT", destination / "S2024.TXT"]
+    assert (destination / "A2022.TXT").read_bytes() == b"old votes"
+    manifest = load_vote_manifest(destination / MANIFEST_FILENAME)
+    assert manifest["A2022.TXT"].size == len(b"old votes")
+    assert manifest["S2024.TXT"].etag == '"s1"'
+
+    calls.clear()
+    paths = download_votes(
+        BASE_URL, [README_URL], destination, cache=cache, frozen_before_year=2024
+    )
+
+    requested = {name: headers for name, headers in calls}
+    assert set(requested) == {"_Readme.txt", "S2024.TXT"}
+    assert requested["S2024.TXT"]["If-None-Match"] == '"s1"'
+    assert (destination / "S2024.TXT").read_bytes() == b"new votes"
+    assert len(paths) == 2
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_votes_refetches_historical_file_when_listing_changes(
+    mock_get_session, tmp_path
+):
+    files = {
+        "_Readme.txt": (README.encode(), '"r1"'),
+        "A2022.TXT": (b"old votes", '"a1"'),
+        "S2024.TXT": (b"new votes", '"s1"'),
+    }
+    calls = []
+    mock_get_session.return_value.get.side_effect = fake_server(files, calls)
+    destination = tmp_path / "votes"
+    download_votes(BASE_URL, [README_URL], destination, frozen_before_year=2024)
+
+    files["_Readme.txt"] = (
+        README.replace("12/01/2023", "03/01/2024").encode(),
+        '"r2"',
+    )
+    files["A2022.TXT"] = (b"corrected votes", '"a2"')
+    calls.clear()
+    download_votes(BASE_URL, [README_URL], destination, frozen_before_year=2024)
+
+    assert [name for name, _ in calls].count("A2022.TXT") == 1
+    assert (destination / "A2022.TXT").read_bytes() == b"corrected votes"
+    manifest = load_vote_manifest(destination / MANIFEST_FILENAME)
+    assert manifest["A2022.TXT"].size == len(b"corrected votes")
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_votes_refetches_historical_file_that_fails_its_digest(
+    mock_get_session, tmp_path
+):
+    files = {
+        "_Readme.txt": (README.encode(), '"r1"'),
+        "A2022.TXT": (b"old votes", '"a1"'),
+        "S2024.TXT": (b"new votes", '"s1"'),
+    }
+    calls = []
+    mock_get_session.return_value.get.side_effect = fake_server(files, calls)
+    destination = tmp_path / "votes"
+    download_votes(BASE_URL, [README_URL], destination, frozen_before_year=2024)
+
+    # Same size as the mirrored copy, different bytes.
+    (destination / "A2022.TXT").write_bytes(b"old vote!")
+    calls.clear()
+    download_votes(BASE_URL, [README_URL], destination, frozen_before_year=2024)
+
+    assert [name for name, _ in calls].count("A2022.TXT") == 1
+    assert (destination / "A2022.TXT").read_bytes() == b"old votes"
+
+
+@mock.patch("backend.http_client.get_session")
+def test_download_votes_distrusts_304_replaying_a_damaged_cache(mock_get_session, tmp_path):
+    files = {
+        "_Readme.txt": (README.encode(), '"r1"'),
+        "A2022.TXT": (b"old votes", '"a1"'),
+        "S2024.TXT": (b"new votes", '"s1"'),
+    }
+    calls = []
+    mock_get_session.return_value.get.side_effect = fake_server(files, calls)
+    cache = HttpCache(tmp_path / "cache")
+    destination = tmp_path / "votes"
+    download_votes(BASE_URL, [README_URL], destination, cache=cache)
+    cache.lookup(f"{BASE_URL}/S2024.TXT").body_path.write_bytes(b"truncated")
+
+    calls.clear()
+    download_votes(BASE_URL, [README_URL], destination, cache=cache)
+
+    requests_for_s2024 = [headers for name, headers in calls if name == "S2024.TXT"]
+    assert requests_for_s2024 == [{"If-None-Match": '"s1"'}, {}]
+    assert (destination / "S2024.TXT").read_bytes() == b"new votes"
+    manifest = load_vote_manifest(destination / MANIFEST_FILENAME)
+    assert manifest["S2024.TXT"].sha256 == hashlib.sha256(b"new votes").hexdigest()
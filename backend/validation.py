@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Iterable, Sequence
+from typing import Iterable
 
+from backend.columnar import Records, field_values, select_rows
 from backend.session_filter import SessionWindow, filter_rows_by_date
 
 
@@ -30,7 +31,7 @@ class ValidationIssue:
 
 @dataclass(frozen=True)
 class ValidationResult:
-    valid_rows: list[dict]
+    valid_rows: Records
     issues: list[ValidationIssue]
 
 
@@ -40,12 +41,12 @@ VALID_HOUSES = {"Senate", "Assembly", "S", "A"}
 
 def filter_to_recent_sessions(
     *,
-    bills: list[dict],
-    bill_sponsors: list[dict],
-    committee_members: list[dict],
+    bills: Records,
+    bill_sponsors: Records,
+    committee_members: Records,
     vote_records: list[dict],
     session_window: SessionWindow,
-) -> tuple[list[dict], list[dict], list[dict], list[dict]]:
+) -> tuple[Records, Records, Records, list[dict]]:
     bills_filtered = filter_rows_by_date(
         bills,
         ["mod_date", "intro_date", "proposed_date", "ldoa"],
@@ -70,10 +71,10 @@ def filter_to_recent_sessions(
     )
 
 
-def validate_bills(bills: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_bills(bills: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for bill in bills:
+    for position, bill in enumerate(bills):
         bill_key = bill.get("bill_key")
         bill_type = bill.get("bill_type")
         bill_number = bill.get("bill_number")
@@ -121,14 +122,14 @@ def validate_bills(bills: list[dict]) -> ValidationResult:
                 )
             )
             continue
-        valid.append(bill)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(bills, valid), issues=issues)
 
 
-def validate_legislators(legislators: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_legislators(legislators: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for legislator in legislators:
+    for position, legislator in enumerate(legislators):
         roster_key = legislator.get("roster_key")
         if roster_key is None:
             issues.append(
@@ -163,15 +164,15 @@ def validate_legislators(legislators: list[dict]) -> ValidationResult:
             )
              continue
 
-        valid.append(legislator)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(legislators, valid), issues=issues)
 
 
-def validate_bill_sponsors(bill_sponsors: list[dict], bills: Sequence[dict]) -> ValidationResult:
-    bill_keys = {bill.get("bill_key") for bill in bills if bill.get("bill_key")}
-    valid: list[dict] = []
+def validate_bill_sponsors(bill_sponsors: Records, bills: Records) -> ValidationResult:
+    bill_keys = field_values(bills, "bill_key")
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for sponsor in bill_sponsors:
+    for position, sponsor in enumerate(bill_sponsors):
         sponsor_key = sponsor.get("bill_sponsor_key")
         bill_key = sponsor.get("bill_key")
         if not sponsor_key or not bill_key:
@@ -193,14 +194,14 @@ def validate_bill_sponsors(bill_sponsors: list[dict], bills: Sequence[dict]) ->
                 )
             )
             continue
-        valid.append(sponsor)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(bill_sponsors, valid), issues=issues)
 
 
-def validate_committee_members(committee_members: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_committee_members(committee_members: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for member in committee_members:
+    for position, member in enumerate(committee_members):
         key = member.get("committee_member_key")
         if not key:
             issues.append(
@@ -220,14 +221,14 @@ def validate_committee_members(committee_members: list[dict]) -> ValidationResul
                 )
             )
             continue
-        valid.append(member)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(committee_members, valid), issues=issues)
 
 
-def validate_vote_records(vote_records: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_vote_records(vote_records: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for record in vote_records:
+    for position, record in enumerate(vote_records):
         key = record.get("vote_record_key")
         data = record.get("data")
         if not key or not data:
@@ -239,14 +240,14 @@ def validate_vote_records(vote_records: list[dict]) -> ValidationResult:
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(vote_records, valid), issues=issues)
 
 
-def validate_districts(districts: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_districts(districts: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for district in districts:
+    for position, district in enumerate(districts):
         key = district.get("district_key")
         if not key:
             issues.append(
@@ -266,16 +267,16 @@ def validate_districts(districts: list[dict]) -> ValidationResult:
                 )
             )
             continue
-        valid.append(district)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(districts, valid), issues=issues)
 
 
-def validate_bill_history(bill_history: list[dict], bills: Sequence[dict] | None = None) -> ValidationResult:
-    valid: list[dict] = []
+def validate_bill_history(bill_history: Records, bills: Records | None = None) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    bill_keys = {bill.get("bill_key") for bill in bills} if bills else None
+    bill_keys = field_values(bills, "bill_key") if bills else None
 
-    for record in bill_history:
+    for position, record in enumerate(bill_history):
         key = record.get("bill_history_key")
         bill_key = record.get("bill_key")
         if not key or not bill_key:
@@ -298,16 +299,16 @@ def validate_bill_history(bill_history: list[dict], bills: Sequence[dict] | None
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(bill_history, valid), issues=issues)
 
 
-def validate_bill_subjects(bill_subjects: list[dict], bills: Sequence[dict] | None = None) -> ValidationResult:
-    valid: list[dict] = []
+def validate_bill_subjects(bill_subjects: Records, bills: Records | None = None) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    bill_keys = {bill.get("bill_key") for bill in bills} if bills else None
+    bill_keys = field_values(bills, "bill_key") if bills else None
 
-    for record in bill_subjects:
+    for position, record in enumerate(bill_subjects):
         key = record.get("bill_subject_key")
         bill_key = record.get("bill_key")
         if not key or not bill_key:
@@ -329,16 +330,16 @@ def validate_bill_subjects(bill_subjects: list[dict], bills: Sequence[dict] | No
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(bill_subjects, valid), issues=issues)
 
 
-def validate_bill_documents(bill_documents: list[dict], bills: Sequence[dict] | None = None) -> ValidationResult:
-    valid: list[dict] = []
+def validate_bill_documents(bill_documents: Records, bills: Records | None = None) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    bill_keys = {bill.get("bill_key") for bill in bills} if bills else None
+    bill_keys = field_values(bills, "bill_key") if bills else None
 
-    for record in bill_documents:
+    for position, record in enumerate(bill_documents):
         key = record.get("bill_document_key")
         bill_key = record.get("bill_key")
         if not key or not bill_key:
@@ -360,14 +361,14 @@ def validate_bill_documents(bill_documents: list[dict], bills: Sequence[dict] |
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(bill_documents, valid), issues=issues)
 
 
-def validate_committees(committees: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_committees(committees: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for record in committees:
+    for position, record in enumerate(committees):
         key = record.get("committee_code")
         if not key:
             issues.append(
@@ -378,14 +379,14 @@ def validate_committees(committees: list[dict]) -> ValidationResult:
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(committees, valid), issues=issues)
 
 
-def validate_agendas(agendas: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_agendas(agendas: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for record in agendas:
+    for position, record in enumerate(agendas):
         key = record.get("agenda_key")
         if not key:
             issues.append(
@@ -396,17 +397,17 @@ def validate_agendas(agendas: list[dict]) -> ValidationResult:
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(agendas, valid), issues=issues)
 
 
-def validate_agenda_bills(agenda_bills: list[dict], agendas: Sequence[dict] | None = None, bills: Sequence[dict] | None = None) -> ValidationResult:
-    valid: list[dict] = []
+def validate_agenda_bills(agenda_bills: Records, agendas: Records | None = None, bills: Records | None = None) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    agenda_keys = {a.get("agenda_key") for a in agendas} if agendas else None
-    bill_keys = {b.get("bill_key") for b in bills} if bills else None
+    agenda_keys = field_values(agendas, "agenda_key") if agendas else None
+    bill_keys = field_values(bills, "bill_key") if bills else None
 
-    for record in agenda_bills:
+    for position, record in enumerate(agenda_bills):
         key = record.get("agenda_bill_key")
         agenda_key = record.get("agenda_key")
         bill_key = record.get("bill_key")
@@ -440,16 +441,16 @@ def validate_agenda_bills(agenda_bills: list[dict], agendas: Sequence[dict] | No
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(agenda_bills, valid), issues=issues)
 
 
-def validate_agenda_nominees(agenda_nominees: list[dict], agendas: Sequence[dict] | None = None) -> ValidationResult:
-    valid: list[dict] = []
+def validate_agenda_nominees(agenda_nominees: Records, agendas: Records | None = None) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    agenda_keys = {a.get("agenda_key") for a in agendas} if agendas else None
+    agenda_keys = field_values(agendas, "agenda_key") if agendas else None
 
-    for record in agenda_nominees:
+    for position, record in enumerate(agenda_nominees):
         key = record.get("agenda_nominee_key")
         agenda_key = record.get("agenda_key")
         if not key or not agenda_key:
@@ -471,16 +472,16 @@ def validate_agenda_nominees(agenda_nominees: list[dict], agendas: Sequence[dict
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(agenda_nominees, valid), issues=issues)
 
 
-def validate_legislator_bios(legislator_bios: list[dict], legislators: Sequence[dict] | None = None) -> ValidationResult:
-    valid: list[dict] = []
+def validate_legislator_bios(legislator_bios: Records, legislators: Records | None = None) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    roster_keys = {l.get("roster_key") for l in legislators} if legislators else None
+    roster_keys = field_values(legislators, "roster_key") if legislators else None
 
-    for record in legislator_bios:
+    for position, record in enumerate(legislator_bios):
         key = record.get("roster_key")
         if not key:
             issues.append(
@@ -501,14 +502,14 @@ def validate_legislator_bios(legislator_bios: list[dict], legislators: Sequence[
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(legislator_bios, valid), issues=issues)
 
 
-def validate_subject_headings(subject_headings: list[dict]) -> ValidationResult:
-    valid: list[dict] = []
+def validate_subject_headings(subject_headings: Records) -> ValidationResult:
+    valid: list[int] = []
     issues: list[ValidationIssue] = []
-    for record in subject_headings:
+    for position, record in enumerate(subject_headings):
         key = record.get("subject_code")
         if not key:
             issues.append(
@@ -519,8 +520,8 @@ def validate_subject_headings(subject_headings: list[dict]) -> ValidationResult:
                 )
             )
             continue
-        valid.append(record)
-    return ValidationResult(valid_rows=valid, issues=issues)
+        valid.append(position)
+    return ValidationResult(valid_rows=select_rows(subject_headings, valid), issues=issues)
 
 
 def _dates_in_order(row: dict, start_field: str, end_field: str) -> bool:
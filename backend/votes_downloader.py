@@ -1,26 +1,203 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import urllib.parse
+from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 
-from backend.downloader import download_file
+from backend.downloader import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PER_HOST_LIMIT,
+    DownloadJob,
+    download_file,
+    download_many,
+)
+from backend.http_cache import HttpCache
+
+
+MANIFEST_FILENAME = "manifest.json"
+
+_VOTE_FILE_PATTERN = re.compile(r"([A-Za-z0-9_\-]+\.(?:TXT|CSV))", re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r"(?:19|20)\d{2}")
+
+
+@dataclass(frozen=True)
+class VoteFileRecord:
+    name: str
+    size: int
+    sha256: str
+    etag: str | None
+    last_modified: str | None
+    listing: str
 
 
 def extract_vote_filenames(readme_text: str) -> list[str]:
-    pattern = re.compile(r"([A-Za-z0-9_\\-]+\\.(?:TXT|CSV))", re.IGNORECASE)
-    return sorted(set(match.group(1) for match in pattern.finditer(readme_text)))
+    return sorted(extract_vote_listings(readme_text))
+
+
+def extract_vote_listings(readme_text: str) -> dict[str, str]:
+    """Maps each vote file named in a readme to the readme line that lists it."""
+    listings: dict[str, str] = {}
+    for line in readme_text.splitlines():
+        for match in _VOTE_FILE_PATTERN.finditer(line):
+            listings.setdefault(match.group(1), " ".join(line.split()))
+    return listings
+
+
+def load_vote_manifest(path: Path) -> dict[str, VoteFileRecord]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return {name: VoteFileRecord(**record) for name, record in payload.items()}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def write_vote_manifest(path: Path, records: dict[str, VoteFileRecord]) -> None:
+    payload = {name: asdict(record) for name, record in sorted(records.items())}
+    path.write_text(json.dumps(payload, sort_keys=True, indent=2), encoding="utf-8")
+
+
+def _is_historical(filename: str, frozen_before_year: int | None) -> bool:
+    if frozen_before_year is None:
+        return False
+    match = _YEAR_PATTERN.search(filename)
+    return match is not None and int(match.group(0)) < frozen_before_year
 
 
-def download_votes(base_url: str, readme_urls: Iterable[str], destination: Path) -> list[Path]:
+def _file_sha256(path: Path, chunk_size: int) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(partial(f.read, chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_intact(path: Path, record: VoteFileRecord, chunk_size: int) -> bool:
+    """True when path still holds the bytes the manifest recorded for it."""
+    return (
+        path.exists()
+        and path.stat().st_size == record.size
+        and _file_sha256(path, chunk_size) == record.sha256
+    )
+
+
+def _replayed_wrong_body(previous: VoteFileRecord | None, current: VoteFileRecord) -> bool:
+    """
+    True when the server reported the file unchanged (same validators as the
+    manifest) yet the body put in place differs from the one the manifest hashed,
+    i.e. the cached copy a 304 replays has been damaged.
+    """
+    return (
+        previous is not None
+        and (current.etag or current.last_modified) is not None
+        and (previous.etag, previous.last_modified) == (current.etag, current.last_modified)
+        and previous.sha256 != current.sha256
+    )
+
+
+def _record_for(
+    path: Path,
+    url: str,
+    listing: str,
+    chunk_size: int,
+    cache: HttpCache | None,
+) -> VoteFileRecord:
+    entry = cache.lookup(url) if cache is not None else None
+    return VoteFileRecord(
+        name=path.name,
+        size=path.stat().st_size,
+        sha256=_file_sha256(path, chunk_size),
+        etag=entry.etag if entry else None,
+        last_modified=entry.last_modified if entry else None,
+        listing=listing,
+    )
+
+
+def download_votes(
+    base_url: str,
+    readme_urls: Iterable[str],
+    destination: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: HttpCache | None = None,
+    *,
+    frozen_before_year: int | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+) -> list[Path]:
+    """
+    Syncs the vote files listed in the readmes into destination.
+
+    A manifest of fetched files (size, sha256, validators and readme line) is kept in
+    destination. Files for sessions before frozen_before_year whose readme line is
+    unchanged and whose local copy still matches the recorded size and sha256 are
+    not requested again; every other listed file is fetched (conditionally, when
+    cache is given) in parallel. A 304 whose cached body no longer hashes to the
+    manifest's sha256 is not trusted: the cache entry is dropped and the file is
+    fetched again in full.
+    """
     destination.mkdir(parents=True, exist_ok=True)
-    files: list[Path] = []
+    manifest_path = destination / MANIFEST_FILENAME
+    manifest = load_vote_manifest(manifest_path)
+
+    listings: dict[str, str] = {}
     for readme_url in readme_urls:
-        readme_path = download_file(readme_url, destination)
+        readme_path = download_file(readme_url, destination, chunk_size, cache)
         readme_text = readme_path.read_text(encoding="latin1", errors="ignore")
-        filenames = extract_vote_filenames(readme_text)
-        for filename in filenames:
-            file_url = f"{base_url.rstrip('/')}/{urllib.parse.quote(filename)}"
-            files.append(download_file(file_url, destination))
-    return files
+        for filename, listing in extract_vote_listings(readme_text).items():
+            listings.setdefault(filename, listing)
+
+    jobs: list[DownloadJob] = []
+    for filename, listing in sorted(listings.items()):
+        target_path = destination / filename
+        record = manifest.get(filename)
+        if (
+            record is not None
+            and record.listing == listing
+            and _is_historical(filename, frozen_before_year)
+            and _is_intact(target_path, record, chunk_size)
+        ):
+            continue
+        file_url = f"{base_url.rstrip('/')}/{urllib.parse.quote(filename)}"
+        jobs.append(DownloadJob(url=file_url, target_path=target_path))
+
+    download_many(
+        jobs,
+        chunk_size,
+        cache,
+        max_workers=max_workers,
+        per_host_limit=per_host_limit,
+    )
+    records = {
+        job.target_path.name: _record_for(
+            job.target_path, job.url, listings[job.target_path.name], chunk_size, cache
+        )
+        for job in jobs
+    }
+    refetch = [
+        job
+        for job in jobs
+        if _replayed_wrong_body(manifest.get(job.target_path.name), records[job.target_path.name])
+    ]
+    if refetch and cache is not None:
+        for job in refetch:
+            cache.forget(job.url)
+        download_many(
+            refetch,
+            chunk_size,
+            cache,
+            max_workers=max_workers,
+            per_host_limit=per_host_limit,
+        )
+        for job in refetch:
+            filename = job.target_path.name
+            records[filename] = _record_for(
+                job.target_path, job.url, listings[filename], chunk_size, cache
+            )
+    manifest.update(records)
+    write_vote_manifest(manifest_path, manifest)
+    return [destination / filename for filename in sorted(listings)]